@@ -4,11 +4,18 @@ FastAPI 엔트리 포인트
 import sys
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
 from src.api import router
+from src.api.middleware import JSONCharsetMiddleware, RequestIdMiddleware
+from src.api.responses import FastJSONResponse
 from src.config import settings
+from src.services.export_service import shutdown_executor
+from src.services.smtp_pool import close_smtp_pool
+from src.services.mail_queue import get_mail_queue
+from src.services.sheets_service import close_sheets_writers
+from src.services.ledger_service import start_replication, stop_replication
 from src.utils.logger import logger
+from src.utils.warmup import start_warmup
 
 # UTF-8 인코딩 설정
 if sys.platform == "win32":
@@ -24,25 +31,28 @@ app = FastAPI(
     title=settings.API_TITLE,
     version=settings.API_VERSION,
     description="견적서 자동 생성 및 발송 API",
-    default_response_class=JSONResponse
+    default_response_class=FastJSONResponse
 )
 
-# JSONResponse에 UTF-8 인코딩 명시
-@app.middleware("http")
-async def add_charset_header(request, call_next):
-    response = await call_next(request)
-    if isinstance(response, JSONResponse):
-        response.headers["Content-Type"] = "application/json; charset=utf-8"
-    return response
+# 미들웨어는 모두 순수 ASGI로 유지: BaseHTTPMiddleware(@app.middleware("http"))는
+# http.disconnect를 가로채 POST /quote의 연결 종료 감지(단계 중단)가 동작하지 않음
+# (tests/test_quote_disconnect.py)
 
-# CORS 설정
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# JSON 응답에 UTF-8 인코딩 명시 (순수 ASGI, 응답 본문은 그대로 전달)
+app.add_middleware(JSONCharsetMiddleware)
+
+# CORS 설정 (CORS_ALLOW_ORIGINS가 비어 있으면 사용 안 함)
+if settings.CORS_ALLOW_ORIGINS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ALLOW_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+# 요청 ID 및 요청 로그 (가장 바깥쪽 미들웨어)
+app.add_middleware(RequestIdMiddleware)
 
 # 라우터 등록
 app.include_router(router)
@@ -53,18 +63,31 @@ async def startup_event():
     """서버 시작 시 실행"""
     logger.info(f"{settings.API_TITLE} v{settings.API_VERSION} 시작")
     logger.info(f"서버 주소: http://{settings.API_HOST}:{settings.API_PORT}")
+    get_mail_queue().start()
+    start_replication()
+    if settings.WARMUP_ON_STARTUP:
+        start_warmup()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """서버 종료 시 실행"""
+    get_mail_queue().stop()
+    stop_replication()
+    close_sheets_writers()
+    shutdown_executor()
+    close_smtp_pool()
     logger.info("서버 종료")
 
 
 if __name__ == "__main__":
     import uvicorn
+    # API_WORKERS > 1이면 워커 프로세스마다 앱을 불러옴 (preload는 gunicorn.conf.py 사용)
     uvicorn.run(
-        app,
+        "app:app" if settings.API_WORKERS > 1 else app,
         host=settings.API_HOST,
-        port=settings.API_PORT
+        port=settings.API_PORT,
+        workers=settings.API_WORKERS if settings.API_WORKERS > 1 else None,
+        # 요청 로그는 RequestIdMiddleware가 로그 큐로 기록
+        access_log=False
     )
@@ -0,0 +1,133 @@
+"""
+견적서 이력/통계 조회 벤치마크 (대용량 원장)
+
+--rows건의 견적서를 원장에 기록한 뒤(같은 --db가 있으면 재사용) GET /quotes와
+통계 API가 사용하는 HistoryService 질의의 호출당 시간을 측정합니다.
+
+- 목록: 첫 페이지, 커서 다음 페이지, 고객/기간/총액 필터, 흔한/드문 키워드
+- 통계: 일별(1년), 고객별(전체/30일), 키워드별(흔한/드문/복수 단어)
+
+결과는 benchmarks/results/bench_history/<git sha>.json에 저장됩니다.
+
+실행:
+    python -m benchmarks.bench_history --rows 200000
+    python -m benchmarks.results bench_history <이전 sha>
+"""
+import argparse
+import copy
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict
+
+from benchmarks.fakes import SAMPLE_QUOTE
+from benchmarks.results import save_results
+
+# 요약/범위 문장 재료 (흔한 단어와 드문 단어가 섞이도록 가중치 차이)
+COMMON_WORDS = ["홈페이지", "쇼핑몰", "관리자", "로그인", "결제", "반응형", "디자인", "API"]
+RARE_WORDS = ["블록체인", "ERP", "키오스크", "메타버스", "음성인식", "IoT", "AR", "마이그레이션"]
+DAYS = 730
+
+
+def _quote(rng: random.Random) -> dict:
+    """무작위 요약/범위/금액의 견적서"""
+    quote = copy.deepcopy(SAMPLE_QUOTE)
+    words = rng.sample(COMMON_WORDS, 3)
+    if rng.random() < 0.02:
+        words.append(rng.choice(RARE_WORDS))
+    quote["project_summary"] = " ".join(words[:2]) + " 구축"
+    quote["scope"] = [f"{word} 개발" for word in words]
+    subtotal = rng.randrange(1_000_000, 50_000_000, 10_000)
+    quote["pricing"] = {"subtotal": subtotal, "vat": subtotal // 10, "total": subtotal + subtotal // 10}
+    return quote
+
+
+def build_ledger(path: str, rows: int, seed: int = 42):
+    """원장 생성 (이미 rows건 이상이면 재사용)"""
+    from src.services.ledger_service import QuoteLedger
+    
+    ledger = QuoteLedger(path)
+    conn = ledger.connection()
+    existing = conn.execute("SELECT count(*) FROM quotes").fetchone()[0]
+    if existing >= rows:
+        return ledger
+    
+    rng = random.Random(seed + existing)
+    start = time.time() - DAYS * 86400
+    began = time.perf_counter()
+    for offset in range(existing, rows, 10_000):
+        conn.execute("BEGIN")
+        for i in range(offset, min(offset + 10_000, rows)):
+            client = rng.randrange(5000)
+            ledger.append(
+                f"bench_{i:08d}",
+                f"고객{client}",
+                f"client{client}@example.com",
+                _quote(rng),
+                created_at=start + rng.random() * DAYS * 86400
+            )
+        conn.execute("COMMIT")
+    conn.execute("PRAGMA optimize")
+    print(f"원장 생성: {rows - existing}건, {time.perf_counter() - began:.1f}초")
+    return ledger
+
+
+def _measure(func: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """호출당 시간(ms) 중앙값/최댓값"""
+    func()
+    samples = []
+    for _ in range(repeat):
+        began = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - began) * 1000)
+    return {"median_ms": statistics.median(samples), "max_ms": max(samples)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="견적서 이력/통계 조회 벤치마크")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--db", default=os.path.join(tempfile.gettempdir(), "bench_history.db"))
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--no-save", action="store_true", help="결과 저장 안 함")
+    args = parser.parse_args()
+    
+    from src.services.history_service import HistoryService
+    
+    service = HistoryService(build_ledger(args.db, args.rows))
+    today = date.today()
+    _, cursor = service.list_quotes(limit=20)
+    
+    cases = {
+        "list_first_page": lambda: service.list_quotes(limit=20),
+        "list_next_page": lambda: service.list_quotes(limit=20, cursor=cursor),
+        "list_client": lambda: service.list_quotes(limit=20, client_email="client42@example.com"),
+        "list_last_30_days": lambda: service.list_quotes(limit=20, since=today - timedelta(days=30)),
+        "list_min_total_none": lambda: service.list_quotes(limit=20, min_total=10**12),
+        "list_total_range": lambda: service.list_quotes(limit=20, min_total=20_000_000, max_total=21_000_000),
+        "list_keyword_common": lambda: service.list_quotes(limit=20, keyword="쇼핑"),
+        "list_keyword_rare": lambda: service.list_quotes(limit=20, keyword="블록체인"),
+        "list_keyword_multi": lambda: service.list_quotes(limit=20, keyword="쇼핑 결제"),
+        "stats_daily_year": lambda: service.daily_stats(since=today - timedelta(days=365)),
+        "stats_clients_all": lambda: service.client_stats(),
+        "stats_clients_30_days": lambda: service.client_stats(since=today - timedelta(days=30)),
+        "stats_keyword_common": lambda: service.keyword_stats("쇼핑"),
+        "stats_keyword_rare_year": lambda: service.keyword_stats("블록체인", since=today - timedelta(days=365)),
+        "stats_keyword_multi": lambda: service.keyword_stats("쇼핑 결제"),
+    }
+    
+    results = {}
+    print(f"{'case':<26} {'median ms':>10} {'max ms':>10}")
+    for name, func in cases.items():
+        result = _measure(func, args.repeat)
+        results[name] = result
+        print(f"{name:<26} {result['median_ms']:>10.2f} {result['max_ms']:>10.2f}")
+    
+    if not args.no_save:
+        save_results("bench_history", results, {"rows": args.rows, "repeat": args.repeat})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+가벼운 엔드포인트의 요청당 처리 비용 마이크로벤치마크
+
+앱을 네트워크 없이 ASGI 호출로 직접 실행하여 미들웨어 스택, 라우팅, JSON 응답
+직렬화를 포함한 요청당 시간(us)을 측정합니다. 서버/소켓 비용은 포함하지 않으며,
+bare_asgi(고정 응답만 보내는 ASGI 앱)는 측정 방식 자체의 비용입니다.
+
+- root: GET /
+- email_status: GET /quote/{id}/email (발송 상태 폴링)
+- quote_detail: GET /quote/{id} (원장 상세)
+- quote_list: GET /quotes?limit=20 (이력 목록)
+
+실행:
+    python -m benchmarks.bench_http --repeat 7
+    python -m benchmarks.results bench_http <이전 sha>
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import Any, Callable, Dict
+
+from benchmarks.fakes import SAMPLE_QUOTE
+from benchmarks.results import save_results
+
+QUOTE_ID = "20240101_000000_bench"
+
+# 측정 1회당 최소 실행 시간(초)
+MIN_BATCH_SECONDS = 0.2
+
+
+def _scope(path: str, query_string: bytes = b"") -> Dict[str, Any]:
+    """GET 요청 ASGI scope"""
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query_string,
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"accept", b"application/json")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+    }
+
+
+async def _request(app: Callable, scope: Dict[str, Any]) -> int:
+    """요청 한 건 실행 -> 상태 코드"""
+    status = 0
+    received = False
+    
+    async def receive() -> Dict[str, Any]:
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        return {"type": "http.disconnect"}
+    
+    async def send(message: Dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+    
+    await app(dict(scope), receive, send)
+    return status
+
+
+async def _batch(app: Callable, scope: Dict[str, Any], number: int) -> float:
+    """요청 number건을 순서대로 실행한 시간(초)"""
+    started = time.perf_counter()
+    for _ in range(number):
+        await _request(app, scope)
+    return time.perf_counter() - started
+
+
+def _measure(loop: asyncio.AbstractEventLoop, app: Callable, scope: Dict[str, Any], repeat: int) -> Dict[str, float]:
+    """요청당 시간(us) 측정 -> {median_us, min_us, loops}"""
+    number = 1
+    while loop.run_until_complete(_batch(app, scope, number)) < MIN_BATCH_SECONDS:
+        number *= 2
+    samples = [loop.run_until_complete(_batch(app, scope, number)) / number * 1e6 for _ in range(repeat)]
+    return {"median_us": statistics.median(samples), "min_us": min(samples), "loops": number}
+
+
+async def _bare_asgi(scope, receive, send) -> None:
+    """고정 JSON 응답만 보내는 ASGI 앱 (측정 방식의 비용)"""
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="가벼운 엔드포인트 요청당 처리 비용")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--no-save", action="store_true", help="결과 저장 안 함")
+    args = parser.parse_args()
+    
+    # src.config 로드 전에 임시 디렉토리와 로그 수준 설정 (요청 로그 비용 제외)
+    os.environ.update({
+        "OUTPUT_DIR": tempfile.mkdtemp(prefix="http-bench-"),
+        "WARMUP_ON_STARTUP": "false",
+        "LOG_LEVEL": "WARNING",
+    })
+    
+    from app import app
+    from src.services.ledger_service import get_ledger
+    from src.services.mail_queue import get_mail_queue
+    
+    for index in range(50):
+        get_ledger().append(f"{QUOTE_ID}{index}", "홍길동", "client@example.com", SAMPLE_QUOTE)
+    get_ledger().append(QUOTE_ID, "홍길동", "client@example.com", SAMPLE_QUOTE)
+    get_mail_queue().enqueue(QUOTE_ID, "client@example.com", "홍길동", "quote.pdf", "견적서", "본문")
+    
+    cases = {
+        "bare_asgi": (_bare_asgi, _scope("/")),
+        "root": (app, _scope("/")),
+        "email_status": (app, _scope(f"/quote/{QUOTE_ID}/email")),
+        "quote_detail": (app, _scope(f"/quote/{QUOTE_ID}")),
+        "quote_list": (app, _scope("/quotes", b"limit=20")),
+    }
+    
+    loop = asyncio.new_event_loop()
+    for name, (target, scope) in cases.items():
+        status = loop.run_until_complete(_request(target, scope))
+        if status != 200:
+            raise SystemExit(f"{name}: 응답 상태 {status}")
+    
+    results: Dict[str, Dict[str, float]] = {}
+    print(f"{'case':<16} {'median us':>12} {'min us':>12} {'loops':>8}")
+    for name, (target, scope) in cases.items():
+        result = _measure(loop, target, scope, args.repeat)
+        results[name] = {"median_us": result["median_us"], "min_us": result["min_us"]}
+        print(f"{name:<16} {result['median_us']:>12.1f} {result['min_us']:>12.1f} {result['loops']:>8}")
+    loop.close()
+    
+    if not args.no_save:
+        save_results("bench_http", results, {"repeat": args.repeat})
+
+
+if __name__ == "__main__":
+    main()
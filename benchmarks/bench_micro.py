@@ -0,0 +1,115 @@
+"""
+견적 처리 핫스팟 마이크로벤치마크
+
+- QuoteGenerator._extract_json_from_result (코드 블록 / 본문 JSON, Quote 검증 포함)
+- QuoteGenerator._validate_and_adjust_pricing
+- Quote.from_dict / Quote.to_json (원장 기록용 직렬화)
+- PDFService._build_content (flowable 구성)
+- doc.build (레이아웃 + PDF 출력, 메모리 버퍼)
+- 견적서 1건당 메모리 (딕셔너리 vs Quote, tracemalloc)
+
+각 항목을 --repeat회 측정하여 호출당 중앙값/최솟값(us)을 보고하고
+benchmarks/results/bench_micro/<git sha>.json에 저장합니다.
+
+실행:
+    python -m benchmarks.bench_micro --repeat 7
+    python -m benchmarks.results bench_micro <이전 sha>
+"""
+import argparse
+import io
+import json
+import statistics
+import timeit
+import tracemalloc
+from typing import Callable, Dict, Tuple
+
+from benchmarks.fakes import FAKE_PROPOSAL_OUTPUT, SAMPLE_QUOTE
+from benchmarks.results import save_results
+
+
+def _measure(func: Callable[[], object], repeat: int) -> Tuple[Dict[str, float], int]:
+    """호출당 시간(us) 측정 -> ({median_us, min_us}, 측정당 반복 횟수)"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    samples = [t / number * 1e6 for t in timer.repeat(repeat=repeat, number=number)]
+    return {"median_us": statistics.median(samples), "min_us": min(samples)}, number
+
+
+def _bytes_per_item(factory: Callable[[], object], count: int = 1000) -> float:
+    """factory()로 만든 객체 count개를 유지할 때 1개당 할당 바이트"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="견적 처리 마이크로벤치마크")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--no-save", action="store_true", help="결과 저장 안 함")
+    args = parser.parse_args()
+    
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.platypus import SimpleDocTemplate
+    
+    from src.core.quote_generator import QuoteGenerator
+    from src.core.quote_model import Quote
+    from src.services.pdf_service import PDFService
+    
+    generator = QuoteGenerator()
+    pdf_service = PDFService()
+    plain_output = "최종 견적서입니다.\n" + json.dumps(SAMPLE_QUOTE, ensure_ascii=False)
+    quote = Quote.from_dict(SAMPLE_QUOTE)
+    
+    def build_document() -> None:
+        doc = SimpleDocTemplate(
+            io.BytesIO(),
+            pagesize=A4,
+            rightMargin=20*mm,
+            leftMargin=20*mm,
+            topMargin=20*mm,
+            bottomMargin=20*mm
+        )
+        doc.build(pdf_service._build_content(quote, "홍길동"))
+    
+    cases = {
+        "extract_json_fenced": lambda: generator._extract_json_from_result(FAKE_PROPOSAL_OUTPUT),
+        "extract_json_plain": lambda: generator._extract_json_from_result(plain_output),
+        "validate_pricing": lambda: generator._validate_and_adjust_pricing(quote),
+        "quote_from_dict": lambda: Quote.from_dict(SAMPLE_QUOTE),
+        "quote_to_json": quote.to_json,
+        "dict_to_json": lambda: json.dumps(SAMPLE_QUOTE, ensure_ascii=False),
+        "pdf_build_content": lambda: pdf_service._build_content(quote, "홍길동"),
+        "pdf_doc_build": build_document,
+    }
+    
+    # 폰트 등록 등 최초 1회 비용 제외
+    for func in cases.values():
+        func()
+    
+    results = {}
+    print(f"{'case':<22} {'median us':>12} {'min us':>12} {'loops':>8}")
+    for name, func in cases.items():
+        result, loops = _measure(func, args.repeat)
+        results[name] = result
+        print(f"{name:<22} {result['median_us']:>12.1f} {result['min_us']:>12.1f} {loops:>8}")
+    
+    # 같은 내용을 원장에서 읽어 들이는 경우처럼 견적서마다 별도 객체로 생성
+    text = json.dumps(SAMPLE_QUOTE, ensure_ascii=False)
+    results["memory"] = {
+        "dict_bytes": _bytes_per_item(lambda: json.loads(text)),
+        "quote_bytes": _bytes_per_item(lambda: Quote.from_json(text)),
+    }
+    print(f"\n견적서 1건당 메모리: 딕셔너리 {results['memory']['dict_bytes']:.0f} B, "
+          f"Quote {results['memory']['quote_bytes']:.0f} B")
+    
+    if not args.no_save:
+        save_results("bench_micro", results, {"repeat": args.repeat})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""
+POST /quote 부하 테스트
+
+로컬 대역(fake LLM, SMTP sink, fake Google Sheets)으로 앱을 띄우고 지정한
+동시성으로 /quote를 호출하여 처리량과 종단/단계별 p50/p95/p99를 보고합니다.
+메일 발송(smtp)과 Sheets 복제(sheets)는 백그라운드 단계이므로 대기열이 모두
+처리될 때까지 기다린 뒤 집계합니다.
+
+실행:
+    pip install aiosmtpd
+    python -m benchmarks.bench_quote_load --requests 100 --concurrency 8 --llm-latency 0.3
+    python -m benchmarks.bench_quote_load --requests 100 --concurrency 16 --batch-ratio 0.75
+    LLM_CONCURRENCY=4 python -m benchmarks.bench_quote_load --requests 120 --concurrency 16 --llm-capacity 6
+    python -m benchmarks.results bench_quote_load <이전 sha>
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Sequence
+
+from benchmarks.fakes import SMTPSink, install_fake_llm, install_fake_sheets
+from benchmarks.results import save_results
+
+QUOTE_REQUEST = {
+    "client_name": "홍길동",
+    "client_email": "client@example.com",
+    "customer_request": "회사 소개와 공지사항, 문의 관리 기능이 있는 반응형 홈페이지를 만들고 싶습니다.",
+}
+SHEET_ID = "bench"
+
+
+def percentiles(values: Sequence[float]) -> Dict[str, float]:
+    """p50/p95/p99/max (ms, nearest-rank)"""
+    if not values:
+        return {}
+    ordered = sorted(values)
+    
+    def rank(p: float) -> float:
+        index = max(int(round(p / 100 * len(ordered) + 0.5)) - 1, 0)
+        return ordered[min(index, len(ordered) - 1)] * 1000
+    
+    return {"p50_ms": rank(50), "p95_ms": rank(95), "p99_ms": rank(99), "max_ms": ordered[-1] * 1000}
+
+
+class StageRecorder:
+    """단계/Task 히스토그램에 기록되는 원본 값을 수집 (백분위 계산용)"""
+    
+    def __init__(self):
+        self.values: Dict[str, List[float]] = defaultdict(list)
+        self._lock = threading.Lock()
+    
+    def install(self) -> None:
+        from src.utils.metrics import CREW_TASK_SECONDS, STAGE_SECONDS
+        
+        for histogram, label, prefix in ((STAGE_SECONDS, "stage", ""), (CREW_TASK_SECONDS, "task", "crew.")):
+            self._wrap(histogram, label, prefix)
+    
+    def _wrap(self, histogram, label: str, prefix: str) -> None:
+        observe = histogram.observe
+        
+        def recording_observe(value: float, **labels: str) -> None:
+            observe(value, **labels)
+            with self._lock:
+                self.values[prefix + labels[label]].append(value)
+        
+        histogram.observe = recording_observe
+    
+    def reset(self) -> None:
+        with self._lock:
+            self.values.clear()
+
+
+def _configure_environment(workdir: str, args: argparse.Namespace) -> None:
+    """src.config 로드 전에 대역을 가리키도록 환경변수 설정"""
+    os.environ.update({
+        "OUTPUT_DIR": workdir,
+        "OPENAI_API_KEY": "sk-bench",
+        "SMTP_SERVER": "127.0.0.1",
+        "SMTP_PORT": str(args.smtp_port),
+        "SMTP_USE_STARTTLS": "false",
+        "SENDER_EMAIL": "bench@example.com",
+        "SENDER_PASSWORD": "bench",
+        "GOOGLE_SHEET_ID": SHEET_ID,
+        "SHEETS_FLUSH_INTERVAL": "0.5",
+        "MAIL_QUEUE_POLL_INTERVAL": "0.2",
+        "WARMUP_ON_STARTUP": "false",
+        "LOG_LEVEL": "WARNING",
+        # 기본은 CrewAI 경로 측정 (--templates: 표준 요청을 템플릿으로 처리)
+        "QUOTE_TEMPLATES_ENABLED": "true" if args.templates else "false",
+    })
+
+
+def _wait_until(condition, timeout: float) -> bool:
+    """조건이 참이 될 때까지 대기"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.1)
+    return condition()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="POST /quote 부하 테스트")
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--warmup", type=int, default=2, help="집계에서 제외할 사전 요청 수")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Task(에이전트)당 fake LLM 응답 시간(초)")
+    parser.add_argument("--llm-jitter", type=float, default=0.2)
+    parser.add_argument("--llm-capacity", type=int, default=0,
+                        help="fake LLM 제공자의 처리 용량(동시 호출 수, 초과 시 지연, 2배 초과 시 429, 0: 제한 없음)")
+    parser.add_argument("--sheets-latency", type=float, default=0.2, help="fake Sheets API 호출당 응답 시간(초)")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--smtp-port", type=int, default=8025)
+    parser.add_argument("--drain-timeout", type=float, default=60.0)
+    parser.add_argument("--templates", action="store_true", help="요청 유형별 템플릿 사용 (표준 요청은 LLM 생략)")
+    parser.add_argument("--batch-ratio", type=float, default=0.0,
+                        help="X-Quote-Priority: batch로 보낼 요청 비율 (나머지는 interactive)")
+    parser.add_argument("--no-save", action="store_true", help="결과 저장 안 함")
+    args = parser.parse_args()
+    
+    workdir = tempfile.mkdtemp(prefix="quote-bench-")
+    _configure_environment(workdir, args)
+    
+    sink = SMTPSink(port=args.smtp_port)
+    sink.start()
+    
+    import httpx
+    import uvicorn
+    
+    from app import app
+    
+    install_fake_llm(args.llm_latency, args.llm_jitter, args.llm_capacity)
+    worksheet = install_fake_sheets(SHEET_ID, args.sheets_latency)
+    recorder = StageRecorder()
+    recorder.install()
+    
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=args.port, log_level="warning", access_log=False))
+    server_thread = threading.Thread(target=server.run, daemon=True)
+    server_thread.start()
+    if not _wait_until(lambda: server.started, 30):
+        raise SystemExit("서버가 시작되지 않았습니다.")
+    
+    url = f"http://127.0.0.1:{args.port}/quote"
+    latencies: List[float] = []
+    statuses: Dict[str, int] = defaultdict(int)
+    by_priority: Dict[str, List[float]] = defaultdict(list)
+    lock = threading.Lock()
+    remaining = [args.requests]
+    
+    def worker() -> None:
+        with httpx.Client(timeout=300) as client:
+            while True:
+                with lock:
+                    if remaining[0] <= 0:
+                        return
+                    remaining[0] -= 1
+                    index = remaining[0]
+                # 요청마다 내용을 달리하여 중복 요청 제거(QUOTE_DEDUP_TTL)를 피함
+                payload = {**QUOTE_REQUEST, "customer_request": f"{QUOTE_REQUEST['customer_request']} (#{index})"}
+                # batch 요청을 전체 구간에 고르게 섞음
+                priority = "batch" if int((index + 1) * args.batch_ratio) > int(index * args.batch_ratio) else "interactive"
+                started = time.perf_counter()
+                try:
+                    response = client.post(url, json=payload, headers={"X-Quote-Priority": priority})
+                    status = response.json().get("status", "unknown")
+                except Exception as e:
+                    status = type(e).__name__
+                elapsed = time.perf_counter() - started
+                with lock:
+                    latencies.append(elapsed)
+                    by_priority[priority].append(elapsed)
+                    statuses[status] += 1
+    
+    try:
+        with httpx.Client(timeout=300) as client:
+            for i in range(args.warmup):
+                client.post(url, json={**QUOTE_REQUEST, "customer_request": f"warm-up {i}"})
+        _wait_until(lambda: sink.count >= args.warmup, args.drain_timeout)
+        recorder.reset()
+        sent_before, rows_before = sink.count, len(worksheet.rows)
+        
+        print(f"POST /quote x{args.requests} (동시성 {args.concurrency}, fake LLM {args.llm_latency}s/Task)")
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            for _ in range(args.concurrency):
+                executor.submit(worker)
+        elapsed = time.perf_counter() - started
+        
+        succeeded = statuses.get("success", 0)
+        drained = _wait_until(
+            lambda: sink.count - sent_before >= succeeded and len(worksheet.rows) - rows_before >= succeeded,
+            args.drain_timeout
+        )
+        background_elapsed = time.perf_counter() - started
+    finally:
+        server.should_exit = True
+        server_thread.join(30)
+        sink.stop()
+    
+    metrics = {
+        "throughput_rps": args.requests / elapsed,
+        "end_to_end": percentiles(latencies),
+        "stages": {name: percentiles(values) for name, values in sorted(recorder.values.items())},
+    }
+    if args.batch_ratio > 0:
+        metrics["by_priority"] = {name: percentiles(values) for name, values in sorted(by_priority.items())}
+    
+    print(f"\n처리량: {metrics['throughput_rps']:.2f} req/s ({elapsed:.1f}s), 결과: {dict(statuses)}")
+    print(f"메일 {sink.count - sent_before}건, Sheets {len(worksheet.rows) - rows_before}행 "
+          f"(백그라운드 완료까지 {background_elapsed:.1f}s{'' if drained else ', 시간 초과'})")
+    from src.utils.metrics import LLM_RATE_LIMITED, QUOTE_FALLBACKS
+    from src.utils.scheduler import get_scheduler
+    metrics["llm"] = {
+        "final_limit": get_scheduler("llm").capacity,
+        "rate_limited": LLM_RATE_LIMITED.value(),
+        "fallbacks": QUOTE_FALLBACKS.value(reason="error"),
+    }
+    print(f"LLM 동시 실행 수 {metrics['llm']['final_limit']} (종료 시점), 429 {metrics['llm']['rate_limited']:.0f}회, "
+          f"기본 견적서 대체 {metrics['llm']['fallbacks']:.0f}건")
+    print(f"\n{'stage':<16} {'count':>6} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'max ms':>10}")
+    rows = [("end_to_end", latencies)]
+    if args.batch_ratio > 0:
+        rows += [(f"e2e.{name}", values) for name, values in sorted(by_priority.items())]
+    rows += sorted(recorder.values.items())
+    for name, values in rows:
+        result = percentiles(values)
+        print(f"{name:<16} {len(values):>6} {result['p50_ms']:>10.1f} {result['p95_ms']:>10.1f} "
+              f"{result['p99_ms']:>10.1f} {result['max_ms']:>10.1f}")
+    
+    if not args.no_save:
+        save_results("bench_quote_load", metrics, {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "llm_latency": args.llm_latency,
+            "llm_capacity": args.llm_capacity,
+            "sheets_latency": args.sheets_latency,
+            "templates": args.templates,
+            "batch_ratio": args.batch_ratio,
+        })
+
+
+if __name__ == "__main__":
+    main()
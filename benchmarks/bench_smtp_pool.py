@@ -0,0 +1,85 @@
+"""
+SMTP 연결 풀 벤치마크
+
+로컬 aiosmtpd 서버를 띄워 메시지마다 새 연결을 여는 방식과
+SMTPConnectionPool을 사용하는 방식의 처리량을 비교합니다.
+
+실행:
+    pip install aiosmtpd
+    python -m benchmarks.bench_smtp_pool --messages 500 --threads 4
+"""
+import argparse
+import smtplib
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.services.smtp_pool import SMTPConnectionPool
+
+try:
+    from aiosmtpd.controller import Controller
+    AIOSMTPD_AVAILABLE = True
+except ImportError:
+    AIOSMTPD_AVAILABLE = False
+
+MESSAGE = "Subject: bench\r\n\r\n" + ("x" * 76 + "\r\n") * 16
+SENDER = "bench@example.com"
+RECIPIENT = "sink@example.com"
+
+
+class _SinkHandler:
+    """수신 메시지를 버리는 핸들러"""
+    
+    def __init__(self):
+        self.count = 0
+    
+    async def handle_DATA(self, server, session, envelope):
+        self.count += 1
+        return "250 OK"
+
+
+def _send_new_connection(host: str, port: int) -> None:
+    """메시지마다 새 연결 (기존 EmailService 방식)"""
+    server = smtplib.SMTP(host, port)
+    server.sendmail(SENDER, RECIPIENT, MESSAGE)
+    server.quit()
+
+
+def _run(label: str, func, messages: int, threads: int) -> None:
+    """처리량 측정"""
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda _: func(), range(messages)))
+    elapsed = time.perf_counter() - started
+    print(f"{label:<16} {messages / elapsed:10.1f} msg/s  ({elapsed * 1000 / messages:.3f} ms/msg)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SMTP 연결 풀 벤치마크")
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--port", type=int, default=8025)
+    args = parser.parse_args()
+    
+    if not AIOSMTPD_AVAILABLE:
+        raise SystemExit("aiosmtpd가 필요합니다: pip install aiosmtpd")
+    
+    handler = _SinkHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=args.port)
+    controller.start()
+    try:
+        pool = SMTPConnectionPool(
+            "127.0.0.1",
+            args.port,
+            size=args.threads,
+            use_starttls=False
+        )
+        _run("new connection", lambda: _send_new_connection("127.0.0.1", args.port), args.messages, args.threads)
+        _run("pooled", lambda: pool.sendmail(SENDER, RECIPIENT, MESSAGE), args.messages, args.threads)
+        pool.close()
+        print(f"received: {handler.count}")
+    finally:
+        controller.stop()
+
+
+if __name__ == "__main__":
+    main()
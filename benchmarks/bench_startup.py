@@ -0,0 +1,138 @@
+"""
+앱 시작 시간 벤치마크
+
+1) `python -X importtime -c "import app"`을 반복 실행하여 전체 import 시간과
+   모듈별 누적 import 시간을 보고합니다.
+2) (--serve) uvicorn을 띄워 프로세스 시작부터 `GET /`가 처음 응답할 때까지의
+   시간을 측정합니다.
+
+실행:
+    python -m benchmarks.bench_startup --runs 5 --top 20
+    python -m benchmarks.bench_startup --serve --port 8765
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 별도로 보고하는 무거운 의존성
+WATCHED_MODULES = [
+    "fastapi",
+    "crewai",
+    "reportlab.platypus",
+    "src.services.pdf_service",
+    "gspread",
+    "pypdf",
+    "src.api.routes",
+]
+
+
+def _parse_importtime(output: str) -> Dict[str, Tuple[int, int]]:
+    """-X importtime 출력 파싱 -> {모듈: (self us, cumulative us)}"""
+    result: Dict[str, Tuple[int, int]] = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        if name not in result:
+            result[name] = (int(self_us), int(cumulative_us))
+    return result
+
+
+def _measure_import(env: Dict[str, str]) -> Tuple[float, Dict[str, Tuple[int, int]]]:
+    """import app 1회 측정 -> (전체 시간 ms, 모듈별 시간)"""
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        cwd=PROJECT_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return elapsed_ms, _parse_importtime(completed.stderr)
+
+
+def _measure_first_response(env: Dict[str, str], port: int, timeout: float) -> float:
+    """uvicorn 시작부터 GET / 첫 응답까지의 시간(ms)"""
+    url = f"http://127.0.0.1:{port}/"
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=PROJECT_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                with urllib.request.urlopen(url, timeout=0.5) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - started) * 1000
+            except OSError:
+                time.sleep(0.01)
+        raise SystemExit(f"{timeout}초 안에 서버가 응답하지 않았습니다.")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="앱 시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="누적 import 시간 상위 모듈 수")
+    parser.add_argument("--serve", action="store_true", help="GET / 첫 응답 시간도 측정")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+    
+    env = dict(os.environ)
+    
+    # 바이트코드 캐시 생성을 위한 1회 실행
+    _measure_import(env)
+    
+    totals: List[float] = []
+    samples: List[Dict[str, Tuple[int, int]]] = []
+    for _ in range(args.runs):
+        elapsed_ms, modules = _measure_import(env)
+        totals.append(elapsed_ms)
+        samples.append(modules)
+    
+    print(f"import app (process wall)  median {statistics.median(totals):8.1f} ms  "
+          f"min {min(totals):8.1f} ms  ({args.runs} runs)")
+    
+    # 모듈별 누적 시간 중앙값
+    cumulative: Dict[str, float] = {}
+    for name in samples[0]:
+        values = [sample[name][1] for sample in samples if name in sample]
+        cumulative[name] = statistics.median(values) / 1000
+    
+    print()
+    print("watched modules (cumulative)")
+    for name in WATCHED_MODULES:
+        value = cumulative.get(name)
+        print(f"  {name:<40} {'not imported' if value is None else f'{value:8.1f} ms'}")
+    
+    print()
+    print(f"top {args.top} modules (cumulative)")
+    for name, value in sorted(cumulative.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {name:<40} {value:8.1f} ms")
+    
+    if args.serve:
+        first_ms = _measure_first_response(env, args.port, args.timeout)
+        print()
+        print(f"spawn -> first GET / response          {first_ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
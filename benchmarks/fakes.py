@@ -0,0 +1,179 @@
+"""
+벤치마크용 로컬 대역 (fake LLM, SMTP sink, fake Google Sheets)
+
+외부 서비스 없이 /quote 전체 경로(CrewAI Task 실행, PDF, 메일 큐, 원장 복제)를
+실행할 수 있도록 네트워크 호출 지점만 대체합니다.
+"""
+import json
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+try:
+    from aiosmtpd.controller import Controller
+    from aiosmtpd.smtp import AuthResult
+    AIOSMTPD_AVAILABLE = True
+except ImportError:
+    AIOSMTPD_AVAILABLE = False
+
+SAMPLE_QUOTE: Dict[str, Any] = {
+    "project_summary": "반응형 기업 홈페이지 구축 및 관리자 페이지 개발",
+    "scope": [
+        "요구사항 분석 및 정보 구조 설계",
+        "메인/서브 페이지 UI 디자인",
+        "반응형 퍼블리싱",
+        "관리자 페이지(공지사항, 문의 관리) 개발",
+        "배포 및 운영 환경 구성",
+    ],
+    "deliverables": ["디자인 시안", "소스 코드", "관리자 매뉴얼"],
+    "milestones": ["요구사항 확정 (1주)", "디자인 완료 (3주)", "개발 완료 (6주)", "오픈 (7주)"],
+    "assumptions": ["콘텐츠(문구, 이미지)는 고객사 제공", "기존 호스팅 환경 사용"],
+    "exclusions": ["다국어 지원", "유지보수", "SEO 컨설팅"],
+    "risks": ["콘텐츠 전달 지연 시 일정 지연", "범위 추가 요청"],
+    "disclaimer": "본 견적은 참고용이며 범위 확정 시 조정될 수 있습니다.",
+    "delivery_days": 49,
+    "pricing": {"subtotal": 8500000, "vat": 850000, "total": 9350000, "currency": "KRW"},
+}
+
+# 에이전트 역할별 응답 (마지막 견적서 작성 Task의 출력에서 JSON을 추출함)
+_AGENT_OUTPUTS = {
+    "프로젝트 범위 분석가": json.dumps(
+        {key: SAMPLE_QUOTE[key] for key in ("scope", "deliverables", "milestones", "assumptions", "exclusions", "risks")},
+        ensure_ascii=False
+    ),
+    "견적 산출 전문가": json.dumps(
+        {"delivery_days": SAMPLE_QUOTE["delivery_days"], "pricing": SAMPLE_QUOTE["pricing"]},
+        ensure_ascii=False
+    ),
+}
+FAKE_PROPOSAL_OUTPUT = "최종 견적서입니다.\n```json\n" + json.dumps(SAMPLE_QUOTE, ensure_ascii=False, indent=2) + "\n```"
+
+
+class RateLimitError(Exception):
+    """fake LLM 제공자의 429 응답 (openai.error.RateLimitError 대역)"""
+    
+    http_status = 429
+
+
+def install_fake_llm(latency: float = 0.5, jitter: float = 0.2, capacity: int = 0) -> None:
+    """
+    crewai Agent.execute_task를 지연 후 고정 응답을 돌려주는 함수로 대체
+    
+    Crew/Task 실행, Task별 메트릭, JSON 추출과 가격 검증은 그대로 수행되며
+    LLM 호출만 대체됩니다. Agent 생성에 필요한 OPENAI_API_KEY는 임의 값이면 됩니다.
+    
+    capacity를 지정하면 제공자의 처리 용량을 흉내 내어, 동시 호출 수가 capacity를
+    넘으면 넘은 비율만큼 응답이 느려지고 2배를 넘으면 RateLimitError(429)가 발생합니다.
+    
+    Args:
+        latency: Task(에이전트)당 평균 응답 시간(초)
+        jitter: 응답 시간 편차 비율 (0.2 -> ±20%)
+        capacity: 제공자가 지연 없이 처리하는 동시 호출 수 (0: 제한 없음)
+    """
+    from crewai import Agent
+    
+    lock = threading.Lock()
+    active = [0]
+    
+    def execute_task(self, task: str, context: Optional[str] = None, tools: Optional[List[Any]] = None) -> str:
+        with lock:
+            active[0] += 1
+            load = active[0] / capacity if capacity > 0 else 0.0
+        try:
+            if load > 2:
+                time.sleep(latency * 0.1)
+                raise RateLimitError("Rate limit reached for requests")
+            time.sleep(max(latency * max(load, 1.0) * (1 + random.uniform(-jitter, jitter)), 0))
+            return _AGENT_OUTPUTS.get(self.role, FAKE_PROPOSAL_OUTPUT)
+        finally:
+            with lock:
+                active[0] -= 1
+    
+    Agent.execute_task = execute_task
+
+
+class SMTPSink:
+    """수신 메시지를 세기만 하는 로컬 SMTP 서버 (AUTH 허용, TLS 없음)"""
+    
+    def __init__(self, host: str = "127.0.0.1", port: int = 8025):
+        if not AIOSMTPD_AVAILABLE:
+            raise RuntimeError("aiosmtpd가 필요합니다: pip install aiosmtpd")
+        self.host = host
+        self.port = port
+        self.count = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+        self._controller = Controller(
+            self,
+            hostname=host,
+            port=port,
+            authenticator=lambda *args: AuthResult(success=True),
+            auth_require_tls=False
+        )
+    
+    async def handle_DATA(self, server, session, envelope):
+        with self._lock:
+            self.count += 1
+            self.bytes += len(envelope.content)
+        return "250 OK"
+    
+    def start(self) -> None:
+        self._controller.start()
+    
+    def stop(self) -> None:
+        self._controller.stop()
+
+
+class FakeWorksheet:
+    """append_rows/row_values만 지원하는 워크시트 대역"""
+    
+    def __init__(self, headers: List[str], latency: float = 0.0):
+        self.headers = headers
+        self.latency = latency
+        self.rows: List[List[Any]] = []
+        self.calls = 0
+        self._lock = threading.Lock()
+    
+    def row_values(self, row: int) -> List[str]:
+        time.sleep(self.latency)
+        return list(self.headers) if row == 1 else []
+    
+    def append_rows(self, values: List[List[Any]]) -> None:
+        time.sleep(self.latency)
+        with self._lock:
+            self.rows.extend(values)
+            self.calls += 1
+
+
+class FakeSheetsClient:
+    """gspread 클라이언트 대역 (open_by_key(...).sheet1)"""
+    
+    def __init__(self, worksheet: FakeWorksheet):
+        self.sheet1 = worksheet
+    
+    def open_by_key(self, key: str) -> "FakeSheetsClient":
+        return self
+
+
+def install_fake_sheets(sheet_id: str = "bench", latency: float = 0.2) -> FakeWorksheet:
+    """
+    공용 SheetsWriter를 fake 클라이언트를 쓰는 인스턴스로 등록
+    
+    앱 시작(start_replication) 전에 호출해야 원장 복제가 이 writer를 사용합니다.
+    
+    Args:
+        sheet_id: GOOGLE_SHEET_ID와 같은 값
+        latency: API 호출당 응답 시간(초)
+    
+    Returns:
+        기록된 행을 확인할 수 있는 워크시트
+    """
+    from src.services import sheets_service
+    
+    headers = list(sheets_service.build_row("", "", {}).keys())
+    worksheet = FakeWorksheet(headers, latency)
+    writer = sheets_service.SheetsWriter(sheet_id=sheet_id, client_factory=lambda: FakeSheetsClient(worksheet))
+    with sheets_service._writers_lock:
+        sheets_service._writers[sheet_id] = writer
+    return worksheet
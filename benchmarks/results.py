@@ -0,0 +1,156 @@
+"""
+벤치마크 결과 저장 및 커밋 간 비교
+
+결과는 benchmarks/results/<벤치마크>/<git sha>.json에 저장됩니다.
+작업 트리에 커밋되지 않은 변경이 있으면 sha 뒤에 -dirty가 붙습니다.
+
+실행:
+    python -m benchmarks.results bench_micro                 # 저장된 결과 목록
+    python -m benchmarks.results bench_micro <sha> [<sha>]   # 두 결과 비교 (기본: 현재 작업 트리)
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(PROJECT_ROOT, "benchmarks", "results")
+
+# 값이 클수록 좋은 지표 (그 외는 작을수록 좋음: 시간, 지연)
+HIGHER_IS_BETTER = ("throughput", "rps", "ops")
+
+
+def git_revision() -> str:
+    """현재 커밋 sha (짧은 형식, 변경 사항이 있으면 -dirty)"""
+    try:
+        sha = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{sha}-dirty" if dirty else sha
+
+
+def save_results(benchmark: str, metrics: Dict[str, Any], params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    벤치마크 결과 저장
+    
+    Args:
+        benchmark: 벤치마크 이름 (bench_micro 등)
+        metrics: 지표 (중첩 딕셔너리 가능, 숫자 값만 비교 대상)
+        params: 실행 조건 (동시성, 요청 수 등)
+    
+    Returns:
+        저장한 파일 경로
+    """
+    revision = git_revision()
+    directory = os.path.join(RESULTS_DIR, benchmark)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{revision}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "benchmark": benchmark,
+                "revision": revision,
+                "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "machine": f"{platform.system()} {platform.machine()} ({os.cpu_count()} cpu)",
+                "params": params or {},
+                "metrics": metrics,
+            },
+            f,
+            ensure_ascii=False,
+            indent=2
+        )
+    print(f"\n결과 저장: {os.path.relpath(path, PROJECT_ROOT)}")
+    return path
+
+
+def load_results(benchmark: str, revision: str) -> Dict[str, Any]:
+    """저장된 결과 불러오기 (sha 접두어로 찾음)"""
+    directory = os.path.join(RESULTS_DIR, benchmark)
+    names = sorted(os.listdir(directory)) if os.path.isdir(directory) else []
+    candidates = [name for name in names if name == f"{revision}.json"] or [
+        name for name in names if name.startswith(revision) and name.endswith(".json")
+    ]
+    if not candidates:
+        raise SystemExit(f"{benchmark}: {revision} 결과가 없습니다.")
+    with open(os.path.join(directory, candidates[0]), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _flatten(metrics: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    """중첩 지표 -> {a.b.c: 값}"""
+    flat: Dict[str, float] = {}
+    for key, value in metrics.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = float(value)
+    return flat
+
+
+def compare(base: Dict[str, Any], head: Dict[str, Any], threshold: float = 5.0) -> List[str]:
+    """
+    두 결과 비교
+    
+    Args:
+        base: 기준 결과
+        head: 비교 결과
+        threshold: 개선/회귀로 표시할 변화율(%)
+    
+    Returns:
+        출력 행 목록
+    """
+    base_metrics = _flatten(base["metrics"])
+    head_metrics = _flatten(head["metrics"])
+    width = max((len(name) for name in base_metrics), default=10)
+    lines = [f"{'metric':<{width}} {base['revision']:>14} {head['revision']:>14} {'change':>9}"]
+    for name, base_value in base_metrics.items():
+        if name not in head_metrics:
+            continue
+        head_value = head_metrics[name]
+        change = (head_value - base_value) / base_value * 100 if base_value else 0.0
+        better = change > 0 if any(word in name for word in HIGHER_IS_BETTER) else change < 0
+        mark = ""
+        if abs(change) >= threshold:
+            mark = "  improved" if better else "  REGRESSED"
+        lines.append(f"{name:<{width}} {base_value:>14.3f} {head_value:>14.3f} {change:>+8.1f}%{mark}")
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="벤치마크 결과 비교")
+    parser.add_argument("benchmark")
+    parser.add_argument("base", nargs="?")
+    parser.add_argument("head", nargs="?", default=None)
+    parser.add_argument("--threshold", type=float, default=5.0)
+    args = parser.parse_args()
+    
+    if args.base is None:
+        directory = os.path.join(RESULTS_DIR, args.benchmark)
+        for name in sorted(os.listdir(directory)) if os.path.isdir(directory) else []:
+            with open(os.path.join(directory, name), encoding="utf-8") as f:
+                result = json.load(f)
+            print(f"{result['revision']:<16} {result['created_at']}  {json.dumps(result['params'], ensure_ascii=False)}")
+        return
+    
+    base = load_results(args.benchmark, args.base)
+    head = load_results(args.benchmark, args.head or git_revision())
+    print("\n".join(compare(base, head, args.threshold)))
+    if base.get("params") != head.get("params"):
+        print(f"\n주의: 실행 조건이 다릅니다. {base.get('params')} / {head.get('params')}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
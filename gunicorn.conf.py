@@ -0,0 +1,30 @@
+"""
+gunicorn 설정 (멀티 워커 실행)
+
+실행:
+    gunicorn -c gunicorn.conf.py app:app
+
+앱을 마스터 프로세스에서 한 번 불러오고(preload) 무거운 의존성(crewai,
+reportlab 한글 폰트 등)까지 미리 로드한 뒤 워커를 fork하므로, 각 워커는
+준비된 상태로 시작하고 해당 메모리 페이지를 공유합니다.
+"""
+from src.config import settings
+
+bind = f"{settings.API_HOST}:{settings.API_PORT}"
+workers = settings.API_WORKERS
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+# 견적 생성(CrewAI)은 수 분까지 걸릴 수 있어 기본값(30초)보다 길게 설정
+timeout = settings.WORKER_TIMEOUT
+graceful_timeout = 30
+
+# 요청 로그는 RequestIdMiddleware가 기록
+accesslog = None
+
+
+def when_ready(server):
+    """워커 fork 전 마스터에서 의존성 미리 로드"""
+    if settings.WARMUP_ON_STARTUP:
+        from src.utils.warmup import warm_up
+        warm_up()
@@ -1,5 +1,22 @@
 """API 모듈"""
 from .routes import router
-from .models import QuoteRequest, QuoteResponse
+from .models import (
+    QuoteRequest,
+    QuoteResponse,
+    QuotePreviewRequest,
+    ExportRequest,
+    QuoteDetail,
+    QuoteListResponse,
+    ProfilingConfigRequest
+)
 
-__all__ = ["router", "QuoteRequest", "QuoteResponse"]
+__all__ = [
+    "router",
+    "QuoteRequest",
+    "QuoteResponse",
+    "QuotePreviewRequest",
+    "ExportRequest",
+    "QuoteDetail",
+    "QuoteListResponse",
+    "ProfilingConfigRequest"
+]
@@ -0,0 +1,172 @@
+"""
+파일 다운로드 응답 유틸리티 (스트리밍, ETag, Range)
+"""
+import os
+from typing import Iterator, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+
+from src.config import settings
+
+
+class RangeNotSatisfiable(Exception):
+    """요청한 Range를 만족할 수 없음"""
+
+
+def compute_etag(stat: os.stat_result) -> str:
+    """
+    파일 메타데이터 기반 ETag 계산
+    
+    생성된 견적서 PDF는 다시 쓰이지 않으므로 (inode, 크기, mtime)만으로
+    내용 변경을 판별할 수 있습니다. 파일을 읽지 않아 이벤트 루프를 막지 않습니다.
+    
+    Args:
+        stat: 파일 stat 결과
+    
+    Returns:
+        따옴표로 감싼 ETag 문자열
+    """
+    return f'"{stat.st_ino:x}-{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+
+
+def _etag_matches(header: Optional[str], etag: str, strong: bool = False) -> bool:
+    """
+    If-None-Match / If-Range 헤더가 ETag와 일치하는지 확인
+    
+    Args:
+        header: 요청 헤더 값
+        etag: 현재 ETag
+        strong: strong 비교 여부 (If-Range), 약한 검증자(W/)는 일치하지 않음
+    
+    Returns:
+        일치 여부
+    """
+    if not header:
+        return False
+    if header.strip() == "*":
+        return not strong
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            if strong:
+                continue
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    단일 bytes Range 헤더 파싱
+    
+    Args:
+        header: Range 헤더 값
+        size: 파일 크기
+    
+    Returns:
+        (start, end) 포함 구간, Range가 없거나 해석할 수 없으면 None
+    
+    Raises:
+        RangeNotSatisfiable: 파일 범위를 벗어난 요청
+    """
+    if not header or not header.startswith("bytes="):
+        return None
+    
+    spec = header[len("bytes="):].strip()
+    # 다중 Range는 지원하지 않고 전체 응답으로 처리
+    if "," in spec or "-" not in spec:
+        return None
+    
+    start_str, end_str = spec.split("-", 1)
+    try:
+        if start_str == "":
+            # 접미사 Range (마지막 N 바이트)
+            length = int(end_str)
+            if length <= 0:
+                raise RangeNotSatisfiable(header)
+            start = max(size - length, 0)
+            end = size - 1
+        else:
+            start = int(start_str)
+            end = int(end_str) if end_str else size - 1
+    except ValueError:
+        return None
+    
+    if start >= size or start > end:
+        raise RangeNotSatisfiable(header)
+    return start, min(end, size - 1)
+
+
+def iter_file(path: str, start: int, end: int, chunk_size: int) -> Iterator[bytes]:
+    """파일의 [start, end] 구간을 청크 단위로 읽기"""
+    remaining = end - start + 1
+    with open(path, "rb") as f:
+        f.seek(start)
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def file_response(
+    request: Request,
+    path: str,
+    media_type: str,
+    filename: str
+) -> Response:
+    """
+    조건부 요청과 Range를 지원하는 파일 응답 생성
+    
+    Args:
+        request: 요청 객체
+        path: 파일 경로
+        media_type: Content-Type
+        filename: 다운로드 파일명
+    
+    Returns:
+        200/206/304/416 응답
+    """
+    stat = os.stat(path)
+    size = stat.st_size
+    etag = compute_etag(stat)
+    
+    headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        "Cache-Control": f"public, max-age={settings.PDF_CACHE_MAX_AGE}, immutable",
+        "Content-Disposition": f'inline; filename="{filename}"',
+    }
+    
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    
+    byte_range = None
+    if_range = request.headers.get("if-range")
+    if if_range is None or _etag_matches(if_range, etag, strong=True):
+        try:
+            byte_range = parse_range(request.headers.get("range"), size)
+        except RangeNotSatisfiable:
+            headers["Content-Range"] = f"bytes */{size}"
+            return Response(status_code=416, headers=headers)
+    
+    if byte_range is None:
+        start, end, status_code = 0, size - 1, 200
+    else:
+        start, end = byte_range
+        status_code = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    
+    if request.method == "HEAD" or size == 0:
+        return Response(status_code=status_code, headers=headers, media_type=media_type)
+    
+    return StreamingResponse(
+        iter_file(path, start, end, settings.PDF_CHUNK_SIZE),
+        status_code=status_code,
+        headers=headers,
+        media_type=media_type
+    )
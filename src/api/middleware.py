@@ -0,0 +1,109 @@
+"""
+ASGI 미들웨어
+"""
+import re
+import time
+import uuid
+
+from src.utils.logger import logger, request_id_var
+from src.utils.metrics import HTTP_IN_FLIGHT, HTTP_REQUESTS
+
+REQUEST_ID_HEADER = b"x-request-id"
+CONTENT_TYPE_HEADER = b"content-type"
+JSON_CONTENT_TYPE = b"application/json"
+JSON_UTF8_CONTENT_TYPE = b"application/json; charset=utf-8"
+# 전달받은 요청 ID 허용 형식 (로그 주입 방지)
+REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+
+
+class RequestIdMiddleware:
+    """
+    요청별 상관관계 ID 미들웨어
+    
+    X-Request-ID 헤더가 있으면 그대로 사용하고, 없으면 새로 생성합니다.
+    요청 처리 중 기록되는 모든 로그에 request_id가 포함되며, 응답 헤더에도
+    같은 값을 돌려줍니다. 요청 완료 시 메서드/경로/상태/처리 시간을 한 줄로
+    기록하고, 처리 중 요청 수/요청 수 메트릭을 갱신합니다.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request_id = None
+        for key, value in scope["headers"]:
+            if key == REQUEST_ID_HEADER:
+                candidate = value.decode("latin-1")
+                if REQUEST_ID_PATTERN.match(candidate):
+                    request_id = candidate
+                break
+        if request_id is None:
+            request_id = uuid.uuid4().hex
+        
+        token = request_id_var.set(request_id)
+        started = time.perf_counter()
+        status_code = 500
+        HTTP_IN_FLIGHT.inc()
+        
+        async def send_with_request_id(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((REQUEST_ID_HEADER, request_id.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            HTTP_REQUESTS.inc(method=scope["method"], status=str(status_code))
+            duration_ms = (time.perf_counter() - started) * 1000
+            logger.info(
+                f"{scope['method']} {scope['path']} {status_code} {duration_ms:.1f}ms",
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status_code,
+                    "duration_ms": round(duration_ms, 1),
+                }
+            )
+            request_id_var.reset(token)
+
+
+class JSONCharsetMiddleware:
+    """
+    JSON 응답 Content-Type에 UTF-8 인코딩 명시
+    
+    응답 시작 메시지의 헤더만 바꾸고 본문은 그대로 전달하므로, 응답을 감싸는
+    BaseHTTPMiddleware(@app.middleware("http"))와 달리 요청마다 태스크를 만들지 않고
+    스트리밍 응답과 클라이언트 연결 종료 감지(http.disconnect)에도 영향을 주지
+    않습니다. 예외 처리기(HTTPException, 검증 오류) 응답에도 적용됩니다.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_with_charset(message):
+            if message["type"] == "http.response.start":
+                headers = message.get("headers", [])
+                for index, (key, value) in enumerate(headers):
+                    if key == CONTENT_TYPE_HEADER:
+                        if value == JSON_CONTENT_TYPE:
+                            headers = list(headers)
+                            headers[index] = (key, JSON_UTF8_CONTENT_TYPE)
+                            message = {**message, "headers": headers}
+                        break
+            await send(message)
+        
+        await self.app(scope, receive, send_with_charset)
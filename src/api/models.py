@@ -2,7 +2,7 @@
 API 모델 정의
 """
 from pydantic import BaseModel, Field, EmailStr
-from typing import Optional
+from typing import Any, Dict, List, Literal, Optional
 
 
 class QuoteRequest(BaseModel):
@@ -16,6 +16,61 @@ class QuoteResponse(BaseModel):
     """견적 응답 모델"""
     status: str = Field(..., description="상태 (success/error)")
     message: str = Field(..., description="메시지")
+    quote_id: Optional[str] = Field(None, description="견적서 ID")
     pdf_filename: Optional[str] = Field(None, description="PDF 파일명")
     pdf_path: Optional[str] = Field(None, description="PDF 파일 경로")
+    pdf_url: Optional[str] = Field(None, description="PDF 다운로드 URL")
+    email_status: Optional[str] = Field(None, description="이메일 발송 상태 (queued/failed/not_configured)")
     error: Optional[str] = Field(None, description="오류 메시지")
+    profile_id: Optional[str] = Field(None, description="프로파일 ID (프로파일링된 요청만)")
+
+
+class QuotePreviewRequest(BaseModel):
+    """견적서 미리보기 요청 모델"""
+    client_name: str = Field("", description="고객명")
+    quote_json: Dict[str, Any] = Field(..., description="견적서 JSON")
+
+
+class ExportItem(BaseModel):
+    """내보내기 대상 견적서"""
+    client_name: str = Field("", description="고객명")
+    quote_json: Dict[str, Any] = Field(..., description="견적서 JSON")
+    filename: Optional[str] = Field(None, description="ZIP 내부 파일명 (선택)")
+
+
+class ExportRequest(BaseModel):
+    """다건 견적서 내보내기 요청 모델"""
+    format: Literal["pdf", "zip"] = Field("pdf", description="출력 형식 (pdf: 목차 포함 병합 PDF, zip: 개별 PDF 묶음)")
+    items: List[ExportItem] = Field(..., description="견적서 목록", min_length=1)
+
+
+class QuoteSummary(BaseModel):
+    """견적서 이력 항목"""
+    quote_id: str = Field(..., description="견적서 ID")
+    created_at: str = Field(..., description="생성 시각 (ISO 8601)")
+    client_name: str = Field(..., description="고객명")
+    client_email: str = Field(..., description="고객 이메일")
+    project_summary: str = Field("", description="프로젝트 요약")
+    subtotal: Optional[int] = Field(None, description="공급가액")
+    vat: Optional[int] = Field(None, description="부가세")
+    total: Optional[int] = Field(None, description="총액")
+    currency: Optional[str] = Field(None, description="통화")
+    delivery_days: Optional[int] = Field(None, description="예상 기간(일)")
+
+
+class QuoteDetail(QuoteSummary):
+    """견적서 상세"""
+    pdf_url: str = Field(..., description="PDF 다운로드 URL")
+    quote_json: Dict[str, Any] = Field(..., description="견적서 JSON")
+
+
+class QuoteListResponse(BaseModel):
+    """견적서 이력 목록 응답"""
+    items: List[QuoteSummary] = Field(..., description="견적서 목록 (최신순)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+
+
+class ProfilingConfigRequest(BaseModel):
+    """프로파일링 설정 변경 요청"""
+    enabled: Optional[bool] = Field(None, description="X-Profile 헤더 허용 여부")
+    sample_rate: Optional[float] = Field(None, ge=0, le=1, description="헤더 없이 프로파일링할 요청 비율 (0~1)")
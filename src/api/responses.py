@@ -0,0 +1,38 @@
+"""
+빠른 JSON 응답 클래스
+
+orjson이 설치되어 있으면 orjson으로, 없으면 미리 만든 표준 json 인코더로
+직렬화합니다. Content-Type의 charset=utf-8은 JSONCharsetMiddleware가 붙입니다.
+"""
+import importlib.util
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
+if ORJSON_AVAILABLE:
+    import orjson
+
+# Starlette JSONResponse와 같은 형식 (공백 없음, 한글 그대로)
+_encoder = json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+
+def dumps(content: Any) -> bytes:
+    """JSON 직렬화 (UTF-8 바이트)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return _encoder.encode(content).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    빠른 JSON 응답
+    
+    앱 기본 응답 클래스로 사용하며(QuoteResponse, 이력/통계 조회 등), 상태 조회처럼
+    자주 호출되는 엔드포인트는 이 응답을 직접 반환하여 FastAPI의 jsonable_encoder
+    변환도 건너뜁니다.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,33 +1,105 @@
 """
 API 라우트 정의
 """
+import asyncio
+import hmac
 import os
-from datetime import datetime
-from fastapi import APIRouter, HTTPException
-
-from src.api.models import QuoteRequest, QuoteResponse
-from src.core.quote_generator import generate_quote_json
-from src.services.pdf_service import generate_pdf
-from src.services.email_service import send_email
-from src.services.sheets_service import log_to_sheets
+import re
+import time
+import uuid
+from datetime import date, datetime
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from src.api.models import (
+    QuoteRequest,
+    QuoteResponse,
+    QuotePreviewRequest,
+    ExportRequest,
+    QuoteDetail,
+    QuoteListResponse,
+    ProfilingConfigRequest
+)
+from src.api.file_response import file_response
+from src.api.responses import FastJSONResponse
+from src.core.quote_generator import generate_quote
+from src.services.email_service import email_configured
+from src.services.mail_queue import get_mail_queue
+from src.services.ledger_service import record_quote
+from src.services.history_service import HistoryService
+from src.services.dedup_service import (
+    CLAIMED,
+    DUPLICATE_DONE,
+    QuoteDedup,
+    get_quote_dedup,
+    request_key
+)
+from src.services.export_service import ExportService, PYPDF_AVAILABLE
+from src.services.preview_service import render_preview
 from src.config import settings
-from src.utils.logger import logger
+from src.utils.deadline import (
+    DEADLINE_HEADER,
+    REASON_DEADLINE,
+    REASON_DISCONNECTED,
+    Deadline,
+    DeadlineExceeded,
+    check_deadline,
+    deadline_scope
+)
+from src.utils.logger import logger, request_id_var
+from src.utils.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, QUOTES_TOTAL, REGISTRY
+from src.utils.profiling import (
+    PROFILE_FILES,
+    PROFILE_HEADER,
+    PROFILE_ID_PATTERN,
+    get_profile,
+    get_profiling_config,
+    list_profiles,
+    profile_file_path,
+    profile_request,
+    profile_trigger,
+    set_profiling_config,
+    timed_stage
+)
+from src.utils.scheduler import PRIORITY_HEADER, parse_priority, priority_scope
 
 router = APIRouter()
 
+# 견적서 ID 형식 (경로 조작 방지)
+QUOTE_ID_PATTERN = re.compile(r"^[0-9A-Za-z_-]{1,64}$")
+
+ROOT_CONTENT = {
+    "message": settings.API_TITLE,
+    "version": settings.API_VERSION,
+    "status": "running"
+}
+
+# 견적 생성 중 클라이언트 연결 상태 확인 간격(초)
+DISCONNECT_POLL_INTERVAL = 0.5
+
+
+def _pdf_path_for(quote_id: str) -> str:
+    """견적서 ID로 PDF 경로 계산"""
+    return os.path.join(settings.PROPOSALS_DIR, f"quote_{quote_id}.pdf")
+
 
 @router.get("/")
-async def root() -> dict:
-    """루트 엔드포인트"""
-    return {
-        "message": settings.API_TITLE,
-        "version": settings.API_VERSION,
-        "status": "running"
-    }
+async def root() -> FastJSONResponse:
+    """루트 엔드포인트 (헬스 체크)"""
+    return FastJSONResponse(ROOT_CONTENT)
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Prometheus 메트릭 (text exposition format)"""
+    return Response(content=REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
 
 
 @router.post("/quote", response_model=QuoteResponse)
-async def create_quote(request: QuoteRequest) -> QuoteResponse:
+async def create_quote(request: QuoteRequest, http_request: Request) -> QuoteResponse:
     """
     견적서 생성 및 발송 API
     
@@ -36,13 +108,128 @@ async def create_quote(request: QuoteRequest) -> QuoteResponse:
     2) PDF 생성
     3) 이메일 발송
     4) 구글 시트 로그
+    
+    같은 요청(Idempotency-Key 헤더 또는 고객명/이메일/요청사항이 같은 요청)이
+    QUOTE_DEDUP_TTL 안에 다시 들어오면 어느 워커에서든 견적서를 새로 만들지 않고
+    이전 응답을 돌려줍니다. 처리 중인 요청이 있으면 완료될 때까지 기다립니다.
+    
+    프로파일링이 활성화된 경우 X-Profile: 1 헤더를 보내면 이 요청의 프로파일이
+    저장되고 응답의 profile_id로 조회할 수 있습니다.
+    
+    처리 기한은 X-Request-Timeout 헤더(초, 최대 QUOTE_DEADLINE_SECONDS)로 정하며,
+    기한이 지나거나 클라이언트 연결이 끊기면 다음 단계(LLM Task, PDF, 발송 등록,
+    원장 기록)를 시작하지 않고 중단합니다.
+    
+    X-Quote-Priority 헤더(interactive, revision, batch, 기본값 interactive)는
+    LLM/PDF 단계의 동시 실행 자리를 배정받는 우선순위입니다. 일괄 재견적은
+    batch로 보내면 대화형 요청의 지연을 늘리지 않습니다.
+    """
+    try:
+        priority = parse_priority(http_request.headers.get(PRIORITY_HEADER))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    deadline = Deadline.from_header(http_request.headers.get(DEADLINE_HEADER))
+    if settings.QUOTE_DEDUP_TTL <= 0:
+        return await _run_quote(request, http_request, deadline, priority)
+    
+    # 중복 제거 저장소는 SQLite이므로 이벤트 루프를 막지 않도록 스레드 풀에서 호출
+    dedup = await run_in_threadpool(get_quote_dedup)
+    key = request_key(
+        request.client_name,
+        request.client_email,
+        request.customer_request,
+        http_request.headers.get("idempotency-key")
+    )
+    cached = await _claim_or_wait(dedup, key, deadline)
+    if cached is not None:
+        logger.info(f"중복 견적 요청, 이전 응답 반환: {cached.get('quote_id')}")
+        return QuoteResponse(**cached)
+    
+    response = None
+    try:
+        response = await _run_quote(request, http_request, deadline, priority)
+    finally:
+        if response is not None and response.status == "success":
+            await run_in_threadpool(
+                dedup.complete, key, jsonable_encoder(response, exclude={"profile_id"})
+            )
+        else:
+            await run_in_threadpool(dedup.release, key)
+    return response
+
+
+async def _claim_or_wait(dedup: QuoteDedup, key: str, request_deadline: Deadline) -> Optional[dict]:
     """
-    # 요청값 출력
-    print("REQ:", request.model_dump())
+    요청 처리권 획득 (다른 요청이 처리 중이면 완료될 때까지 대기)
+    
+    대기 시간은 QUOTE_DEDUP_WAIT와 요청의 남은 처리 시간 중 짧은 쪽입니다.
+    
+    Returns:
+        완료된 이전 응답, 이 요청이 처리해야 하면 None
+    """
+    wait = settings.QUOTE_DEDUP_WAIT
+    remaining = request_deadline.remaining()
+    if remaining is not None:
+        wait = min(wait, remaining)
+    deadline = time.monotonic() + wait
+    while True:
+        state, cached = await run_in_threadpool(dedup.claim, key)
+        if state == DUPLICATE_DONE:
+            return cached
+        if state == CLAIMED:
+            return None
+        if time.monotonic() >= deadline:
+            logger.warning("중복 요청 대기 시간 초과, 새로 처리합니다.")
+            return None
+        await asyncio.sleep(settings.QUOTE_DEDUP_POLL_INTERVAL)
+
+
+async def _run_quote(
+    request: QuoteRequest,
+    http_request: Request,
+    deadline: Deadline,
+    priority: str
+) -> QuoteResponse:
+    """
+    견적서 생성을 스레드 풀에서 실행
+    
+    처리 중에는 이벤트 루프가 막히지 않으므로 다른 요청을 계속 받으며,
+    클라이언트 연결이 끊기면 처리 기한을 취소해 남은 단계를 건너뛰게 합니다.
+    진행 중인 단계(LLM 호출 등)는 끝날 때까지 기다린 뒤 응답합니다.
+    처리 기한과 우선순위는 컨텍스트로 스레드에 전달됩니다.
+    """
+    with deadline_scope(deadline), priority_scope(priority):
+        task = asyncio.ensure_future(run_in_threadpool(_profiled_quote, request, http_request))
+    while True:
+        done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_INTERVAL)
+        if done:
+            return task.result()
+        if deadline.reason is None and await http_request.is_disconnected():
+            logger.info("클라이언트 연결 종료, 견적서 생성을 중단합니다.")
+            deadline.cancel(REASON_DISCONNECTED)
+
+
+def _profiled_quote(request: QuoteRequest, http_request: Request) -> QuoteResponse:
+    """견적서 생성 처리 (프로파일링 대상이면 프로파일 기록)"""
+    trigger = profile_trigger(http_request.headers.get(PROFILE_HEADER))
+    if trigger is None:
+        return _process_quote(request)
     
+    with profile_request(trigger, path=http_request.url.path, request_id=request_id_var.get()) as session:
+        response = _process_quote(request)
+        if session is not None:
+            session.tags.update(quote_id=response.quote_id, status=response.status)
+    if session is not None:
+        response.profile_id = session.profile_id
+    return response
+
+
+def _process_quote(request: QuoteRequest) -> QuoteResponse:
+    """견적서 생성 처리 (CrewAI -> PDF -> 이메일 대기열 -> 원장)"""
     # 고객명 처리 (무조건 req.client_name만 사용)
     name = request.client_name.strip()
     
+    quote_id = None
     pdf_filename = None
     pdf_path = None
     
@@ -51,36 +238,50 @@ async def create_quote(request: QuoteRequest) -> QuoteResponse:
         # 1. CrewAI로 견적서 JSON 생성
         try:
             logger.info(f"견적서 생성 요청: {name}")
-            quote_json = generate_quote_json(
-                client_name="",  # crew에서는 고객명 사용하지 않음
-                customer_request=request.customer_request
-            )
+            with timed_stage("crew"):
+                quote = generate_quote(
+                    client_name="",  # crew에서는 고객명 사용하지 않음
+                    customer_request=request.customer_request
+                )
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"견적서 생성 실패: {e}", exc_info=True)
+            QUOTES_TOTAL.inc(status="crew_error")
             return QuoteResponse(
                 status="error",
                 message="견적서 생성 실패",
                 error=f"crew_pipeline 오류: {str(e)}"
             )
         
-        # 2. PDF 생성
+        # 2. PDF 생성 (reportlab은 첫 PDF 생성 시 불러옴)
         try:
+            from src.services.pdf_service import generate_pdf
+            
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            pdf_filename = f"quote_{timestamp}.pdf"
-            pdf_path = os.path.join(settings.PROPOSALS_DIR, pdf_filename)
+            quote_id = f"{timestamp}_{uuid.uuid4().hex[:8]}"
+            pdf_path = _pdf_path_for(quote_id)
+            pdf_filename = os.path.basename(pdf_path)
             
-            generate_pdf(quote_json, pdf_path, name)
+            with timed_stage("pdf"):
+                generate_pdf(quote, pdf_path, name)
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"PDF 생성 실패: {e}", exc_info=True)
+            QUOTES_TOTAL.inc(status="pdf_error")
             return QuoteResponse(
                 status="error",
                 message="PDF 생성 실패",
                 error=f"pdf_gen 오류: {str(e)}"
             )
         
-        # 3. 이메일 발송
-        email_success = False
+        # 3. 이메일 발송 대기열 등록 (발송/재시도는 백그라운드 워커가 처리)
+        email_status = "failed"
         try:
+            if not email_configured():
+                # 발송 계정이 없으면 대기열에 넣어도 보낼 수 없음
+                raise ValueError("SENDER_EMAIL과 SENDER_PASSWORD 환경변수가 설정되지 않았습니다.")
             # 이메일 제목/본문 생성
             subject = f"[견적서] {name}님 요청 건"
             body = f"""안녕하세요, {name}님.
@@ -91,54 +292,321 @@ async def create_quote(request: QuoteRequest) -> QuoteResponse:
 감사합니다.
 Quote Agent
 """
-            send_email(
-                to_email=request.client_email,
-                client_name=name,
-                pdf_path=pdf_path,
-                subject=subject,
-                body=body
-            )
-            email_success = True
+            check_deadline("enqueue")
+            with timed_stage("enqueue"):
+                get_mail_queue().enqueue(
+                    quote_id=quote_id,
+                    to_email=request.client_email,
+                    client_name=name,
+                    pdf_path=pdf_path,
+                    subject=subject,
+                    body=body
+                )
+            email_status = "queued"
+        except DeadlineExceeded:
+            raise
+        except ValueError as e:
+            email_status = "not_configured"
+            logger.warning(f"이메일 발송 생략: {e}")
         except Exception as e:
-            logger.warning(f"이메일 발송 실패: {e}")
+            logger.warning(f"이메일 발송 대기열 등록 실패: {e}")
         
-        # 4. Google Sheets에 로그 기록 (실패해도 서비스는 계속)
-        service_account_path = os.getenv("GOOGLE_SERVICE_ACCOUNT_FILE", "service_account.json")
-        if not os.path.exists(service_account_path):
-            print(f"service_account.json not found: {service_account_path}")
-            logger.warning(f"서비스 계정 파일이 없어 Google Sheets 로깅을 건너뜁니다: {service_account_path}")
-        else:
-            try:
-                log_to_sheets(
+        # 4. 원장 기록 (Google Sheets에는 백그라운드에서 복제, 실패해도 서비스는 계속)
+        try:
+            with timed_stage("ledger"):
+                record_quote(
+                    quote_id=quote_id,
                     client_name=name,
                     client_email=request.client_email,
-                    quote_json=quote_json
+                    quote_json=quote
                 )
-            except Exception as e:
-                print(f"SHEETS_LOG_ERROR: {repr(e)}")
-                logger.warning(f"Google Sheets 로깅 실패: {str(e)}")
+        except Exception as e:
+            logger.warning(f"견적서 원장 기록 실패: {str(e)}")
         
         # 성공 응답
-        message = (
-            "견적서가 생성되고 발송되었습니다."
-            if email_success
-            else "견적서가 생성되었습니다. (이메일 발송 실패)"
-        )
+        if email_status == "queued":
+            message = "견적서가 생성되었으며 이메일 발송이 예약되었습니다."
+        elif email_status == "not_configured":
+            message = "견적서가 생성되었습니다. (이메일 설정이 없어 발송하지 않음)"
+        else:
+            message = "견적서가 생성되었습니다. (이메일 발송 실패)"
         
         logger.info(f"견적서 처리 완료: {name}")
+        QUOTES_TOTAL.inc(status="success")
         return QuoteResponse(
             status="success",
             message=message,
+            quote_id=quote_id,
             pdf_filename=pdf_filename,
-            pdf_path=pdf_path
+            pdf_path=pdf_path,
+            pdf_url=f"/quote/{quote_id}/pdf",
+            email_status=email_status
         )
-        
+    
+    except DeadlineExceeded as e:
+        # 발송 등록 전에 중단되면 이미 만든 PDF는 보낼 곳이 없으므로 삭제
+        if pdf_path and os.path.exists(pdf_path):
+            os.remove(pdf_path)
+        logger.warning(f"견적서 생성 중단: {e}")
+        QUOTES_TOTAL.inc(status=e.reason)
+        return QuoteResponse(
+            status="error",
+            message="처리 시간 초과" if e.reason == REASON_DEADLINE else "클라이언트 연결 종료",
+            error=f"{e.reason}: {e.stage} 단계 전에 중단"
+        )
+    
     except Exception as e:
         logger.error(f"처리 중 오류 발생: {e}", exc_info=True)
+        QUOTES_TOTAL.inc(status="error")
         return QuoteResponse(
             status="error",
             message="처리 중 오류 발생",
             error=str(e),
+            quote_id=quote_id,
             pdf_filename=pdf_filename,
             pdf_path=pdf_path
         )
+
+
+@router.post("/quote/preview", response_class=HTMLResponse)
+async def preview_quote(request: QuotePreviewRequest) -> HTMLResponse:
+    """
+    견적서 HTML 미리보기
+    
+    PDF와 같은 섹션 구조의 HTML을 반환합니다. PDF 생성은 실제 발송 시점
+    (POST /quote)에만 수행됩니다.
+    """
+    html = render_preview(request.quote_json, request.client_name.strip())
+    return HTMLResponse(content=html)
+
+
+@router.api_route("/quote/{quote_id}/pdf", methods=["GET", "HEAD"])
+async def download_quote_pdf(quote_id: str, request: Request) -> Response:
+    """
+    견적서 PDF 다운로드
+    
+    strong ETag 기반 If-None-Match(304), 단일 Range(206) 요청을 지원하며
+    파일은 청크 단위로 스트리밍합니다.
+    """
+    if not QUOTE_ID_PATTERN.match(quote_id):
+        raise HTTPException(status_code=400, detail="잘못된 견적서 ID입니다.")
+    
+    pdf_path = _pdf_path_for(quote_id)
+    if not os.path.isfile(pdf_path):
+        raise HTTPException(status_code=404, detail="견적서 PDF를 찾을 수 없습니다.")
+    
+    return file_response(
+        request,
+        pdf_path,
+        media_type="application/pdf",
+        filename=os.path.basename(pdf_path)
+    )
+
+
+@router.get("/quote/{quote_id}/email")
+def get_email_status(quote_id: str) -> FastJSONResponse:
+    """
+    견적서별 이메일 발송 상태 조회
+    
+    상태: pending(대기/재시도 대기), sending(발송 중), sent(발송 완료), dead(최종 실패),
+    unknown(본문 전송 후 연결이 끊겨 수신 여부 불명, 재발송하지 않음)
+    
+    스풀 디렉토리를 조회하므로 이벤트 루프가 아닌 스레드 풀에서 실행됩니다.
+    """
+    if not QUOTE_ID_PATTERN.match(quote_id):
+        raise HTTPException(status_code=400, detail="잘못된 견적서 ID입니다.")
+    
+    messages = get_mail_queue().status(quote_id)
+    if not messages:
+        raise HTTPException(status_code=404, detail="발송 내역을 찾을 수 없습니다.")
+    
+    # 폴링 대상이므로 응답을 직접 만들어 jsonable_encoder 변환을 건너뜀
+    return FastJSONResponse({"quote_id": quote_id, "messages": messages})
+
+
+@router.get("/quotes", response_model=QuoteListResponse)
+def list_quotes(
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(settings.HISTORY_PAGE_SIZE, ge=1, le=settings.HISTORY_MAX_PAGE_SIZE),
+    client_email: Optional[str] = Query(None, description="고객 이메일"),
+    since: Optional[date] = Query(None, description="시작일 (YYYY-MM-DD, 포함)"),
+    until: Optional[date] = Query(None, description="종료일 (YYYY-MM-DD, 포함)"),
+    min_total: Optional[int] = Query(None, ge=0, description="최소 총액"),
+    max_total: Optional[int] = Query(None, ge=0, description="최대 총액"),
+    q: Optional[str] = Query(None, max_length=200, description="범위/요약 검색어")
+) -> QuoteListResponse:
+    """
+    견적서 이력 목록 조회 (최신순)
+    
+    커서 기반 페이지네이션: 응답의 next_cursor를 다음 요청의 cursor로 전달합니다.
+    """
+    try:
+        items, next_cursor = HistoryService().list_quotes(
+            limit=limit,
+            cursor=cursor,
+            client_email=client_email,
+            since=since,
+            until=until,
+            min_total=min_total,
+            max_total=max_total,
+            keyword=q
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return QuoteListResponse(items=items, next_cursor=next_cursor)
+
+
+@router.get("/quotes/stats/daily")
+def get_daily_stats(
+    since: Optional[date] = Query(None, description="시작일 (YYYY-MM-DD, 포함)"),
+    until: Optional[date] = Query(None, description="종료일 (YYYY-MM-DD, 포함)")
+) -> dict:
+    """일별 견적 건수/금액 통계"""
+    return HistoryService().daily_stats(since, until)
+
+
+@router.get("/quotes/stats/clients")
+def get_client_stats(
+    since: Optional[date] = Query(None, description="시작일 (YYYY-MM-DD, 포함)"),
+    until: Optional[date] = Query(None, description="종료일 (YYYY-MM-DD, 포함)"),
+    limit: int = Query(20, ge=1, le=settings.HISTORY_MAX_PAGE_SIZE)
+) -> dict:
+    """고객별 견적 건수/금액 통계 (건수 내림차순)"""
+    return {"clients": HistoryService().client_stats(since, until, limit)}
+
+
+@router.get("/quotes/stats/keywords")
+def get_keyword_stats(
+    q: str = Query(..., min_length=1, max_length=200, description="범위/요약 검색어"),
+    since: Optional[date] = Query(None, description="시작일 (YYYY-MM-DD, 포함)"),
+    until: Optional[date] = Query(None, description="종료일 (YYYY-MM-DD, 포함)")
+) -> dict:
+    """범위/요약 키워드별 견적 건수와 평균 금액"""
+    if not q.strip():
+        raise HTTPException(status_code=400, detail="검색어를 입력해야 합니다.")
+    return HistoryService().keyword_stats(q, since, until)
+
+
+@router.get("/quote/{quote_id}", response_model=QuoteDetail)
+def get_quote(quote_id: str) -> QuoteDetail:
+    """견적서 상세 조회 (원장 기록)"""
+    if not QUOTE_ID_PATTERN.match(quote_id):
+        raise HTTPException(status_code=400, detail="잘못된 견적서 ID입니다.")
+    
+    quote = HistoryService().get_quote(quote_id)
+    if quote is None:
+        raise HTTPException(status_code=404, detail="견적서를 찾을 수 없습니다.")
+    
+    return QuoteDetail(pdf_url=f"/quote/{quote_id}/pdf", **quote)
+
+
+@router.post("/quotes/export")
+async def export_quotes(request: ExportRequest) -> StreamingResponse:
+    """
+    다건 견적서 내보내기
+    
+    - format=pdf: 목차와 북마크가 포함된 단일 병합 PDF
+    - format=zip: 개별 PDF를 묶은 ZIP (렌더링 순서대로 스트리밍)
+    
+    렌더링은 프로세스 풀에서 병렬로 수행되며, 동시에 처리 중인 건수를
+    제한하여 메모리 사용량을 일정하게 유지합니다.
+    """
+    if len(request.items) > settings.EXPORT_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"한 번에 최대 {settings.EXPORT_MAX_ITEMS}건까지 내보낼 수 있습니다."
+        )
+    
+    items = [(item.client_name.strip(), item.quote_json) for item in request.items]
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    service = ExportService()
+    logger.info(f"견적서 내보내기 요청: {len(items)}건 ({request.format})")
+    
+    if request.format == "zip":
+        filenames = [
+            os.path.basename(item.filename) if item.filename else f"quote_{i + 1:04d}.pdf"
+            for i, item in enumerate(request.items)
+        ]
+        return StreamingResponse(
+            service.iter_zip(items, filenames),
+            media_type="application/zip",
+            headers={"Content-Disposition": f'attachment; filename="quotes_{timestamp}.zip"'}
+        )
+    
+    if not PYPDF_AVAILABLE:
+        raise HTTPException(status_code=501, detail="병합 PDF 내보내기에는 pypdf 패키지가 필요합니다.")
+    
+    return StreamingResponse(
+        service.iter_merged_pdf(items),
+        media_type="application/pdf",
+        headers={"Content-Disposition": f'attachment; filename="quotes_{timestamp}.pdf"'}
+    )
+
+
+def _require_profile_admin(request: Request) -> None:
+    """프로파일 API 인증 (X-Admin-Token == PROFILE_ADMIN_TOKEN)"""
+    if not settings.PROFILE_ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="PROFILE_ADMIN_TOKEN이 설정되지 않았습니다.")
+    token = request.headers.get("x-admin-token", "")
+    if not hmac.compare_digest(token.encode(), settings.PROFILE_ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=403, detail="관리자 토큰이 올바르지 않습니다.")
+
+
+@router.get("/profiles")
+def get_profiles(
+    request: Request,
+    limit: int = Query(50, ge=1, le=settings.PROFILE_MAX_FILES)
+) -> dict:
+    """프로파일링 설정과 저장된 프로파일 목록 (최신순)"""
+    _require_profile_admin(request)
+    return {"config": get_profiling_config(), "profiles": list_profiles(limit)}
+
+
+@router.put("/profiles/config")
+def update_profiling_config(config: ProfilingConfigRequest, request: Request) -> dict:
+    """
+    프로파일링 설정 변경
+    
+    enabled는 X-Profile 헤더 허용 여부, sample_rate는 헤더 없이 프로파일링할
+    요청 비율입니다. 변경 내용은 재시작 시 환경변수 값으로 돌아갑니다.
+    """
+    _require_profile_admin(request)
+    return set_profiling_config(enabled=config.enabled, sample_rate=config.sample_rate)
+
+
+@router.get("/profiles/{profile_id}")
+def get_profile_detail(profile_id: str, request: Request) -> dict:
+    """프로파일 요약 (단계별 소요 시간 포함)"""
+    _require_profile_admin(request)
+    if not PROFILE_ID_PATTERN.match(profile_id):
+        raise HTTPException(status_code=400, detail="잘못된 프로파일 ID입니다.")
+    
+    profile = get_profile(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다.")
+    return profile
+
+
+@router.get("/profiles/{profile_id}/{kind}")
+async def download_profile(profile_id: str, kind: str, request: Request) -> Response:
+    """
+    프로파일 결과 다운로드
+    
+    - pstats: cProfile 결과 (python -m pstats, snakeviz 등)
+    - collapsed: 스택 샘플 (flamegraph.pl, speedscope 등)
+    """
+    _require_profile_admin(request)
+    if not PROFILE_ID_PATTERN.match(profile_id) or kind not in PROFILE_FILES:
+        raise HTTPException(status_code=400, detail="잘못된 프로파일 요청입니다.")
+    
+    path = profile_file_path(profile_id, kind)
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다.")
+    
+    return file_response(
+        request,
+        path,
+        media_type="text/plain" if kind == "collapsed" else "application/octet-stream",
+        filename=os.path.basename(path)
+    )
@@ -2,7 +2,7 @@
 설정 관리 모듈
 """
 import os
-from typing import Optional
+from typing import List, Optional
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -16,11 +16,58 @@ class Settings:
     API_VERSION: str = "1.0.0"
     API_HOST: str = os.getenv("API_HOST", "0.0.0.0")
     API_PORT: int = int(os.getenv("API_PORT", "8000"))
+    # 시작 후 백그라운드에서 무거운 의존성(crewai, reportlab 폰트 등) 미리 로드
+    WARMUP_ON_STARTUP: bool = os.getenv("WARMUP_ON_STARTUP", "true").lower() == "true"
+    # 워커 프로세스 수 (1: 단일 프로세스), 요청 처리 제한 시간(초, gunicorn)
+    API_WORKERS: int = int(os.getenv("API_WORKERS", "1"))
+    WORKER_TIMEOUT: int = int(os.getenv("WORKER_TIMEOUT", "600"))
+    # CORS 허용 출처 (쉼표로 구분, 비우면 CORS 미들웨어 사용 안 함)
+    CORS_ALLOW_ORIGINS: List[str] = [
+        origin.strip() for origin in os.getenv("CORS_ALLOW_ORIGINS", "*").split(",") if origin.strip()
+    ]
+    # 견적 요청 처리 기한(초, X-Request-Timeout 헤더의 최대값, 0이면 제한 없음)
+    QUOTE_DEADLINE_SECONDS: float = float(os.getenv("QUOTE_DEADLINE_SECONDS", "300"))
+    # 단계별 최대 동시 실행 수(LLM Task, PDF 렌더링)와 우선순위 클래스별 가중치
+    LLM_CONCURRENCY: int = int(os.getenv("LLM_CONCURRENCY", "4"))
+    PDF_CONCURRENCY: int = int(os.getenv("PDF_CONCURRENCY", "2"))
+    SCHEDULER_WEIGHTS: str = os.getenv("SCHEDULER_WEIGHTS", "interactive=8,revision=4,batch=1")
+    # 이 시간(초) 이상 기다린 요청은 우선순위와 관계없이 먼저 처리 (기아 방지)
+    SCHEDULER_MAX_WAIT: float = float(os.getenv("SCHEDULER_MAX_WAIT", "30"))
+    # LLM 동시 실행 수 자동 조절 (LLM_CONCURRENCY에서 시작, 응답 시간/429에 따라 증감)
+    LLM_ADAPTIVE_CONCURRENCY: bool = os.getenv("LLM_ADAPTIVE_CONCURRENCY", "true").lower() == "true"
+    LLM_MIN_CONCURRENCY: int = int(os.getenv("LLM_MIN_CONCURRENCY", "1"))
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+    # 응답 시간이 평소의 이 배수를 넘으면 과부하로 보고 동시 실행 수를 LLM_LIMIT_BACKOFF배로 줄임
+    LLM_LATENCY_TOLERANCE: float = float(os.getenv("LLM_LATENCY_TOLERANCE", "1.5"))
+    LLM_LIMIT_BACKOFF: float = float(os.getenv("LLM_LIMIT_BACKOFF", "0.7"))
+    # 분당 토큰 예산(0이면 제한 없음)과 측정 전 Task당 토큰 추정치
+    LLM_TOKENS_PER_MINUTE: int = int(os.getenv("LLM_TOKENS_PER_MINUTE", "0"))
+    LLM_TOKENS_PER_TASK: int = int(os.getenv("LLM_TOKENS_PER_TASK", "2000"))
+    
+    # 로깅 설정
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text")  # text | json
+    LOG_FILE: Optional[str] = os.getenv("LOG_FILE") or None
+    # CrewAI verbose trace를 수집할 요청 비율 (0: 수집 안 함, 1: 전체)
+    AGENT_TRACE_SAMPLE_RATE: float = float(os.getenv("AGENT_TRACE_SAMPLE_RATE", "0"))
+    
+    # 요청 프로파일링 설정 (X-Profile 헤더 허용 여부, 헤더 없이 프로파일링할 요청 비율)
+    PROFILE_ENABLED: bool = os.getenv("PROFILE_ENABLED", "false").lower() == "true"
+    PROFILE_SAMPLE_RATE: float = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+    PROFILE_SAMPLE_INTERVAL_MS: float = float(os.getenv("PROFILE_SAMPLE_INTERVAL_MS", "5"))
+    PROFILE_MAX_FILES: int = int(os.getenv("PROFILE_MAX_FILES", "100"))
+    # /profiles API 인증 토큰 (미설정 시 API 비활성화)
+    PROFILE_ADMIN_TOKEN: Optional[str] = os.getenv("PROFILE_ADMIN_TOKEN") or None
     
     # CrewAI 설정
     OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
     VAT_RATE: float = float(os.getenv("VAT_RATE", "0.1"))
     MIN_SUBTOTAL_KRW: int = int(os.getenv("MIN_SUBTOTAL_KRW", "500000"))
+    # 요청 유형별 견적서 템플릿 사용 여부, 표준 요청은 LLM 없이 템플릿으로 생성
+    QUOTE_TEMPLATES_ENABLED: bool = os.getenv("QUOTE_TEMPLATES_ENABLED", "true").lower() == "true"
+    QUOTE_TEMPLATE_DIRECT: bool = os.getenv("QUOTE_TEMPLATE_DIRECT", "true").lower() == "true"
+    # 템플릿만으로 처리할 요청사항의 최대 길이(자, 길면 CrewAI가 템플릿을 보완)
+    QUOTE_TEMPLATE_DIRECT_MAX_CHARS: int = int(os.getenv("QUOTE_TEMPLATE_DIRECT_MAX_CHARS", "200"))
     
     # 이메일 설정
     SMTP_SERVER: str = os.getenv("SMTP_SERVER", "smtp.gmail.com")
@@ -28,6 +75,10 @@ class Settings:
     SENDER_EMAIL: Optional[str] = os.getenv("SENDER_EMAIL")
     SENDER_PASSWORD: Optional[str] = os.getenv("SENDER_PASSWORD")
     SENDER_NAME: str = os.getenv("SENDER_NAME", "Quote Agent")
+    SMTP_USE_STARTTLS: bool = os.getenv("SMTP_USE_STARTTLS", "true").lower() == "true"
+    SMTP_TIMEOUT: float = float(os.getenv("SMTP_TIMEOUT", "30"))
+    SMTP_POOL_SIZE: int = int(os.getenv("SMTP_POOL_SIZE", "4"))
+    SMTP_POOL_IDLE_TIMEOUT: float = float(os.getenv("SMTP_POOL_IDLE_TIMEOUT", "60"))
     
     # Google Sheets 설정
     GOOGLE_SHEET_ID: Optional[str] = os.getenv("GOOGLE_SHEET_ID")
@@ -35,10 +86,51 @@ class Settings:
         "GOOGLE_SERVICE_ACCOUNT_FILE", 
         "service_account.json"
     )
+    SHEETS_BATCH_SIZE: int = int(os.getenv("SHEETS_BATCH_SIZE", "50"))
+    SHEETS_FLUSH_INTERVAL: float = float(os.getenv("SHEETS_FLUSH_INTERVAL", "5"))
+    SHEETS_HEADER_TTL: float = float(os.getenv("SHEETS_HEADER_TTL", "300"))
+    SHEETS_MAX_BUFFER: int = int(os.getenv("SHEETS_MAX_BUFFER", "10000"))
+    SHEETS_MAX_BACKOFF: float = float(os.getenv("SHEETS_MAX_BACKOFF", "300"))
+    SHEETS_WRITE_TIMEOUT: float = float(os.getenv("SHEETS_WRITE_TIMEOUT", "120"))
     
     # 출력 디렉토리
     OUTPUT_DIR: str = os.getenv("OUTPUT_DIR", "output")
     PROPOSALS_DIR: str = os.path.join(OUTPUT_DIR, "proposals")
+    PROFILE_DIR: str = os.getenv("PROFILE_DIR", os.path.join(OUTPUT_DIR, "profiles"))
+    
+    # 견적서 원장 설정
+    LEDGER_DB_PATH: str = os.getenv("LEDGER_DB_PATH", os.path.join(OUTPUT_DIR, "quotes.db"))
+    HISTORY_PAGE_SIZE: int = int(os.getenv("HISTORY_PAGE_SIZE", "20"))
+    HISTORY_MAX_PAGE_SIZE: int = int(os.getenv("HISTORY_MAX_PAGE_SIZE", "100"))
+    
+    # 중복 견적 요청 제거 (워커 간 공유, 0이면 사용 안 함)
+    DEDUP_DB_PATH: str = os.getenv("DEDUP_DB_PATH", os.path.join(OUTPUT_DIR, "dedup.db"))
+    QUOTE_DEDUP_TTL: float = float(os.getenv("QUOTE_DEDUP_TTL", "600"))
+    QUOTE_DEDUP_WAIT: float = float(os.getenv("QUOTE_DEDUP_WAIT", "600"))
+    QUOTE_DEDUP_POLL_INTERVAL: float = float(os.getenv("QUOTE_DEDUP_POLL_INTERVAL", "0.5"))
+    
+    # 메일 발송 큐 설정
+    MAIL_SPOOL_DIR: str = os.getenv("MAIL_SPOOL_DIR", os.path.join(OUTPUT_DIR, "mail_spool"))
+    MAIL_QUEUE_WORKERS: int = int(os.getenv("MAIL_QUEUE_WORKERS", "2"))
+    MAIL_MAX_ATTEMPTS: int = int(os.getenv("MAIL_MAX_ATTEMPTS", "8"))
+    MAIL_RETRY_BASE_DELAY: float = float(os.getenv("MAIL_RETRY_BASE_DELAY", "30"))
+    MAIL_RETRY_MAX_DELAY: float = float(os.getenv("MAIL_RETRY_MAX_DELAY", "3600"))
+    MAIL_QUEUE_POLL_INTERVAL: float = float(os.getenv("MAIL_QUEUE_POLL_INTERVAL", "1.0"))
+    MAIL_SENDING_STALE_SECONDS: float = float(os.getenv("MAIL_SENDING_STALE_SECONDS", "600"))
+    MAIL_SENT_RETENTION_SECONDS: float = float(os.getenv("MAIL_SENT_RETENTION_SECONDS", str(7 * 24 * 3600)))
+    MAIL_DEAD_RETENTION_SECONDS: float = float(os.getenv("MAIL_DEAD_RETENTION_SECONDS", str(30 * 24 * 3600)))
+    MAIL_PRUNE_INTERVAL: float = float(os.getenv("MAIL_PRUNE_INTERVAL", "3600"))
+    MAIL_ATTACHMENT_CACHE_DIR: str = os.getenv("MAIL_ATTACHMENT_CACHE_DIR", os.path.join(OUTPUT_DIR, "mail_cache"))
+    MAIL_ATTACHMENT_CACHE_TTL: float = float(os.getenv("MAIL_ATTACHMENT_CACHE_TTL", str(24 * 3600)))
+    MAIL_STREAM_CHUNK_SIZE: int = int(os.getenv("MAIL_STREAM_CHUNK_SIZE", str(64 * 1024)))
+    
+    # PDF 다운로드 설정
+    PDF_CHUNK_SIZE: int = int(os.getenv("PDF_CHUNK_SIZE", str(64 * 1024)))
+    PDF_CACHE_MAX_AGE: int = int(os.getenv("PDF_CACHE_MAX_AGE", str(365 * 24 * 3600)))
+    
+    # 다건 내보내기 설정
+    EXPORT_MAX_WORKERS: int = int(os.getenv("EXPORT_MAX_WORKERS", str(os.cpu_count() or 2)))
+    EXPORT_MAX_ITEMS: int = int(os.getenv("EXPORT_MAX_ITEMS", "1000"))
     
     @classmethod
     def validate(cls) -> None:
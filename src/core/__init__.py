@@ -1,4 +1,5 @@
 """코어 모듈"""
-from .quote_generator import QuoteGenerator, generate_quote_json
+from .quote_generator import QuoteGenerator, generate_quote, generate_quote_json
+from .quote_model import Pricing, Quote
 
-__all__ = ["QuoteGenerator", "generate_quote_json"]
+__all__ = ["QuoteGenerator", "generate_quote", "generate_quote_json", "Pricing", "Quote"]
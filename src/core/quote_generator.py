@@ -1,12 +1,48 @@
 """
 CrewAI 기반 견적서 생성 로직
 """
-import json
-from typing import Dict, Any, Optional
-from crewai import Agent, Task, Crew
+from typing import TYPE_CHECKING, Dict, Any, Optional
 
 from src.config import settings
-from src.utils.logger import logger
+from src.core.quote_model import Pricing, Quote
+from src.core.quote_templates import Classification, classify_request
+from src.utils.deadline import DeadlineExceeded, check_deadline
+from src.utils.llm_limiter import llm_call
+from src.utils.logger import capture_agent_trace, logger, sample_agent_trace
+from src.utils.metrics import CREW_TASK_SECONDS, QUOTE_FALLBACKS, QUOTE_TEMPLATES
+from src.utils.profiling import profile_stage
+
+if TYPE_CHECKING:
+    # crewai(langchain, openai 포함)는 import 비용이 커서 첫 견적 생성 시 불러옴
+    from crewai import Agent
+
+_timed_task_class = None
+
+
+def _get_timed_task_class():
+    """
+    실행 시간을 메트릭으로 기록하는 crewai Task 하위 클래스 (지연 생성)
+    
+    설치된 crewai의 Task에는 완료 콜백이 없어 execute를 감싸 Task(에이전트)별
+    소요 시간을 기록합니다. 프로파일링 중인 요청이면 단계(crew.<task>)로도 남기며,
+    요청의 처리 기한이 지났으면 Task(LLM 호출)를 시작하지 않습니다. LLM 동시 실행
+    자리는 요청의 우선순위에 따라 스케줄러(llm)에서 배정받으며, 동시 실행 수와
+    분당 토큰 예산은 llm_limiter가 관리합니다.
+    """
+    global _timed_task_class
+    if _timed_task_class is None:
+        from crewai import Task
+        
+        class TimedTask(Task):
+            metric_task: str = "task"
+            
+            def execute(self, *args, **kwargs):
+                check_deadline(f"crew.{self.metric_task}")
+                with llm_call(self.metric_task), CREW_TASK_SECONDS.time(task=self.metric_task), profile_stage(f"crew.{self.metric_task}"):
+                    return super().execute(*args, **kwargs)
+        
+        _timed_task_class = TimedTask
+    return _timed_task_class
 
 
 class QuoteGenerator:
@@ -17,44 +53,50 @@ class QuoteGenerator:
         self.vat_rate = settings.VAT_RATE
         self.min_subtotal = settings.MIN_SUBTOTAL_KRW
     
-    def _create_scope_analyst(self) -> Agent:
+    def _create_scope_analyst(self, verbose: bool = False) -> "Agent":
         """범위 분석 Agent 생성"""
+        from crewai import Agent
+        
         return Agent(
             role="프로젝트 범위 분석가",
             goal="고객 요청사항을 구체적인 작업 범위, 산출물, 마일스톤으로 분해합니다.",
             backstory="""당신은 10년 이상의 경험을 가진 프로젝트 매니저입니다.
             고객의 요구사항을 정확히 이해하고, 구체적이고 측정 가능한 작업 항목으로 분해하는 것이 전문 분야입니다.
             항상 명확하고 실무적인 범위 정의를 제공합니다.""",
-            verbose=True,
+            verbose=verbose,
             allow_delegation=False
         )
     
-    def _create_estimator(self) -> Agent:
+    def _create_estimator(self, verbose: bool = False) -> "Agent":
         """견적 산출 Agent 생성"""
+        from crewai import Agent
+        
         return Agent(
             role="견적 산출 전문가",
             goal="작업 범위를 기반으로 현실적인 일정과 금액을 산출합니다.",
             backstory="""당신은 IT 프로젝트 견적 전문가입니다.
             작업 범위를 분석하여 적정한 일정과 공정한 가격을 제시합니다.
             최소 공급가와 VAT를 고려하여 정확한 견적을 산출합니다.""",
-            verbose=True,
+            verbose=verbose,
             allow_delegation=False
         )
     
-    def _create_proposal_writer(self) -> Agent:
+    def _create_proposal_writer(self, verbose: bool = False) -> "Agent":
         """견적서 작성 Agent 생성"""
+        from crewai import Agent
+        
         return Agent(
             role="견적서 작성 전문가",
             goal="바로 고객에게 보내도 되는 전문적인 견적서를 작성합니다.",
             backstory="""당신은 비즈니스 문서 작성 전문가입니다.
             명확하고 전문적인 문구로 견적서를 작성하며, 면책 문구를 적절히 포함합니다.
             마케팅 문구보다는 실무 문서 톤을 유지합니다.""",
-            verbose=True,
+            verbose=verbose,
             allow_delegation=False
         )
     
-    def _extract_json_from_result(self, result_str: str) -> Optional[Dict[str, Any]]:
-        """결과 문자열에서 JSON 추출"""
+    def _extract_json_from_result(self, result_str: str) -> Optional[Quote]:
+        """결과 문자열에서 견적서 JSON 추출 및 검증"""
         try:
             # JSON 코드 블록에서 추출 시도
             if "```json" in result_str:
@@ -71,18 +113,14 @@ class QuoteGenerator:
                 json_end = result_str.rfind("}") + 1
                 json_str = result_str[json_start:json_end]
             
-            return json.loads(json_str)
-        except (json.JSONDecodeError, ValueError) as e:
+            return Quote.from_json(json_str)
+        except ValueError as e:
             logger.error(f"JSON 추출 실패: {e}")
             return None
     
-    def _validate_and_adjust_pricing(self, quote_json: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_and_adjust_pricing(self, quote: Quote) -> Quote:
         """견적 가격 검증 및 조정"""
-        if "pricing" not in quote_json:
-            quote_json["pricing"] = {}
-        
-        pricing = quote_json["pricing"]
-        subtotal = pricing.get("subtotal", 0)
+        subtotal = quote.pricing.subtotal
         
         # 최소 공급가 검증
         if subtotal < self.min_subtotal:
@@ -92,82 +130,127 @@ class QuoteGenerator:
         vat = int(subtotal * self.vat_rate)
         total = subtotal + vat
         
-        quote_json["pricing"] = {
-            "subtotal": subtotal,
-            "vat": vat,
-            "total": total,
-            "currency": "KRW"
-        }
+        quote.pricing = Pricing(subtotal, vat, total, "KRW")
         
-        return quote_json
+        return quote
+    
+    def _classify(self, customer_request: str) -> Optional[Classification]:
+        """요청 유형 분류 (템플릿 사용이 꺼져 있으면 None)"""
+        if not settings.QUOTE_TEMPLATES_ENABLED:
+            return None
+        classification = classify_request(customer_request)
+        if classification is None:
+            QUOTE_TEMPLATES.inc(category="none", mode="crew")
+        else:
+            QUOTE_TEMPLATES.inc(category=classification.template.category, mode=classification.mode)
+        return classification
+    
+    def _template_context(self, classification: Optional[Classification], customer_request: str) -> str:
+        """템플릿 기반 Task 설명 머리말 (템플릿이 없으면 빈 문자열)"""
+        if classification is None:
+            return ""
+        return f"""
+                고객 요청사항: {customer_request}
+                
+                다음은 {classification.template.label} 프로젝트의 표준 견적 섹션입니다.
+                작업 범위 분석 결과로 사용하되, 요청사항과 다른 부분만 추가/수정하세요:
+                {classification.sections_json()}
+                
+                기준 공급가: {classification.subtotal:,}원, 기준 일정: {classification.delivery_days}일
+                """
     
-    def _get_default_quote(self, client_name: str) -> Dict[str, Any]:
+    def _get_default_quote(self, client_name: str) -> Quote:
         """기본 견적서 반환"""
-        return {
-            "project_summary": "요청사항을 바탕으로 한 프로젝트 견적입니다.",
-            "scope": ["요청사항 분석", "기술 검토", "구현 작업"],
-            "deliverables": ["최종 산출물"],
-            "milestones": ["요구사항 확정", "개발 완료", "납품"],
-            "assumptions": ["기존 인프라 활용 가능", "고객 협조 가능"],
-            "exclusions": ["추가 요구사항", "유지보수"],
-            "risks": ["범위 변경 가능성", "일정 지연 가능성"],
-            "disclaimer": "본 견적은 참고용이며 범위 확정 시 조정될 수 있습니다. 최종 계약 시 상세 범위를 재확인하여 견적이 변경될 수 있습니다.",
-            "delivery_days": 30,
-            "pricing": {
-                "subtotal": self.min_subtotal,
-                "vat": int(self.min_subtotal * self.vat_rate),
-                "total": int(self.min_subtotal * (1 + self.vat_rate)),
-                "currency": "KRW"
-            }
-        }
+        return Quote(
+            project_summary="요청사항을 바탕으로 한 프로젝트 견적입니다.",
+            scope=("요청사항 분석", "기술 검토", "구현 작업"),
+            deliverables=("최종 산출물",),
+            milestones=("요구사항 확정", "개발 완료", "납품"),
+            assumptions=("기존 인프라 활용 가능", "고객 협조 가능"),
+            exclusions=("추가 요구사항", "유지보수"),
+            risks=("범위 변경 가능성", "일정 지연 가능성"),
+            disclaimer="본 견적은 참고용이며 범위 확정 시 조정될 수 있습니다. 최종 계약 시 상세 범위를 재확인하여 견적이 변경될 수 있습니다.",
+            delivery_days=30,
+            pricing=Pricing(
+                subtotal=self.min_subtotal,
+                vat=int(self.min_subtotal * self.vat_rate),
+                total=int(self.min_subtotal * (1 + self.vat_rate)),
+                currency="KRW"
+            )
+        )
     
     def generate(
         self,
         client_name: str,
         customer_request: str
-    ) -> Dict[str, Any]:
+    ) -> Quote:
         """
-        견적서 JSON 생성
+        견적서 생성
+        
+        요청사항이 표준 유형(홈페이지, 쇼핑몰 등)이면 유형별 템플릿으로 바로 만들고,
+        해당 유형이지만 특수 요구가 있으면 템플릿을 범위 분석 결과로 사용해
+        범위 분석 Task를 생략합니다.
         
         Args:
             client_name: 고객명
             customer_request: 고객 요청사항
         
         Returns:
-            견적서 JSON 딕셔너리
+            검증된 견적서
         """
         logger.info("견적서 생성 시작")
         
         try:
+            classification = self._classify(customer_request)
+            if classification is not None and classification.direct:
+                logger.info(f"표준 요청({classification.template.label}), 템플릿으로 견적서 생성")
+                quote = self._validate_and_adjust_pricing(classification.build_quote(customer_request))
+                logger.info("견적서 생성 완료")
+                return quote
+            
+            check_deadline("crew")
+            from crewai import Crew
+            Task = _get_timed_task_class()
+            
+            # verbose trace는 샘플링된 요청만 수집 (stdout 대신 로그 큐로 기록)
+            verbose = sample_agent_trace()
+            
             # Agent 생성
-            scope_analyst = self._create_scope_analyst()
-            estimator = self._create_estimator()
-            proposal_writer = self._create_proposal_writer()
+            estimator = self._create_estimator(verbose)
+            proposal_writer = self._create_proposal_writer(verbose)
             
-            # Task 생성
-            scope_task = Task(
-                description=f"""
-                다음 고객 요청사항을 분석하여 작업 범위를 정의하세요:
-                
-                요청사항: {customer_request}
-                
-                다음 항목들을 JSON 형식으로 정리하세요:
-                - scope: 작업 범위 배열 (구체적인 작업 항목들)
-                - deliverables: 산출물 배열 (최종 결과물들)
-                - milestones: 마일스톤 배열 (주요 단계별 완료 시점)
-                - assumptions: 가정사항 배열 (전제 조건들)
-                - exclusions: 제외 사항 배열 (포함되지 않는 작업들)
-                - risks: 리스크 배열 (잠재적 위험 요소들)
-                
-                각 항목은 구체적이고 실무적으로 작성하세요.
-                project_summary에는 고객명을 포함하지 말고 요청 내용 요약만 작성하세요.
-                """,
-                agent=scope_analyst,
-                expected_output="작업 범위, 산출물, 마일스톤, 가정사항, 제외사항, 리스크가 포함된 JSON 형식의 분석 결과"
-            )
+            # Task 생성 (템플릿이 있으면 범위 분석 대신 템플릿 사용)
+            template_context = self._template_context(classification, customer_request)
+            agents = [estimator, proposal_writer]
+            tasks = []
+            if classification is None:
+                scope_analyst = self._create_scope_analyst(verbose)
+                agents.insert(0, scope_analyst)
+                tasks.append(Task(
+                    metric_task="scope",
+                    description=f"""
+                    다음 고객 요청사항을 분석하여 작업 범위를 정의하세요:
+                    
+                    요청사항: {customer_request}
+                    
+                    다음 항목들을 JSON 형식으로 정리하세요:
+                    - scope: 작업 범위 배열 (구체적인 작업 항목들)
+                    - deliverables: 산출물 배열 (최종 결과물들)
+                    - milestones: 마일스톤 배열 (주요 단계별 완료 시점)
+                    - assumptions: 가정사항 배열 (전제 조건들)
+                    - exclusions: 제외 사항 배열 (포함되지 않는 작업들)
+                    - risks: 리스크 배열 (잠재적 위험 요소들)
+                    
+                    각 항목은 구체적이고 실무적으로 작성하세요.
+                    project_summary에는 고객명을 포함하지 말고 요청 내용 요약만 작성하세요.
+                    """,
+                    agent=scope_analyst,
+                    expected_output="작업 범위, 산출물, 마일스톤, 가정사항, 제외사항, 리스크가 포함된 JSON 형식의 분석 결과"
+                ))
             
             estimate_task = Task(
-                description=f"""
+                metric_task="estimate",
+                description=f"""{template_context}
                 작업 범위 분석 결과를 바탕으로 견적을 산출하세요.
                 
                 다음 사항을 반드시 준수하세요:
@@ -183,7 +266,8 @@ class QuoteGenerator:
             )
             
             proposal_task = Task(
-                description=f"""
+                metric_task="proposal",
+                description=f"""{template_context}
                 분석 결과와 견적 산출 결과를 종합하여 최종 견적서를 작성하세요.
                 
                 다음 JSON 스키마를 정확히 준수하여 작성하세요:
@@ -214,34 +298,55 @@ class QuoteGenerator:
             )
             
             # Crew 구성 및 실행
-            crew = Crew(
-                agents=[scope_analyst, estimator, proposal_writer],
-                tasks=[scope_task, estimate_task, proposal_task],
-                verbose=True
-            )
+            tasks += [estimate_task, proposal_task]
+            crew = Crew(agents=agents, tasks=tasks, verbose=verbose)
             
             logger.info("CrewAI 실행 중...")
-            result = crew.kickoff()
+            if verbose:
+                with capture_agent_trace():
+                    result = crew.kickoff()
+            else:
+                result = crew.kickoff()
             
             # 결과에서 JSON 추출
             result_str = str(result)
-            quote_json = self._extract_json_from_result(result_str)
+            quote = self._extract_json_from_result(result_str)
             
-            if quote_json is None:
+            if quote is None:
                 logger.warning("JSON 추출 실패, 기본 견적서 사용")
-                quote_json = self._get_default_quote(client_name)
+                QUOTE_FALLBACKS.inc(reason="json_extract")
+                quote = self._get_default_quote(client_name)
             else:
                 # 가격 검증 및 조정
-                quote_json = self._validate_and_adjust_pricing(quote_json)
+                quote = self._validate_and_adjust_pricing(quote)
             
             logger.info("견적서 생성 완료")
-            return quote_json
-            
+            return quote
+        
+        except DeadlineExceeded:
+            # 기한이 지난 요청에는 기본 견적서도 만들지 않음
+            raise
         except Exception as e:
             logger.error(f"견적서 생성 중 오류 발생: {e}", exc_info=True)
+            QUOTE_FALLBACKS.inc(reason="error")
             return self._get_default_quote(client_name)
 
 
+def generate_quote(client_name: str, customer_request: str) -> Quote:
+    """
+    견적서 생성
+    
+    Args:
+        client_name: 고객명
+        customer_request: 고객 요청사항
+    
+    Returns:
+        검증된 견적서
+    """
+    generator = QuoteGenerator()
+    return generator.generate(client_name, customer_request)
+
+
 def generate_quote_json(client_name: str, customer_request: str) -> Dict[str, Any]:
     """
     견적서 JSON 생성 (호환성 함수)
@@ -253,5 +358,4 @@ def generate_quote_json(client_name: str, customer_request: str) -> Dict[str, An
     Returns:
         견적서 JSON 딕셔너리
     """
-    generator = QuoteGenerator()
-    return generator.generate(client_name, customer_request)
+    return generate_quote(client_name, customer_request).to_dict()
@@ -0,0 +1,214 @@
+"""
+견적서 데이터 모델
+
+LLM 출력, API 요청, 원장(SQLite) 등에서 들어온 견적서 딕셔너리를 한 번만
+검증/변환하여 Quote로 만들고, 이후 단계(가격 검증, PDF, 원장, Sheets)는 필드를
+그대로 사용합니다. __slots__와 튜플로 저장하여 견적서를 많이 들고 있는 일괄
+작업/캐시에서도 메모리 사용이 작고, JSON 변환은 미리 만든 인코더/디코더를
+재사용합니다.
+"""
+import json
+import re
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+DEFAULT_CURRENCY = "KRW"
+
+# 목록 섹션 (문자열 튜플)
+LIST_FIELDS = ("scope", "deliverables", "milestones", "assumptions", "exclusions", "risks")
+
+# JSON 필드 순서 (LLM 스키마와 동일)
+FIELDS = ("project_summary",) + LIST_FIELDS + ("disclaimer", "delivery_days", "pricing")
+
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_decoder = json.JSONDecoder()
+
+# "1,500,000원", "49일" 등에서 숫자 추출
+_NUMBER_PATTERN = re.compile(r"-?\d[\d,]*(?:\.\d+)?")
+
+
+def _to_text(value: Any) -> str:
+    """문자열 필드 변환 (None -> 빈 문자열)"""
+    if type(value) is str:
+        return value
+    return "" if value is None else str(value)
+
+
+def _to_items(value: Any) -> Tuple[str, ...]:
+    """목록 필드 변환 (문자열 하나는 한 항목, None/빈 값 제외)"""
+    if isinstance(value, (list, tuple)):
+        items = tuple(value)
+        # 대부분(LLM 출력, 원장)은 이미 비어 있지 않은 문자열 목록이므로 그대로 사용
+        for item in items:
+            if type(item) is not str or not item:
+                return tuple(_to_text(item) for item in items if item is not None and item != "")
+        return items
+    if value is None or value == "":
+        return ()
+    return (_to_text(value),)
+
+
+def _to_int(value: Any, default: int = 0) -> int:
+    """숫자 필드 변환 (숫자 문자열의 쉼표/단위 허용, 변환 불가 시 기본값)"""
+    if type(value) is int:
+        return value
+    try:
+        if isinstance(value, float):
+            return int(value)
+        if isinstance(value, str):
+            match = _NUMBER_PATTERN.search(value)
+            if match:
+                return int(float(match.group().replace(",", "")))
+    except (ValueError, OverflowError):
+        # NaN, inf
+        pass
+    return default
+
+
+class Pricing:
+    """견적 금액"""
+    
+    __slots__ = ("subtotal", "vat", "total", "currency")
+    
+    def __init__(self, subtotal: int = 0, vat: int = 0, total: int = 0, currency: str = DEFAULT_CURRENCY):
+        self.subtotal = subtotal
+        self.vat = vat
+        self.total = total
+        self.currency = currency
+    
+    @classmethod
+    def from_dict(cls, data: Any) -> "Pricing":
+        """딕셔너리에서 생성 (누락/잘못된 값은 0, 통화 기본값 KRW)"""
+        if not isinstance(data, dict):
+            return cls()
+        return cls(
+            _to_int(data.get("subtotal")),
+            _to_int(data.get("vat")),
+            _to_int(data.get("total")),
+            _to_text(data.get("currency")) or DEFAULT_CURRENCY
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 호환 딕셔너리"""
+        return {"subtotal": self.subtotal, "vat": self.vat, "total": self.total, "currency": self.currency}
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Pricing):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+    
+    def __repr__(self) -> str:
+        return f"Pricing(subtotal={self.subtotal}, vat={self.vat}, total={self.total}, currency={self.currency!r})"
+
+
+class Quote:
+    """
+    검증된 견적서
+    
+    목록 섹션은 문자열 튜플, delivery_days는 정수, pricing은 Pricing입니다.
+    딕셔너리가 필요한 곳(API 응답 등)에는 to_dict()를 사용합니다.
+    """
+    
+    __slots__ = FIELDS
+    
+    def __init__(
+        self,
+        project_summary: str = "",
+        scope: Iterable[str] = (),
+        deliverables: Iterable[str] = (),
+        milestones: Iterable[str] = (),
+        assumptions: Iterable[str] = (),
+        exclusions: Iterable[str] = (),
+        risks: Iterable[str] = (),
+        disclaimer: str = "",
+        delivery_days: int = 0,
+        pricing: Optional[Pricing] = None
+    ):
+        """
+        초기화 (값은 이미 검증된 것으로 보고 변환하지 않음, 외부 데이터는 from_dict 사용)
+        """
+        self.project_summary = project_summary
+        self.scope = tuple(scope)
+        self.deliverables = tuple(deliverables)
+        self.milestones = tuple(milestones)
+        self.assumptions = tuple(assumptions)
+        self.exclusions = tuple(exclusions)
+        self.risks = tuple(risks)
+        self.disclaimer = disclaimer
+        self.delivery_days = delivery_days
+        self.pricing = pricing if pricing is not None else Pricing()
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Quote":
+        """
+        견적서 딕셔너리 검증 및 변환
+        
+        누락된 필드는 기본값, 목록 필드의 문자열 하나는 한 항목, 숫자 필드의
+        "1,500,000원" 같은 문자열은 숫자로 변환합니다.
+        
+        Args:
+            data: 견적서 JSON 딕셔너리
+        
+        Returns:
+            Quote
+        """
+        if not isinstance(data, dict):
+            raise ValueError("견적서 JSON은 객체여야 합니다.")
+        quote = cls.__new__(cls)
+        quote.project_summary = _to_text(data.get("project_summary"))
+        for name in LIST_FIELDS:
+            setattr(quote, name, _to_items(data.get(name)))
+        quote.disclaimer = _to_text(data.get("disclaimer"))
+        quote.delivery_days = _to_int(data.get("delivery_days"))
+        quote.pricing = Pricing.from_dict(data.get("pricing"))
+        return quote
+    
+    @classmethod
+    def from_json(cls, text: str) -> "Quote":
+        """JSON 문자열에서 생성"""
+        return cls.from_dict(_decoder.decode(text))
+    
+    @classmethod
+    def coerce(cls, value: Union["Quote", Dict[str, Any]]) -> "Quote":
+        """Quote는 그대로, 딕셔너리는 검증하여 Quote로 변환"""
+        if isinstance(value, Quote):
+            return value
+        return cls.from_dict(value)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 호환 딕셔너리 (목록 필드는 리스트)"""
+        return {
+            "project_summary": self.project_summary,
+            "scope": list(self.scope),
+            "deliverables": list(self.deliverables),
+            "milestones": list(self.milestones),
+            "assumptions": list(self.assumptions),
+            "exclusions": list(self.exclusions),
+            "risks": list(self.risks),
+            "disclaimer": self.disclaimer,
+            "delivery_days": self.delivery_days,
+            "pricing": self.pricing.to_dict(),
+        }
+    
+    def to_json(self) -> str:
+        """JSON 문자열 (공백 없는 형식)"""
+        # 튜플은 JSON 배열로 직렬화되므로 리스트로 복사하지 않음
+        return _encoder.encode({
+            "project_summary": self.project_summary,
+            "scope": self.scope,
+            "deliverables": self.deliverables,
+            "milestones": self.milestones,
+            "assumptions": self.assumptions,
+            "exclusions": self.exclusions,
+            "risks": self.risks,
+            "disclaimer": self.disclaimer,
+            "delivery_days": self.delivery_days,
+            "pricing": self.pricing.to_dict(),
+        })
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Quote):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in FIELDS)
+    
+    def __repr__(self) -> str:
+        return f"Quote(project_summary={self.project_summary[:30]!r}, delivery_days={self.delivery_days}, pricing={self.pricing!r})"
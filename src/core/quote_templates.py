@@ -0,0 +1,341 @@
+"""
+견적 요청 유형 분류 및 유형별 견적서 템플릿
+
+자주 들어오는 프로젝트 유형(홈페이지, 쇼핑몰, 모바일 앱, 챗봇)은 작업 범위,
+가정/제외 사항, 리스크가 요청마다 거의 같으므로 미리 만든 섹션 템플릿을 사용합니다.
+
+- 표준 요청(한 유형만 해당, 특수 요구 없음): LLM 없이 템플릿으로 견적서 생성 (direct)
+- 그 외 해당 유형 요청: 템플릿을 범위 분석 결과로 넘겨 범위 분석 Task를 생략 (assisted)
+
+분류는 미리 컴파일한 키워드 정규식으로 수행하며 요청당 수십 마이크로초 수준입니다.
+"""
+import json
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.config import settings
+from src.core.quote_model import Pricing, Quote
+
+DISCLAIMER = "본 견적은 참고용이며 범위 확정 시 조정될 수 있습니다. 최종 계약 시 상세 범위를 재확인하여 견적이 변경될 수 있습니다."
+
+# 템플릿으로 처리하기 어려운 특수 요구 (포함되면 direct 대신 assisted)
+COMPLEX_KEYWORDS = (
+    "ERP", "블록체인", "마이그레이션", "레거시", "빅데이터", "대용량", "실시간",
+    "머신러닝", "딥러닝", "추천 알고리즘", "메타버스", "고도화", "리뉴얼"
+)
+
+# 분류 결과 모드
+MODE_DIRECT = "direct"
+MODE_ASSISTED = "assisted"
+
+
+def _keyword_pattern(keywords: Sequence[str]) -> "re.Pattern[str]":
+    """
+    키워드 목록 -> 대소문자 무시 정규식
+    
+    영문 키워드는 다른 영단어의 일부(jpg의 pg 등)와 맞지 않도록 앞뒤가 영문자가
+    아닌 경우만 찾습니다. (한글 조사가 바로 붙는 경우는 허용)
+    """
+    alternatives = []
+    for keyword in keywords:
+        escaped = re.escape(keyword)
+        if keyword.isascii():
+            escaped = f"(?<![A-Za-z]){escaped}(?![A-Za-z])"
+        alternatives.append(escaped)
+    return re.compile("|".join(alternatives), re.IGNORECASE)
+
+
+class QuoteAddon:
+    """요청에 언급되면 범위/금액/일정을 더하는 추가 기능"""
+    
+    def __init__(
+        self,
+        key: str,
+        keywords: Sequence[str],
+        scope_item: str,
+        subtotal: int,
+        days: int,
+        exclusion: Optional[str] = None
+    ):
+        """
+        초기화
+        
+        Args:
+            key: 추가 기능 식별자
+            keywords: 요청사항에서 찾을 키워드
+            scope_item: 작업 범위에 추가할 항목
+            subtotal: 추가 공급가(원)
+            days: 추가 일정(일)
+            exclusion: 이 기능이 포함되면 제외 사항에서 뺄 항목
+        """
+        self.key = key
+        self.pattern = _keyword_pattern(keywords)
+        self.scope_item = scope_item
+        self.subtotal = subtotal
+        self.days = days
+        self.exclusion = exclusion
+
+
+class QuoteTemplate:
+    """프로젝트 유형별 견적서 섹션 템플릿"""
+    
+    def __init__(
+        self,
+        category: str,
+        label: str,
+        keywords: Sequence[str],
+        summary: str,
+        scope: Sequence[str],
+        deliverables: Sequence[str],
+        milestones: Sequence[str],
+        assumptions: Sequence[str],
+        exclusions: Sequence[str],
+        risks: Sequence[str],
+        delivery_days: int,
+        subtotal: int,
+        included_addons: Sequence[str] = ()
+    ):
+        """
+        초기화
+        
+        Args:
+            category: 유형 식별자 (메트릭 라벨)
+            label: 유형 이름
+            keywords: 분류 키워드
+            summary: 프로젝트 개요 문장
+            scope ~ risks: 견적서 섹션 항목
+            delivery_days: 기본 일정(일)
+            subtotal: 기본 공급가(원)
+            included_addons: 기본 범위에 이미 포함된 추가 기능 key
+        """
+        self.category = category
+        self.label = label
+        self.pattern = _keyword_pattern(keywords)
+        self.summary = summary
+        self.sections: Dict[str, Tuple[str, ...]] = {
+            "scope": tuple(scope),
+            "deliverables": tuple(deliverables),
+            "milestones": tuple(milestones),
+            "assumptions": tuple(assumptions),
+            "exclusions": tuple(exclusions),
+            "risks": tuple(risks),
+        }
+        self.delivery_days = delivery_days
+        self.subtotal = subtotal
+        self.included_addons = frozenset(included_addons)
+        # CrewAI Task 설명에 넣을 섹션 JSON (요청마다 직렬화하지 않도록 미리 생성)
+        self.sections_json = json.dumps(
+            {name: list(items) for name, items in self.sections.items()},
+            ensure_ascii=False
+        )
+    
+    def score(self, text: str) -> int:
+        """요청사항에 포함된 서로 다른 키워드 수"""
+        return len({match.lower() for match in self.pattern.findall(text)})
+
+
+class Classification:
+    """요청 유형 분류 결과"""
+    
+    def __init__(self, template: QuoteTemplate, score: int, addons: List[QuoteAddon], mode: str):
+        self.template = template
+        self.score = score
+        self.addons = addons
+        self.mode = mode
+    
+    @property
+    def direct(self) -> bool:
+        """LLM 없이 템플릿으로 견적서를 만들 수 있는지"""
+        return self.mode == MODE_DIRECT
+    
+    @property
+    def subtotal(self) -> int:
+        """기본 공급가 + 추가 기능 공급가"""
+        return self.template.subtotal + sum(addon.subtotal for addon in self.addons)
+    
+    @property
+    def delivery_days(self) -> int:
+        """기본 일정 + 추가 기능 일정"""
+        return self.template.delivery_days + sum(addon.days for addon in self.addons)
+    
+    def sections(self) -> Dict[str, List[str]]:
+        """추가 기능을 반영한 섹션 항목 (새 리스트)"""
+        sections = {name: list(items) for name, items in self.template.sections.items()}
+        for addon in self.addons:
+            sections["scope"].append(addon.scope_item)
+            if addon.exclusion in sections["exclusions"]:
+                sections["exclusions"].remove(addon.exclusion)
+        return sections
+    
+    def sections_json(self) -> str:
+        """CrewAI Task 설명에 넣을 섹션 JSON"""
+        if not self.addons:
+            return self.template.sections_json
+        return json.dumps(self.sections(), ensure_ascii=False)
+    
+    def build_quote(self, customer_request: str) -> Quote:
+        """
+        템플릿으로 견적서 생성 (가격 검증 전, 공급가만 설정)
+        
+        Args:
+            customer_request: 고객 요청사항 (개요에 요약으로 포함)
+        
+        Returns:
+            견적서
+        """
+        request_summary = " ".join(customer_request.split())
+        if len(request_summary) > 120:
+            request_summary = request_summary[:120].rstrip() + "..."
+        return Quote(
+            project_summary=f"{self.template.summary} 요청 내용: {request_summary}",
+            disclaimer=DISCLAIMER,
+            delivery_days=self.delivery_days,
+            pricing=Pricing(subtotal=self.subtotal),
+            **self.sections()
+        )
+
+
+ADDONS: Tuple[QuoteAddon, ...] = (
+    QuoteAddon(
+        "admin", ("관리자 페이지", "관리자 기능", "어드민", "admin", "CMS"),
+        "관리자 페이지 개발 (콘텐츠/회원 관리)", 1_500_000, 7
+    ),
+    QuoteAddon(
+        "member", ("회원가입", "회원 가입", "로그인", "소셜 로그인"),
+        "회원가입/로그인 기능 개발 (소셜 로그인 포함)", 1_000_000, 5
+    ),
+    QuoteAddon(
+        "payment", ("결제", "PG"),
+        "결제(PG) 연동 및 결제 내역 관리", 1_500_000, 7, exclusion="결제(PG) 연동"
+    ),
+    QuoteAddon(
+        "reservation", ("예약",),
+        "예약 기능 개발 (일정 선택, 예약 확인/취소)", 1_200_000, 7
+    ),
+    QuoteAddon(
+        "multilingual", ("다국어", "영문", "영어 버전"),
+        "다국어(영문) 페이지 구성", 1_000_000, 5, exclusion="다국어 지원"
+    ),
+    QuoteAddon(
+        "push", ("푸시", "push"),
+        "푸시 알림 발송 기능", 800_000, 3
+    ),
+)
+
+TEMPLATES: Tuple[QuoteTemplate, ...] = (
+    QuoteTemplate(
+        category="homepage",
+        label="홈페이지",
+        keywords=("홈페이지", "웹사이트", "웹 사이트", "회사 소개", "기업 사이트", "랜딩 페이지", "랜딩페이지", "브랜드 사이트", "website", "landing"),
+        summary="반응형 홈페이지 구축 프로젝트로, 요구사항 분석부터 디자인, 퍼블리싱, 개발, 배포까지 포함합니다.",
+        scope=[
+            "요구사항 분석 및 정보 구조(사이트맵) 설계",
+            "메인/서브 페이지 UI 디자인",
+            "반응형 퍼블리싱 (PC/태블릿/모바일)",
+            "문의하기 폼 및 기본 기능 개발",
+            "배포 및 운영 환경 구성",
+        ],
+        deliverables=["사이트맵 및 화면 설계서", "디자인 시안", "소스 코드", "운영 가이드 문서"],
+        milestones=["요구사항 확정 (1주)", "디자인 완료 (2주)", "개발 완료 (4주)", "오픈 (5주)"],
+        assumptions=["콘텐츠(문구, 이미지)는 고객사 제공", "도메인 및 호스팅은 고객사 보유 환경 사용", "디자인 시안 수정은 2회 이내"],
+        exclusions=["다국어 지원", "유지보수", "SEO 컨설팅", "콘텐츠 제작(촬영, 카피라이팅)"],
+        risks=["콘텐츠 전달 지연 시 일정 지연", "디자인 확정 지연", "범위 추가 요청"],
+        delivery_days=35,
+        subtotal=4_000_000
+    ),
+    QuoteTemplate(
+        category="shopping_mall",
+        label="쇼핑몰",
+        keywords=("쇼핑몰", "온라인 스토어", "온라인 쇼핑", "이커머스", "e-commerce", "ecommerce", "커머스", "스마트스토어", "장바구니", "상품 판매"),
+        summary="온라인 쇼핑몰 구축 프로젝트로, 상품/주문/결제 기능과 관리자 페이지 개발을 포함합니다.",
+        scope=[
+            "요구사항 분석 및 화면 설계",
+            "쇼핑몰 UI 디자인 (메인, 상품 목록/상세, 장바구니, 주문)",
+            "상품 목록/상세, 장바구니, 주문 기능 개발",
+            "결제(PG) 연동 및 결제 내역 관리",
+            "관리자 페이지 개발 (상품, 주문, 회원 관리)",
+            "배포 및 운영 환경 구성",
+        ],
+        deliverables=["화면 설계서", "디자인 시안", "소스 코드", "관리자 매뉴얼"],
+        milestones=["요구사항 확정 (1주)", "디자인 완료 (3주)", "개발 완료 (7주)", "테스트 및 오픈 (8주)"],
+        assumptions=["PG사 계약 및 심사는 고객사 진행", "상품 정보/이미지는 고객사 제공", "디자인 시안 수정은 2회 이내"],
+        exclusions=["다국어 지원", "해외 결제", "ERP/물류 시스템 연동", "유지보수"],
+        risks=["PG 심사 지연에 따른 오픈 지연", "상품 데이터 이관 범위 증가", "범위 추가 요청"],
+        delivery_days=56,
+        subtotal=9_000_000,
+        included_addons=("admin", "payment", "member")
+    ),
+    QuoteTemplate(
+        category="mobile_app",
+        label="모바일 앱",
+        keywords=("모바일 앱", "모바일앱", "앱 개발", "어플", "안드로이드", "android", "ios", "아이폰", "플러터", "flutter", "react native", "앱스토어", "플레이스토어"),
+        summary="모바일 앱(Android/iOS) 개발 프로젝트로, 기획/디자인부터 앱 및 서버 개발, 스토어 출시까지 포함합니다.",
+        scope=[
+            "요구사항 분석 및 화면 설계",
+            "앱 UI/UX 디자인",
+            "크로스플랫폼 앱 개발 (Android/iOS)",
+            "API 서버 및 데이터베이스 개발",
+            "앱스토어/플레이스토어 출시 지원",
+        ],
+        deliverables=["화면 설계서", "디자인 시안", "앱 소스 코드", "서버 소스 코드", "스토어 등록 자료"],
+        milestones=["요구사항 확정 (2주)", "디자인 완료 (4주)", "개발 완료 (10주)", "테스트 및 출시 (12주)"],
+        assumptions=["개발자 계정(Apple/Google)은 고객사 준비", "서버는 고객사 클라우드 계정 사용", "디자인 시안 수정은 2회 이내"],
+        exclusions=["다국어 지원", "태블릿 전용 UI", "유지보수", "스토어 심사 거절 시 추가 기능 변경"],
+        risks=["스토어 심사 지연/반려", "OS 버전별 호환성 이슈", "범위 추가 요청"],
+        delivery_days=84,
+        subtotal=15_000_000
+    ),
+    QuoteTemplate(
+        category="chatbot",
+        label="챗봇",
+        keywords=("챗봇", "chatbot", "상담봇", "자동 응답", "자동응답", "카카오톡 채널", "카톡 채널", "AI 상담", "GPT"),
+        summary="AI 챗봇 구축 프로젝트로, 대화 시나리오 설계와 LLM 기반 응답, 채널 연동 및 관리 기능을 포함합니다.",
+        scope=[
+            "상담 시나리오 및 대화 흐름 설계",
+            "FAQ/문서 기반 응답 데이터 구성",
+            "LLM 기반 응답 생성 및 프롬프트 설계",
+            "채널 연동 (웹 위젯 또는 카카오톡 채널)",
+            "대화 로그 및 응답 관리 기능 개발",
+        ],
+        deliverables=["대화 시나리오 문서", "챗봇 소스 코드", "응답 데이터 관리 가이드"],
+        milestones=["요구사항 및 시나리오 확정 (1주)", "응답 데이터 구성 (3주)", "개발 및 채널 연동 (5주)", "테스트 및 오픈 (6주)"],
+        assumptions=["FAQ/상담 자료는 고객사 제공", "LLM API 사용료는 고객사 부담", "채널 계정은 고객사 준비"],
+        exclusions=["상담원 연결(콜센터) 시스템", "음성 인식", "다국어 지원", "유지보수"],
+        risks=["응답 품질 기준 합의 지연", "LLM API 정책/요금 변경", "상담 자료 부족 시 응답 정확도 저하"],
+        delivery_days=42,
+        subtotal=6_000_000
+    ),
+)
+
+_COMPLEX_PATTERN = _keyword_pattern(COMPLEX_KEYWORDS)
+
+
+def classify_request(customer_request: str) -> Optional[Classification]:
+    """
+    요청사항 유형 분류
+    
+    Args:
+        customer_request: 고객 요청사항
+    
+    Returns:
+        분류 결과, 해당 유형이 없거나 두 유형이 같은 정도로 해당하면 None
+    """
+    scores = [(template.score(customer_request), template) for template in TEMPLATES]
+    matched = sorted((item for item in scores if item[0] > 0), key=lambda item: item[0], reverse=True)
+    if not matched:
+        return None
+    score, template = matched[0]
+    if len(matched) > 1 and matched[1][0] == score:
+        return None
+    
+    addons = [
+        addon for addon in ADDONS
+        if addon.key not in template.included_addons and addon.pattern.search(customer_request)
+    ]
+    direct = (
+        settings.QUOTE_TEMPLATE_DIRECT
+        and len(matched) == 1
+        and len(customer_request) <= settings.QUOTE_TEMPLATE_DIRECT_MAX_CHARS
+        and _COMPLEX_PATTERN.search(customer_request) is None
+    )
+    return Classification(template, score, addons, MODE_DIRECT if direct else MODE_ASSISTED)
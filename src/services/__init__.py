@@ -1,13 +1,47 @@
-"""서비스 모듈"""
-from .pdf_service import PDFService, generate_pdf
-from .email_service import EmailService, send_email
-from .sheets_service import SheetsService, log_to_sheets
-
-__all__ = [
-    "PDFService",
-    "generate_pdf",
-    "EmailService",
-    "send_email",
-    "SheetsService",
-    "log_to_sheets"
-]
+"""서비스 모듈
+
+reportlab, gspread, pypdf 등 무거운 의존성을 앱 시작 시 불러오지 않도록
+각 이름은 처음 접근할 때 해당 모듈에서 가져옵니다.
+"""
+import importlib
+from typing import Any
+
+# 공개 이름 -> 정의 모듈
+_EXPORTS = {
+    "PDFService": ".pdf_service",
+    "generate_pdf": ".pdf_service",
+    "EmailService": ".email_service",
+    "send_email": ".email_service",
+    "email_configured": ".email_service",
+    "MailQueue": ".mail_queue",
+    "get_mail_queue": ".mail_queue",
+    "SheetsService": ".sheets_service",
+    "SheetsWriter": ".sheets_service",
+    "log_to_sheets": ".sheets_service",
+    "log_to_sheets_async": ".sheets_service",
+    "QuoteLedger": ".ledger_service",
+    "SheetsReplicator": ".ledger_service",
+    "get_ledger": ".ledger_service",
+    "record_quote": ".ledger_service",
+    "HistoryService": ".history_service",
+    "ExportService": ".export_service",
+    "PreviewService": ".preview_service",
+    "render_preview": ".preview_service",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """공개 이름 지연 import (PEP 562)"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """모듈 속성 목록 (지연 import 이름 포함)"""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,199 @@
+"""
+견적 요청 중복 제거 (워커 간 공유, SQLite)
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional, Tuple
+
+from src.config import settings
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS quote_requests (
+    request_key TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    response TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_quote_requests_updated_at ON quote_requests(updated_at);
+"""
+
+STATE_PENDING = "pending"
+STATE_DONE = "done"
+
+# claim() 결과
+CLAIMED = "claimed"
+DUPLICATE_DONE = "done"
+DUPLICATE_PENDING = "pending"
+
+
+def request_key(
+    client_name: str,
+    client_email: str,
+    customer_request: str,
+    idempotency_key: Optional[str] = None
+) -> str:
+    """
+    요청 식별 키
+    
+    Idempotency-Key 헤더가 있으면 그 값을, 없으면 고객명/이메일/요청사항의
+    해시를 사용합니다.
+    """
+    if idempotency_key:
+        return "idem:" + idempotency_key.strip()
+    payload = json.dumps(
+        [client_name.strip(), client_email.strip().lower(), customer_request.strip()],
+        ensure_ascii=False
+    )
+    return "sha256:" + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class QuoteDedup:
+    """
+    견적 요청 중복 제거 저장소
+    
+    같은 요청이 여러 워커(프로세스)에 동시에 들어와도 하나만 견적서를 생성하고,
+    나머지는 완료된 응답을 그대로 돌려받습니다. 성공 응답은 QUOTE_DEDUP_TTL 동안
+    보관되며, 실패한 요청은 기록을 지워 다시 시도할 수 있게 합니다.
+    연결은 스레드별로 만들어 재사용합니다.
+    """
+    
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        ttl: Optional[float] = None,
+        stale_after: Optional[float] = None
+    ):
+        """
+        초기화
+        
+        Args:
+            db_path: SQLite 파일 경로
+            ttl: 완료된 응답 보관 시간(초)
+            stale_after: 처리 중 상태를 유효하게 볼 최대 시간(초, 초과 시 다른 워커가 인계)
+        """
+        self.db_path = db_path or settings.DEDUP_DB_PATH
+        self.ttl = ttl if ttl is not None else settings.QUOTE_DEDUP_TTL
+        self.stale_after = stale_after if stale_after is not None else settings.QUOTE_DEDUP_WAIT
+        self._owner: Optional[Tuple[int, str]] = None
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        self._last_purge = 0.0
+        self.connection().executescript(SCHEMA)
+    
+    @property
+    def owner(self) -> str:
+        """
+        처리 중 기록의 소유자 식별자 (프로세스별)
+        
+        preload 후 fork된 워커는 마스터에서 만든 인스턴스를 물려받을 수 있으므로
+        pid가 바뀌면 새로 만듭니다.
+        """
+        pid = os.getpid()
+        if self._owner is None or self._owner[0] != pid:
+            self._owner = (pid, f"{pid}-{uuid.uuid4().hex[:8]}")
+        return self._owner[1]
+    
+    def connection(self) -> sqlite3.Connection:
+        """현재 스레드의 SQLite 연결"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    def claim(self, key: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        요청 처리권 획득
+        
+        Args:
+            key: request_key() 결과
+        
+        Returns:
+            (CLAIMED, None): 이 요청이 처리
+            (DUPLICATE_DONE, 응답): 같은 요청이 이미 완료됨
+            (DUPLICATE_PENDING, None): 다른 요청이 처리 중
+        """
+        now = time.time()
+        self._purge(now)
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT state, response, updated_at FROM quote_requests WHERE request_key = ?",
+                (key,)
+            ).fetchone()
+            if row is not None:
+                if row["state"] == STATE_DONE and row["updated_at"] >= now - self.ttl:
+                    conn.execute("COMMIT")
+                    return DUPLICATE_DONE, json.loads(row["response"])
+                if row["state"] == STATE_PENDING and row["updated_at"] >= now - self.stale_after:
+                    conn.execute("COMMIT")
+                    return DUPLICATE_PENDING, None
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO quote_requests (request_key, state, owner, response, created_at, updated_at)
+                VALUES (?, ?, ?, NULL, ?, ?)
+                """,
+                (key, STATE_PENDING, self.owner, now, now)
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return CLAIMED, None
+    
+    def complete(self, key: str, response: Dict[str, Any]) -> None:
+        """처리 완료 응답 저장"""
+        now = time.time()
+        self.connection().execute(
+            """
+            INSERT INTO quote_requests (request_key, state, owner, response, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(request_key) DO UPDATE SET
+                state = excluded.state, owner = excluded.owner,
+                response = excluded.response, updated_at = excluded.updated_at
+            """,
+            (key, STATE_DONE, self.owner, json.dumps(response, ensure_ascii=False), now, now)
+        )
+    
+    def release(self, key: str) -> None:
+        """처리 실패 시 기록 삭제 (같은 요청을 다시 처리할 수 있도록)"""
+        self.connection().execute(
+            "DELETE FROM quote_requests WHERE request_key = ? AND owner = ? AND state = ?",
+            (key, self.owner, STATE_PENDING)
+        )
+    
+    def _purge(self, now: float) -> None:
+        """만료된 기록 정리 (최대 1분에 한 번)"""
+        if now - self._last_purge < 60:
+            return
+        self._last_purge = now
+        self.connection().execute(
+            "DELETE FROM quote_requests WHERE updated_at < ?",
+            (now - max(self.ttl, self.stale_after),)
+        )
+
+
+_dedup: Optional[QuoteDedup] = None
+_lock = threading.Lock()
+
+
+def get_quote_dedup() -> QuoteDedup:
+    """설정 기반 공용 중복 제거 저장소"""
+    global _dedup
+    with _lock:
+        if _dedup is None:
+            _dedup = QuoteDedup()
+        return _dedup
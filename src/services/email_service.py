@@ -1,17 +1,101 @@
 """
 이메일 발송 서비스
 """
-import smtplib
+import base64
+import hashlib
 import os
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import tempfile
+import time
+import uuid
+from email import policy
 from email.mime.base import MIMEBase
-from email import encoders
+from email.mime.text import MIMEText
 from email.header import Header
+from email.utils import formataddr, formatdate, make_msgid
+from typing import Iterator, List, Optional
 
 from src.config import settings
+from src.services.smtp_pool import get_smtp_pool
+from src.utils.deadline import check_deadline
 from src.utils.logger import logger
 
+CRLF = "\r\n"
+
+# base64 한 줄(76자)에 해당하는 원본 바이트 수
+_B64_LINE_BYTES = 57
+# 한 번에 인코딩하는 원본 블록 크기 (1024줄)
+_B64_BLOCK_BYTES = _B64_LINE_BYTES * 1024
+
+
+def email_configured() -> bool:
+    """발송 계정(SENDER_EMAIL, SENDER_PASSWORD) 설정 여부"""
+    return bool(settings.SENDER_EMAIL and settings.SENDER_PASSWORD)
+
+
+def _encode_base64_file(src_path: str, dst_path: str) -> None:
+    """파일을 76자 CRLF 행 단위 base64로 스트리밍 인코딩"""
+    # 같은 첨부파일을 여러 스레드/프로세스가 동시에 인코딩할 수 있으므로 임시 파일명은 고유하게
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(dst_path), suffix=".tmp")
+    try:
+        with open(src_path, "rb") as src, os.fdopen(fd, "wb") as dst:
+            while True:
+                block = src.read(_B64_BLOCK_BYTES)
+                if not block:
+                    break
+                encoded = base64.b64encode(block)
+                dst.write(b"\r\n".join(
+                    encoded[i:i + 76] for i in range(0, len(encoded), 76)
+                ))
+                dst.write(b"\r\n")
+        os.replace(tmp_path, dst_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def encoded_attachment_path(pdf_path: str) -> str:
+    """
+    base64로 인코딩된 첨부파일 캐시 경로 반환 (없으면 생성)
+    
+    같은 PDF를 여러 수신자(CC, 재발송 등)에게 보낼 때 인코딩을 한 번만
+    수행합니다. 캐시 키는 (절대 경로, 크기, mtime)이므로 파일이 바뀌면
+    새로 인코딩됩니다.
+    
+    Args:
+        pdf_path: 원본 PDF 경로
+    
+    Returns:
+        인코딩된 캐시 파일 경로
+    """
+    stat = os.stat(pdf_path)
+    key = f"{os.path.abspath(pdf_path)}:{stat.st_size}:{stat.st_mtime_ns}"
+    cache_dir = settings.MAIL_ATTACHMENT_CACHE_DIR
+    cache_path = os.path.join(cache_dir, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".b64")
+    
+    if os.path.exists(cache_path):
+        os.utime(cache_path)
+        return cache_path
+    
+    os.makedirs(cache_dir, exist_ok=True)
+    _encode_base64_file(pdf_path, cache_path)
+    _prune_attachment_cache(cache_dir)
+    return cache_path
+
+
+def _prune_attachment_cache(cache_dir: str) -> None:
+    """오래 사용되지 않은 첨부파일 캐시 삭제"""
+    expire_before = time.time() - settings.MAIL_ATTACHMENT_CACHE_TTL
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        try:
+            if os.path.getmtime(path) < expire_before:
+                os.remove(path)
+        except OSError:
+            continue
+
 
 class EmailService:
     """이메일 발송 서비스"""
@@ -23,27 +107,89 @@ class EmailService:
         self.sender_email = settings.SENDER_EMAIL
         self.sender_password = settings.SENDER_PASSWORD
         self.sender_name = settings.SENDER_NAME
+        self.chunk_size = settings.MAIL_STREAM_CHUNK_SIZE
         
         if not self.sender_email or not self.sender_password:
             logger.warning("이메일 설정이 완료되지 않았습니다.")
     
+    def _build_head(
+        self,
+        to_email: str,
+        cc: List[str],
+        subject: str,
+        body: str,
+        filename: str,
+        boundary: str
+    ) -> bytes:
+        """첨부파일 본문 앞까지의 MIME 헤더와 텍스트 파트 생성"""
+        smtp_policy = policy.SMTP
+        
+        headers = [
+            f'Content-Type: multipart/mixed; boundary="{boundary}"',
+            "MIME-Version: 1.0",
+            f"From: {formataddr((str(Header(self.sender_name, 'utf-8')), self.sender_email))}",
+            f"To: {to_email}",
+        ]
+        if cc:
+            headers.append(f"Cc: {', '.join(cc)}")
+        headers += [
+            f"Subject: {Header(subject, 'utf-8').encode(linesep=CRLF)}",
+            f"Date: {formatdate(localtime=True)}",
+            f"Message-ID: {make_msgid()}",
+        ]
+        
+        text_part = MIMEText(body, 'plain', 'utf-8')
+        
+        attachment_part = MIMEBase('application', 'octet-stream')
+        attachment_part['Content-Transfer-Encoding'] = 'base64'
+        attachment_part.add_header(
+            'Content-Disposition',
+            f'attachment; filename= {filename}'
+        )
+        # 헤더만 직렬화 (본문은 캐시 파일에서 스트리밍)
+        attachment_headers = attachment_part.as_bytes(policy=smtp_policy)
+        
+        return b"".join([
+            (CRLF.join(headers) + CRLF + CRLF).encode("utf-8"),
+            f"--{boundary}\r\n".encode("ascii"),
+            text_part.as_bytes(policy=smtp_policy),
+            f"\r\n--{boundary}\r\n".encode("ascii"),
+            attachment_headers,
+        ])
+    
+    def _iter_message(self, head: bytes, encoded_path: str, boundary: str) -> Iterator[bytes]:
+        """메시지를 행 경계에 맞춘 청크로 생성"""
+        yield head
+        # 청크가 행 경계에서 끝나도록 78바이트(76자 + CRLF) 단위로 읽기
+        line_bytes = 78
+        read_size = max(1, self.chunk_size // line_bytes) * line_bytes
+        with open(encoded_path, "rb") as f:
+            for chunk in iter(lambda: f.read(read_size), b""):
+                yield chunk
+        yield f"--{boundary}--\r\n".encode("ascii")
+    
     def send(
         self,
         to_email: str,
         client_name: str,
         pdf_path: str,
         subject: str,
-        body: str
+        body: str,
+        cc: Optional[List[str]] = None
     ) -> bool:
         """
         견적서 PDF를 이메일로 발송
         
+        첨부파일은 캐시된 base64 인코딩 파일에서 청크 단위로 읽어 바로 전송하므로
+        첨부파일 크기와 무관하게 메모리 사용량이 일정합니다.
+        
         Args:
             to_email: 수신자 이메일 주소
             client_name: 고객명
             pdf_path: 첨부할 PDF 파일 경로
             subject: 이메일 제목
             body: 이메일 본문
+            cc: 참조 수신자 목록 (선택)
         
         Returns:
             발송 성공 여부
@@ -51,48 +197,45 @@ class EmailService:
         if not self.sender_email or not self.sender_password:
             raise ValueError("SENDER_EMAIL과 SENDER_PASSWORD 환경변수가 설정되어야 합니다.")
         
+        # 요청 처리 중 직접 발송하는 경우 처리 기한 확인 (발송 대기열 워커에서는 해당 없음)
+        check_deadline("email")
         logger.info(f"이메일 발송 시작: {to_email} (고객명: {client_name})")
         
         try:
-            msg = MIMEMultipart()
-            msg['From'] = f"{self.sender_name} <{self.sender_email}>"
-            msg['To'] = to_email
-            msg['Subject'] = Header(subject, 'utf-8').encode()
-            
-            msg.attach(MIMEText(body, 'plain', 'utf-8'))
-            
             # PDF 파일 첨부
             if not os.path.exists(pdf_path):
                 raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
             
-            with open(pdf_path, "rb") as attachment:
-                part = MIMEBase('application', 'octet-stream')
-                part.set_payload(attachment.read())
-            
-            encoders.encode_base64(part)
-            part.add_header(
-                'Content-Disposition',
-                f'attachment; filename= {os.path.basename(pdf_path)}'
+            cc = list(cc or [])
+            encoded_path = encoded_attachment_path(pdf_path)
+            boundary = f"==============={uuid.uuid4().hex}=="
+            head = self._build_head(
+                to_email, cc, subject, body, os.path.basename(pdf_path), boundary
             )
-            msg.attach(part)
             
-            # 이메일 발송
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.sender_email, self.sender_password)
-            text = msg.as_string()
-            server.sendmail(self.sender_email, to_email, text)
-            server.quit()
+            # 이메일 발송 (풀링된 인증 세션 재사용, 스트리밍 전송)
+            get_smtp_pool().send_stream(
+                self.sender_email,
+                [to_email] + cc,
+                lambda: self._iter_message(head, encoded_path, boundary)
+            )
             
             logger.info(f"이메일 발송 완료: {to_email}")
             return True
-            
+        
         except Exception as e:
             logger.error(f"이메일 발송 중 오류 발생: {e}", exc_info=True)
             raise
 
 
-def send_email(to_email: str, client_name: str, pdf_path: str, subject: str, body: str) -> bool:
+def send_email(
+    to_email: str,
+    client_name: str,
+    pdf_path: str,
+    subject: str,
+    body: str,
+    cc: Optional[List[str]] = None
+) -> bool:
     """
     이메일 발송 (호환성 함수)
     
@@ -102,9 +245,10 @@ def send_email(to_email: str, client_name: str, pdf_path: str, subject: str, bod
         pdf_path: 첨부할 PDF 파일 경로
         subject: 이메일 제목
         body: 이메일 본문
+        cc: 참조 수신자 목록 (선택)
     
     Returns:
         발송 성공 여부
     """
     service = EmailService()
-    return service.send(to_email, client_name, pdf_path, subject, body)
+    return service.send(to_email, client_name, pdf_path, subject, body, cc)
@@ -0,0 +1,441 @@
+"""
+다건 견적서 내보내기 서비스 (병합 PDF / ZIP)
+"""
+import importlib.util
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.config import settings
+from src.utils.logger import logger
+
+# pypdf는 병합 PDF 생성 시점에 불러옴 (설치 여부만 확인)
+PYPDF_AVAILABLE = importlib.util.find_spec("pypdf") is not None
+if not PYPDF_AVAILABLE:
+    logger.warning("pypdf가 설치되지 않았습니다. 병합 PDF 내보내기가 비활성화됩니다.")
+
+# 목차 한 페이지에 들어가는 항목 수
+TOC_ENTRIES_PER_PAGE = 35
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """렌더링용 프로세스 풀 (지연 생성, 재사용)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # fork는 서버 프로세스의 스레드/락 상태까지 복제하므로 spawn 사용
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.EXPORT_MAX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _executor
+
+
+def shutdown_executor() -> None:
+    """렌더링 프로세스 풀 종료"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def _render_quote(quote_json: Dict[str, Any], client_name: str, output_path: str) -> str:
+    """워커 프로세스에서 견적서 한 건 렌더링"""
+    from src.services.pdf_service import PDFService
+    
+    PDFService().render(quote_json, client_name, output_path)
+    return output_path
+
+
+def _unique_names(filenames: Sequence[str]) -> List[str]:
+    """
+    ZIP 내부 파일명 중복 제거
+    
+    같은 이름이 다시 나오면 확장자 앞에 " (2)", " (3)" ...을 붙입니다.
+    대소문자를 구분하지 않는 파일 시스템을 고려해 casefold로 비교합니다.
+    
+    Args:
+        filenames: 원래 파일명 목록
+    
+    Returns:
+        중복 없는 파일명 목록
+    """
+    seen = set()
+    result = []
+    for name in filenames:
+        stem, ext = os.path.splitext(name)
+        candidate = name
+        counter = 2
+        while candidate.casefold() in seen:
+            candidate = f"{stem} ({counter}){ext}"
+            counter += 1
+        seen.add(candidate.casefold())
+        result.append(candidate)
+    return result
+
+
+class _PdfConcatenator:
+    """
+    PDF 파일을 출력 파일에 순서대로 이어 쓰는 병합기
+    
+    PdfWriter는 병합한 모든 페이지 객체를 메모리에 보관하므로, 원본 PDF를
+    한 건씩 읽어 객체 번호만 다시 매긴 뒤 즉시 출력 파일에 기록합니다.
+    메모리에는 객체 오프셋과 페이지/북마크 번호만 남습니다.
+    """
+    
+    # 1: Catalog, 2: Pages, 3: Outlines (마지막에 기록)
+    CATALOG, PAGES, OUTLINES = 1, 2, 3
+    
+    def __init__(self, stream: BinaryIO):
+        """
+        초기화
+        
+        Args:
+            stream: 병합 PDF 출력 스트림
+        """
+        self._stream = stream
+        self._offsets: List[int] = [0, 0, 0]
+        self._kids: List[int] = []
+        self._outline: List[Tuple[str, int]] = []
+        stream.write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+    
+    def _allocate(self) -> int:
+        self._offsets.append(0)
+        return len(self._offsets)
+    
+    def _write_object(self, number: int, obj: Any) -> None:
+        self._offsets[number - 1] = self._stream.tell()
+        self._stream.write(b"%d 0 obj\n" % number)
+        obj.write_to_stream(self._stream)
+        self._stream.write(b"\nendobj\n")
+    
+    def append(self, path: str, title: str) -> None:
+        """
+        PDF 한 건을 이어 쓰고 첫 페이지에 북마크 추가
+        
+        Args:
+            path: 원본 PDF 경로
+            title: 북마크 제목
+        """
+        from pypdf import PdfReader
+        from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject, NameObject
+        
+        reader = PdfReader(path)
+        refs: Dict[Tuple[int, int], int] = {}
+        queue: deque = deque()
+        
+        def remap(obj: Any) -> Any:
+            if isinstance(obj, IndirectObject):
+                key = (obj.idnum, obj.generation)
+                if key not in refs:
+                    refs[key] = self._allocate()
+                    queue.append(key)
+                return IndirectObject(refs[key], 0, None)
+            if isinstance(obj, DictionaryObject):
+                for name, value in list(dict.items(obj)):
+                    dict.__setitem__(obj, name, remap(value))
+            elif isinstance(obj, ArrayObject):
+                for i, value in enumerate(list(list.__iter__(obj))):
+                    list.__setitem__(obj, i, remap(value))
+            return obj
+        
+        # 페이지 목록을 먼저 읽어야 상속 속성(Resources, MediaBox 등)이 페이지에 복사됨
+        pages = [page.indirect_reference for page in reader.pages]
+        first = len(self._kids)
+        for ref in pages:
+            self._kids.append(remap(ref).idnum)
+        if len(self._kids) > first:
+            self._outline.append((title, self._kids[first]))
+        
+        while queue:
+            idnum, generation = queue.popleft()
+            obj = reader.get_object(IndirectObject(idnum, generation, reader))
+            if isinstance(obj, DictionaryObject) and obj.get("/Type") == "/Page":
+                # 원본 페이지 트리는 따라가지 않고 병합 PDF의 Pages에 연결
+                dict.pop(obj, NameObject("/Parent"), None)
+                remap(obj)
+                dict.__setitem__(obj, NameObject("/Parent"), IndirectObject(self.PAGES, 0, None))
+            else:
+                remap(obj)
+            self._write_object(refs[(idnum, generation)], obj)
+    
+    def finish(self) -> None:
+        """페이지 트리, 북마크, 상호 참조 테이블 기록"""
+        from pypdf.generic import (
+            ArrayObject, DictionaryObject, IndirectObject, NameObject, NumberObject,
+            TextStringObject
+        )
+        
+        def ref(number: int) -> IndirectObject:
+            return IndirectObject(number, 0, None)
+        
+        items = [self._allocate() for _ in self._outline]
+        for i, ((title, page), number) in enumerate(zip(self._outline, items)):
+            item = DictionaryObject({
+                NameObject("/Title"): TextStringObject(title),
+                NameObject("/Parent"): ref(self.OUTLINES),
+                NameObject("/Dest"): ArrayObject([ref(page), NameObject("/Fit")]),
+            })
+            if i > 0:
+                item[NameObject("/Prev")] = ref(items[i - 1])
+            if i + 1 < len(items):
+                item[NameObject("/Next")] = ref(items[i + 1])
+            self._write_object(number, item)
+        
+        outlines = DictionaryObject({
+            NameObject("/Type"): NameObject("/Outlines"),
+            NameObject("/Count"): NumberObject(len(items)),
+        })
+        if items:
+            outlines[NameObject("/First")] = ref(items[0])
+            outlines[NameObject("/Last")] = ref(items[-1])
+        self._write_object(self.OUTLINES, outlines)
+        
+        self._write_object(self.PAGES, DictionaryObject({
+            NameObject("/Type"): NameObject("/Pages"),
+            NameObject("/Kids"): ArrayObject(ref(number) for number in self._kids),
+            NameObject("/Count"): NumberObject(len(self._kids)),
+        }))
+        self._write_object(self.CATALOG, DictionaryObject({
+            NameObject("/Type"): NameObject("/Catalog"),
+            NameObject("/Pages"): ref(self.PAGES),
+            NameObject("/Outlines"): ref(self.OUTLINES),
+            NameObject("/PageMode"): NameObject("/UseOutlines"),
+        }))
+        
+        xref_offset = self._stream.tell()
+        self._stream.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(self._offsets) + 1))
+        for offset in self._offsets:
+            self._stream.write(b"%010d 00000 n \n" % offset)
+        self._stream.write(b"trailer\n")
+        DictionaryObject({
+            NameObject("/Size"): NumberObject(len(self._offsets) + 1),
+            NameObject("/Root"): ref(self.CATALOG),
+        }).write_to_stream(self._stream)
+        self._stream.write(b"\nstartxref\n%d\n%%%%EOF\n" % xref_offset)
+
+
+class _StreamSink:
+    """ZipFile 출력을 청크 단위로 꺼내기 위한 쓰기 전용 버퍼"""
+    
+    def __init__(self):
+        self._chunks: deque = deque()
+        self._offset = 0
+    
+    def write(self, data: bytes) -> int:
+        if data:
+            self._chunks.append(bytes(data))
+            self._offset += len(data)
+        return len(data)
+    
+    def tell(self) -> int:
+        return self._offset
+    
+    def flush(self) -> None:
+        pass
+    
+    def drain(self) -> Iterator[bytes]:
+        while self._chunks:
+            yield self._chunks.popleft()
+
+
+class ExportService:
+    """다건 견적서 내보내기 서비스"""
+    
+    def __init__(self):
+        """초기화"""
+        self.window = max(1, settings.EXPORT_MAX_WORKERS) * 2
+        self.chunk_size = settings.PDF_CHUNK_SIZE
+    
+    def _iter_rendered(
+        self,
+        items: Sequence[Tuple[str, Dict[str, Any]]],
+        work_dir: str
+    ) -> Iterator[Tuple[int, str]]:
+        """
+        견적서를 병렬 렌더링하여 입력 순서대로 반환
+        
+        동시에 진행 중인 렌더링 수를 window로 제한하여
+        건수와 무관하게 메모리 사용량이 일정하게 유지됩니다.
+        
+        Args:
+            items: (고객명, 견적서 JSON) 목록
+            work_dir: 임시 PDF 저장 디렉토리
+        
+        Yields:
+            (인덱스, PDF 경로)
+        """
+        executor = _get_executor()
+        pending: deque = deque()
+        next_index = 0
+        
+        try:
+            while next_index < len(items) or pending:
+                while next_index < len(items) and len(pending) < self.window:
+                    client_name, quote_json = items[next_index]
+                    output_path = os.path.join(work_dir, f"{next_index:06d}.pdf")
+                    future: Future = executor.submit(
+                        _render_quote, quote_json, client_name, output_path
+                    )
+                    pending.append((next_index, future))
+                    next_index += 1
+                
+                index, future = pending.popleft()
+                yield index, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
+    
+    def iter_zip(
+        self,
+        items: Sequence[Tuple[str, Dict[str, Any]]],
+        filenames: Optional[List[str]] = None
+    ) -> Iterator[bytes]:
+        """
+        개별 PDF를 묶은 ZIP을 스트리밍
+        
+        Args:
+            items: (고객명, 견적서 JSON) 목록
+            filenames: ZIP 내부 파일명 목록 (선택)
+        
+        Yields:
+            ZIP 바이트 청크
+        """
+        work_dir = tempfile.mkdtemp(prefix="quote_export_")
+        sink = _StreamSink()
+        if filenames:
+            filenames = _unique_names(filenames)
+        try:
+            # PDF는 이미 압축되어 있으므로 STORED로 저장
+            with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED) as zf:
+                for index, pdf_path in self._iter_rendered(items, work_dir):
+                    arcname = filenames[index] if filenames else f"quote_{index + 1:04d}.pdf"
+                    info = zipfile.ZipInfo(arcname)
+                    info.compress_type = zipfile.ZIP_STORED
+                    with open(pdf_path, "rb") as src, zf.open(info, mode="w", force_zip64=True) as dst:
+                        for chunk in iter(lambda: src.read(self.chunk_size), b""):
+                            dst.write(chunk)
+                            yield from sink.drain()
+                    os.remove(pdf_path)
+                    yield from sink.drain()
+            yield from sink.drain()
+            logger.info(f"ZIP 내보내기 완료: {len(items)}건")
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    
+    def _render_toc(
+        self,
+        entries: List[Tuple[str, int]],
+        output_path: str
+    ) -> int:
+        """목차 PDF 렌더링 후 페이지 수 반환"""
+        from pypdf import PdfReader
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import mm
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table
+        from src.services.pdf_service import PDFService
+        
+        styles = PDFService()._create_styles()
+        rows = [["No.", "고객명", "페이지"]]
+        for no, (title, page) in enumerate(entries, start=1):
+            rows.append([str(no), title, str(page)])
+        
+        doc = SimpleDocTemplate(
+            output_path,
+            pagesize=A4,
+            rightMargin=20*mm,
+            leftMargin=20*mm,
+            topMargin=20*mm,
+            bottomMargin=20*mm
+        )
+        table = Table(rows, colWidths=[15*mm, 125*mm, 30*mm], repeatRows=1)
+        table.setStyle([("FONTNAME", (0, 0), (-1, -1), styles["normal"].fontName)])
+        doc.build([Paragraph("목차", styles["title"]), Spacer(1, 5*mm), table])
+        return len(PdfReader(output_path).pages)
+    
+    def write_merged_pdf(
+        self,
+        items: Sequence[Tuple[str, Dict[str, Any]]],
+        output_path: str
+    ) -> str:
+        """
+        목차가 포함된 단일 PDF로 병합
+        
+        개별 PDF는 병렬 렌더링 후 임시 파일로 보관하고, 북마크와 함께
+        한 건씩 출력 파일에 이어 씁니다. (건수와 무관하게 메모리 사용량 일정)
+        
+        Args:
+            items: (고객명, 견적서 JSON) 목록
+            output_path: 병합 PDF 저장 경로
+        
+        Returns:
+            병합 PDF 경로
+        """
+        if not PYPDF_AVAILABLE:
+            raise RuntimeError("병합 PDF 내보내기에는 pypdf 패키지가 필요합니다.")
+        
+        from pypdf import PdfReader
+        
+        work_dir = tempfile.mkdtemp(prefix="quote_export_")
+        try:
+            rendered: List[Tuple[str, str, int]] = []
+            for index, pdf_path in self._iter_rendered(items, work_dir):
+                page_count = len(PdfReader(pdf_path).pages)
+                rendered.append((items[index][0] or f"견적서 {index + 1}", pdf_path, page_count))
+            
+            # 목차 페이지 수를 추정하고, 실제 렌더링 결과와 다르면 다시 계산
+            toc_path = os.path.join(work_dir, "toc.pdf")
+            toc_pages = max(1, -(-len(rendered) // TOC_ENTRIES_PER_PAGE))
+            while True:
+                entries = []
+                page = toc_pages + 1
+                for title, _, page_count in rendered:
+                    entries.append((title, page))
+                    page += page_count
+                actual_pages = self._render_toc(entries, toc_path)
+                if actual_pages == toc_pages:
+                    break
+                toc_pages = actual_pages
+            
+            with open(output_path, "wb") as f:
+                merger = _PdfConcatenator(f)
+                merger.append(toc_path, "목차")
+                for (title, pdf_path, _), (_, page) in zip(rendered, entries):
+                    merger.append(pdf_path, f"{title} (p.{page})")
+                    os.remove(pdf_path)
+                merger.finish()
+            
+            logger.info(f"병합 PDF 내보내기 완료: {len(rendered)}건 -> {output_path}")
+            return output_path
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    
+    def iter_merged_pdf(self, items: Sequence[Tuple[str, Dict[str, Any]]]) -> Iterator[bytes]:
+        """
+        병합 PDF를 생성하여 청크 단위로 스트리밍
+        
+        Args:
+            items: (고객명, 견적서 JSON) 목록
+        
+        Yields:
+            PDF 바이트 청크
+        """
+        fd, output_path = tempfile.mkstemp(prefix="quote_export_", suffix=".pdf")
+        os.close(fd)
+        try:
+            self.write_merged_pdf(items, output_path)
+            with open(output_path, "rb") as f:
+                for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                    yield chunk
+        finally:
+            os.remove(output_path)
@@ -0,0 +1,437 @@
+"""
+견적서 이력 조회 및 통계 서비스 (원장 기반)
+"""
+import base64
+import json
+import sqlite3
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.services.ledger_service import KEYWORD_PREFIX_MAX, QuoteLedger, get_ledger, tokenize
+
+# 조건에 맞는 행이 이보다 적으면 해당 인덱스로 모두 찾아 정렬하고,
+# 많으면 created_at 인덱스를 최신순으로 훑으며 조건을 확인 (한 페이지를 금방 채움)
+SELECTIVE_ROWS = 10000
+
+# 목록 조회 컬럼 (quote_json 제외)
+SUMMARY_COLUMNS = (
+    "q.id, q.quote_id, q.created_at, q.client_name, q.client_email, q.project_summary, "
+    "q.subtotal, q.vat, q.total, q.currency, q.delivery_days"
+)
+
+
+def encode_cursor(created_at: float, row_id: int) -> str:
+    """다음 페이지 커서 생성 (마지막 행의 생성 시각과 ID)"""
+    raw = f"{created_at!r}:{row_id}"
+    return base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[float, int]:
+    """
+    커서 해석
+    
+    Returns:
+        (생성 시각, 행 ID)
+    
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = base64.urlsafe_b64decode(padded).decode("ascii").split(":")
+        return float(created_at), int(row_id)
+    except Exception:
+        raise ValueError("잘못된 커서입니다.")
+
+
+def _day_start(day: date) -> float:
+    """날짜 시작 시각 (로컬 시간, unix time)"""
+    return datetime.combine(day, time.min).timestamp()
+
+
+def _fts_query(terms: List[str]) -> str:
+    """검색 단어를 FTS5 질의로 변환 (단어별 접두어 AND 검색)"""
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def _summary(row: sqlite3.Row) -> Dict[str, Any]:
+    """목록 응답용 행 변환"""
+    return {
+        "quote_id": row["quote_id"],
+        "created_at": datetime.fromtimestamp(row["created_at"]).isoformat(timespec="seconds"),
+        "client_name": row["client_name"],
+        "client_email": row["client_email"],
+        "project_summary": row["project_summary"],
+        "subtotal": row["subtotal"],
+        "vat": row["vat"],
+        "total": row["total"],
+        "currency": row["currency"],
+        "delivery_days": row["delivery_days"],
+    }
+
+
+def _average(amount: int, count: int) -> Optional[float]:
+    """평균 (건수가 없으면 None)"""
+    return round(amount / count, 1) if count else None
+
+
+def _client_row(row: sqlite3.Row) -> Dict[str, Any]:
+    """고객별 통계 행 변환"""
+    return {
+        "client_email": row["client_email"],
+        "quote_count": row["quote_count"],
+        "subtotal_sum": row["subtotal_sum"],
+        "total_sum": row["total_sum"],
+        "avg_subtotal": _average(row["subtotal_sum"], row["priced_count"]),
+        "avg_total": _average(row["total_sum"], row["priced_count"]),
+    }
+
+
+class HistoryService:
+    """
+    견적서 이력/통계 조회
+    
+    - 목록은 (생성 시각, 행 ID) 기준 keyset 페이지네이션으로 조회하므로
+      페이지 위치와 무관하게 created_at 인덱스 범위 탐색만 수행합니다.
+    - 키워드/총액 조건은 일치하는 행 수(키워드는 키워드별 집계, 총액은 인덱스에서
+      SELECTIVE_ROWS까지)를 보고, 적으면 전문 검색(FTS5)/총액 인덱스로 찾아
+      정렬하고 많으면 최신순으로 훑으며 prefix_match/총액을 확인합니다.
+      어느 쪽이든 읽는 행 수가 제한됩니다.
+    - 일별/고객별/키워드별 집계는 원장 기록 시 트리거로 갱신되는 사전 집계
+      테이블에서 읽으므로 원장 행 수와 무관하게 조회 기간의 일 수에 비례합니다.
+    """
+    
+    def __init__(self, ledger: Optional[QuoteLedger] = None):
+        """
+        초기화
+        
+        Args:
+            ledger: 견적서 원장 (기본값: 공용 원장)
+        """
+        self.ledger = ledger or get_ledger()
+    
+    def _count_upto(self, sql: str, params: List[Any]) -> int:
+        """질의 결과 행 수 (SELECTIVE_ROWS에서 멈춤)"""
+        row = self.ledger.connection().execute(
+            f"SELECT count(*) FROM ({sql} LIMIT {SELECTIVE_ROWS})", params
+        ).fetchone()
+        return row[0]
+    
+    def _keyword_matches(self, terms: List[str]) -> int:
+        """
+        키워드 조건에 맞는 견적 수 (SELECTIVE_ROWS 이상이면 SELECTIVE_ROWS)
+        
+        FTS5 접두어 질의는 LIMIT과 무관하게 일치 목록 전체를 합치므로, 먼저
+        키워드별 일별 집계에서 단어별 건수를 읽고 가장 적은 단어의 건수를 상한으로
+        씁니다. 상한이 크고 여러 단어(또는 긴 단어)이면 전문 검색으로 셉니다.
+        """
+        conn = self.ledger.connection()
+        short_terms = [term for term in terms if len(term) <= KEYWORD_PREFIX_MAX]
+        if short_terms:
+            upper = min(
+                conn.execute(
+                    "SELECT coalesce(sum(quote_count), 0) FROM daily_keyword_stats WHERE keyword = ?",
+                    (term,)
+                ).fetchone()[0]
+                for term in short_terms
+            )
+            if upper < SELECTIVE_ROWS or len(terms) == 1:
+                return min(upper, SELECTIVE_ROWS)
+        return self._count_upto("SELECT 1 FROM quotes_fts WHERE quotes_fts MATCH ?", [_fts_query(terms)])
+    
+    def _keyword_condition(
+        self,
+        terms: List[str],
+        where: List[str],
+        params: List[Any],
+        scan: bool = False
+    ) -> None:
+        """
+        키워드 검색 조건 추가 (단어별 접두어 AND)
+        
+        Args:
+            terms: 검색 단어 목록 (tokenize 결과)
+            where: WHERE 조건 목록
+            params: 질의 인자 목록
+            scan: 전문 검색 대신 행마다 prefix_match로 확인
+        """
+        if self.ledger.fts_available and not scan:
+            where.append("q.id IN (SELECT rowid FROM quotes_fts WHERE quotes_fts MATCH ?)")
+            params.append(_fts_query(terms))
+        else:
+            for term in terms:
+                where.append("(prefix_match(q.project_summary, ?) OR prefix_match(q.scope, ?))")
+                params += [term, term]
+    
+    @staticmethod
+    def _date_condition(
+        since: Optional[date],
+        until: Optional[date],
+        where: List[str],
+        params: List[Any]
+    ) -> None:
+        """생성일 범위 조건 추가 (created_at 인덱스)"""
+        if since is not None:
+            where.append("q.created_at >= ?")
+            params.append(_day_start(since))
+        if until is not None:
+            where.append("q.created_at < ?")
+            params.append(_day_start(until + timedelta(days=1)))
+    
+    def list_quotes(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        client_email: Optional[str] = None,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+        min_total: Optional[int] = None,
+        max_total: Optional[int] = None,
+        keyword: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        견적서 목록 조회 (최신순)
+        
+        Args:
+            limit: 페이지 크기
+            cursor: 이전 페이지의 next_cursor
+            client_email: 고객 이메일
+            since: 시작일 (포함)
+            until: 종료일 (포함)
+            min_total: 최소 총액
+            max_total: 최대 총액
+            keyword: 범위/요약 검색어
+        
+        Returns:
+            (견적서 목록, 다음 페이지 커서 또는 None)
+        
+        Raises:
+            ValueError: 잘못된 커서
+        """
+        where: List[str] = []
+        params: List[Any] = []
+        
+        self._date_condition(since, until, where, params)
+        if cursor:
+            where.append("(q.created_at, q.id) < (?, ?)")
+            params += decode_cursor(cursor)
+        if client_email:
+            where.append("q.client_email = ?")
+            params.append(client_email)
+        
+        total_where: List[str] = []
+        total_params: List[Any] = []
+        if min_total is not None:
+            total_where.append("total >= ?")
+            total_params.append(min_total)
+        if max_total is not None:
+            total_where.append("total <= ?")
+            total_params.append(max_total)
+        where += [f"q.{condition}" for condition in total_where]
+        params += total_params
+        
+        terms = tokenize(keyword) if keyword else []
+        selective_keyword = False
+        if terms:
+            selective_keyword = self.ledger.fts_available and self._keyword_matches(terms) < SELECTIVE_ROWS
+            self._keyword_condition(terms, where, params, scan=not selective_keyword)
+        
+        sql = f"SELECT {SUMMARY_COLUMNS} FROM quotes q"
+        # 총액 범위가 좁으면 총액 인덱스로 찾아 정렬하고, 넓으면 최신순으로 훑음
+        # (플래너는 범위가 넓어도 총액 인덱스로 일치하는 행을 모두 읽어 정렬함)
+        if total_where and not selective_keyword and not client_email:
+            selective_total = self._count_upto(
+                "SELECT 1 FROM quotes WHERE " + " AND ".join(total_where), total_params
+            ) < SELECTIVE_ROWS
+            sql += " INDEXED BY idx_quotes_total" if selective_total else " INDEXED BY idx_quotes_created_at"
+        
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY q.created_at DESC, q.id DESC LIMIT ?"
+        params.append(limit + 1)
+        
+        rows = self.ledger.connection().execute(sql, params).fetchall()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+        return [_summary(row) for row in rows], next_cursor
+    
+    def get_quote(self, quote_id: str) -> Optional[Dict[str, Any]]:
+        """
+        견적서 단건 조회
+        
+        Args:
+            quote_id: 견적서 ID
+        
+        Returns:
+            견적서 정보 (quote_json 포함), 없으면 None
+        """
+        row = self.ledger.connection().execute(
+            f"SELECT {SUMMARY_COLUMNS}, q.quote_json FROM quotes q WHERE q.quote_id = ?",
+            (quote_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        result = _summary(row)
+        result["quote_json"] = json.loads(row["quote_json"])
+        return result
+    
+    def daily_stats(self, since: Optional[date] = None, until: Optional[date] = None) -> Dict[str, Any]:
+        """
+        일별 견적 건수/금액 (사전 집계)
+        
+        Args:
+            since: 시작일 (포함)
+            until: 종료일 (포함)
+        
+        Returns:
+            일별 통계와 기간 합계
+        """
+        where: List[str] = []
+        params: List[Any] = []
+        if since is not None:
+            where.append("day >= ?")
+            params.append(since.isoformat())
+        if until is not None:
+            where.append("day <= ?")
+            params.append(until.isoformat())
+        
+        sql = "SELECT * FROM daily_stats"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY day"
+        
+        days = []
+        totals = {"quote_count": 0, "priced_count": 0, "subtotal_sum": 0, "total_sum": 0}
+        for row in self.ledger.connection().execute(sql, params):
+            days.append({
+                "day": row["day"],
+                "quote_count": row["quote_count"],
+                "subtotal_sum": row["subtotal_sum"],
+                "total_sum": row["total_sum"],
+                "avg_subtotal": _average(row["subtotal_sum"], row["priced_count"]),
+                "avg_total": _average(row["total_sum"], row["priced_count"]),
+            })
+            for key in totals:
+                totals[key] += row[key]
+        
+        return {
+            "days": days,
+            "quote_count": totals["quote_count"],
+            "subtotal_sum": totals["subtotal_sum"],
+            "total_sum": totals["total_sum"],
+            "avg_subtotal": _average(totals["subtotal_sum"], totals["priced_count"]),
+            "avg_total": _average(totals["total_sum"], totals["priced_count"]),
+        }
+    
+    def client_stats(
+        self,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+        limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """
+        고객별 견적 건수/금액 (사전 집계, 건수 내림차순)
+        
+        Args:
+            since: 시작일 (포함)
+            until: 종료일 (포함)
+            limit: 최대 고객 수
+        
+        Returns:
+            고객별 통계 목록
+        """
+        if since is None and until is None:
+            # 전체 기간은 누적 집계의 건수 인덱스에서 상위 limit명만 읽음
+            rows = self.ledger.connection().execute(
+                """
+                SELECT client_email, quote_count, priced_count, subtotal_sum, total_sum
+                FROM client_stats ORDER BY quote_count DESC, client_email LIMIT ?
+                """,
+                (limit,)
+            )
+            return [_client_row(row) for row in rows]
+        
+        where: List[str] = []
+        params: List[Any] = []
+        if since is not None:
+            where.append("day >= ?")
+            params.append(since.isoformat())
+        if until is not None:
+            where.append("day <= ?")
+            params.append(until.isoformat())
+        
+        sql = """
+            SELECT client_email, sum(quote_count) AS quote_count, sum(priced_count) AS priced_count,
+                   sum(subtotal_sum) AS subtotal_sum, sum(total_sum) AS total_sum
+            FROM daily_client_stats
+        """
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " GROUP BY client_email ORDER BY quote_count DESC, client_email LIMIT ?"
+        params.append(limit)
+        
+        return [_client_row(row) for row in self.ledger.connection().execute(sql, params)]
+    
+    def keyword_stats(
+        self,
+        keyword: str,
+        since: Optional[date] = None,
+        until: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        범위/요약 키워드별 견적 건수와 평균 금액
+        
+        단어 하나(KEYWORD_PREFIX_MAX자 이하)는 키워드별 일별 집계에서 기간의 일 수만큼
+        읽고, 여러 단어의 AND 조건은 전문 검색으로 일치하는 견적을 모두 합산합니다.
+        
+        Args:
+            keyword: 검색어 (공백 구분 단어 AND)
+            since: 시작일 (포함)
+            until: 종료일 (포함)
+        
+        Returns:
+            키워드 통계
+        """
+        terms = tokenize(keyword)
+        if not terms:
+            # 검색할 단어가 없으면 일치하는 견적 없음
+            return {"keyword": keyword, "quote_count": 0, "avg_subtotal": None, "avg_total": None}
+        
+        where: List[str] = []
+        params: List[Any] = []
+        if len(terms) == 1 and len(terms[0]) <= KEYWORD_PREFIX_MAX:
+            where.append("keyword = ?")
+            params.append(terms[0])
+            if since is not None:
+                where.append("day >= ?")
+                params.append(since.isoformat())
+            if until is not None:
+                where.append("day <= ?")
+                params.append(until.isoformat())
+            sql = f"""
+                SELECT coalesce(sum(quote_count), 0) AS quote_count,
+                       coalesce(sum(priced_count), 0) AS priced_count,
+                       coalesce(sum(subtotal_sum), 0) AS subtotal_sum, coalesce(sum(total_sum), 0) AS total_sum
+                FROM daily_keyword_stats WHERE {" AND ".join(where)}
+            """
+        else:
+            self._keyword_condition(terms, where, params)
+            self._date_condition(since, until, where, params)
+            # 전문 검색 결과의 행 ID로 금액 인덱스만 읽음 (견적서 JSON이 있는 행은 읽지 않음)
+            source = "quotes q INDEXED BY idx_quotes_amounts" if self.ledger.fts_available else "quotes q"
+            sql = f"""
+                SELECT count(*) AS quote_count, count(q.total) AS priced_count,
+                       coalesce(sum(q.subtotal), 0) AS subtotal_sum, coalesce(sum(q.total), 0) AS total_sum
+                FROM {source} WHERE {" AND ".join(where)}
+            """
+        
+        row = self.ledger.connection().execute(sql, params).fetchone()
+        
+        return {
+            "keyword": keyword,
+            "quote_count": row["quote_count"],
+            "avg_subtotal": _average(row["subtotal_sum"], row["priced_count"]),
+            "avg_total": _average(row["total_sum"], row["priced_count"]),
+        }
@@ -0,0 +1,572 @@
+"""
+로컬 견적서 원장 (SQLite) 및 Google Sheets 복제
+"""
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
+
+from src.config import settings
+from src.core.quote_model import Quote
+from src.services.sheets_service import SheetsWriter, build_row, get_sheets_writer
+from src.utils.logger import logger
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS quotes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    quote_id TEXT NOT NULL UNIQUE,
+    created_at REAL NOT NULL,
+    client_name TEXT NOT NULL,
+    client_email TEXT NOT NULL,
+    project_summary TEXT NOT NULL DEFAULT '',
+    scope TEXT NOT NULL DEFAULT '',
+    subtotal INTEGER,
+    vat INTEGER,
+    total INTEGER,
+    currency TEXT,
+    delivery_days INTEGER,
+    quote_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_quotes_created_at ON quotes(created_at);
+CREATE INDEX IF NOT EXISTS idx_quotes_client_email ON quotes(client_email, created_at);
+CREATE INDEX IF NOT EXISTS idx_quotes_total ON quotes(total);
+-- 여러 단어 키워드 통계용 (행 ID -> 생성 시각/금액, 견적서 JSON 없이 조회)
+CREATE INDEX IF NOT EXISTS idx_quotes_amounts ON quotes(id, created_at, subtotal, total);
+
+-- 사전 집계: 원장 기록과 같은 트랜잭션에서 트리거로 갱신
+CREATE TABLE IF NOT EXISTS daily_stats (
+    day TEXT PRIMARY KEY,
+    quote_count INTEGER NOT NULL DEFAULT 0,
+    priced_count INTEGER NOT NULL DEFAULT 0,
+    subtotal_sum INTEGER NOT NULL DEFAULT 0,
+    total_sum INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS daily_client_stats (
+    day TEXT NOT NULL,
+    client_email TEXT NOT NULL,
+    quote_count INTEGER NOT NULL DEFAULT 0,
+    priced_count INTEGER NOT NULL DEFAULT 0,
+    subtotal_sum INTEGER NOT NULL DEFAULT 0,
+    total_sum INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, client_email)
+) WITHOUT ROWID;
+-- 이전 버전의 고객 인덱스는 기간 조건 없는 GROUP BY에서 전체 탐색을 유발
+DROP INDEX IF EXISTS idx_daily_client_stats_client;
+-- 기간 조건 없는 고객별 통계용 누적 집계
+CREATE TABLE IF NOT EXISTS client_stats (
+    client_email TEXT PRIMARY KEY,
+    quote_count INTEGER NOT NULL DEFAULT 0,
+    priced_count INTEGER NOT NULL DEFAULT 0,
+    subtotal_sum INTEGER NOT NULL DEFAULT 0,
+    total_sum INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_client_stats_count ON client_stats(quote_count DESC, client_email);
+
+CREATE TRIGGER IF NOT EXISTS trg_quotes_stats AFTER INSERT ON quotes
+BEGIN
+    INSERT INTO daily_stats (day, quote_count, priced_count, subtotal_sum, total_sum)
+    VALUES (
+        date(NEW.created_at, 'unixepoch', 'localtime'), 1,
+        NEW.total IS NOT NULL, coalesce(NEW.subtotal, 0), coalesce(NEW.total, 0)
+    )
+    ON CONFLICT(day) DO UPDATE SET
+        quote_count = quote_count + 1,
+        priced_count = priced_count + excluded.priced_count,
+        subtotal_sum = subtotal_sum + excluded.subtotal_sum,
+        total_sum = total_sum + excluded.total_sum;
+    INSERT INTO daily_client_stats (day, client_email, quote_count, priced_count, subtotal_sum, total_sum)
+    VALUES (
+        date(NEW.created_at, 'unixepoch', 'localtime'), NEW.client_email, 1,
+        NEW.total IS NOT NULL, coalesce(NEW.subtotal, 0), coalesce(NEW.total, 0)
+    )
+    ON CONFLICT(day, client_email) DO UPDATE SET
+        quote_count = quote_count + 1,
+        priced_count = priced_count + excluded.priced_count,
+        subtotal_sum = subtotal_sum + excluded.subtotal_sum,
+        total_sum = total_sum + excluded.total_sum;
+    INSERT INTO client_stats (client_email, quote_count, priced_count, subtotal_sum, total_sum)
+    VALUES (NEW.client_email, 1, NEW.total IS NOT NULL, coalesce(NEW.subtotal, 0), coalesce(NEW.total, 0))
+    ON CONFLICT(client_email) DO UPDATE SET
+        quote_count = quote_count + 1,
+        priced_count = priced_count + excluded.priced_count,
+        subtotal_sum = subtotal_sum + excluded.subtotal_sum,
+        total_sum = total_sum + excluded.total_sum;
+END;
+
+-- 키워드(단어 접두어)별 일별 집계: keyword_prefixes()는 연결마다 등록하는 SQL 함수
+CREATE TABLE IF NOT EXISTS daily_keyword_stats (
+    keyword TEXT NOT NULL,
+    day TEXT NOT NULL,
+    quote_count INTEGER NOT NULL DEFAULT 0,
+    priced_count INTEGER NOT NULL DEFAULT 0,
+    subtotal_sum INTEGER NOT NULL DEFAULT 0,
+    total_sum INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (keyword, day)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_quotes_keyword_stats AFTER INSERT ON quotes
+BEGIN
+    INSERT INTO daily_keyword_stats (keyword, day, quote_count, priced_count, subtotal_sum, total_sum)
+    SELECT value, date(NEW.created_at, 'unixepoch', 'localtime'), 1,
+           NEW.total IS NOT NULL, coalesce(NEW.subtotal, 0), coalesce(NEW.total, 0)
+    FROM json_each(keyword_prefixes(NEW.project_summary, NEW.scope)) WHERE true
+    ON CONFLICT(keyword, day) DO UPDATE SET
+        quote_count = quote_count + 1,
+        priced_count = priced_count + excluded.priced_count,
+        subtotal_sum = subtotal_sum + excluded.subtotal_sum,
+        total_sum = total_sum + excluded.total_sum;
+END;
+
+CREATE TABLE IF NOT EXISTS replication_state (
+    name TEXT PRIMARY KEY,
+    last_id INTEGER NOT NULL DEFAULT 0,
+    owner TEXT,
+    lease_until REAL NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL DEFAULT 0
+);
+"""
+
+# 범위/요약 키워드 검색용 전문 검색 인덱스 (FTS5 미지원 빌드에서는 생략)
+# 발음 구별 기호는 유지하여 대체 검색(prefix_match)과 같은 결과를 내도록 함
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS quotes_fts USING fts5(
+    project_summary, scope, content='quotes', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 0'
+);
+CREATE TRIGGER IF NOT EXISTS trg_quotes_fts AFTER INSERT ON quotes
+BEGIN
+    INSERT INTO quotes_fts (rowid, project_summary, scope)
+    VALUES (NEW.id, NEW.project_summary, NEW.scope);
+END;
+"""
+
+# FTS5 unicode61 토크나이저와 같은 단어 경계 (문자/숫자 연속 구간)
+_TOKEN = re.compile(r"[^\W_]+")
+
+# 키워드 집계에 기록하는 단어 접두어 최대 길이 (더 긴 검색어는 전문 검색으로 집계)
+KEYWORD_PREFIX_MAX = 12
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    검색용 단어 분리 (소문자 변환)
+    
+    Args:
+        text: 원문
+    
+    Returns:
+        단어 목록
+    """
+    return _TOKEN.findall(text.lower())
+
+
+def _prefix_match(text: Optional[str], term: str) -> int:
+    """text에 term으로 시작하는 단어가 있는지 (FTS5 접두어 질의와 같은 의미의 대체 검색용 SQL 함수)"""
+    if not text or term not in text.lower():
+        # 부분 문자열로도 없으면 단어 분리 없이 바로 제외 (최신순 탐색 시 대부분의 행)
+        return 0
+    return int(any(token.startswith(term) for token in tokenize(text)))
+
+
+def keyword_prefixes(*texts: Optional[str]) -> str:
+    """
+    키워드 집계용 단어 접두어 목록 (JSON 배열, 트리거에서 호출)
+    
+    검색은 단어별 접두어 일치이므로 각 단어의 1 ~ KEYWORD_PREFIX_MAX자 접두어를
+    중복 없이 기록합니다. 한 견적서는 접두어마다 한 번만 집계됩니다.
+    
+    Args:
+        texts: 요약, 범위 등 원문
+    
+    Returns:
+        접두어 JSON 배열 문자열
+    """
+    prefixes = set()
+    for text in texts:
+        for token in tokenize(text or ""):
+            prefixes.update(token[:n] for n in range(1, min(len(token), KEYWORD_PREFIX_MAX) + 1))
+    return json.dumps(sorted(prefixes), ensure_ascii=False)
+
+
+class QuoteLedger:
+    """
+    추가 전용(append-only) 견적서 원장
+    
+    모든 견적서를 로컬 SQLite(WAL)에 기록하는 1차 저장소입니다.
+    연결은 스레드별로 만들어 재사용합니다.
+    """
+    
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        초기화
+        
+        Args:
+            db_path: SQLite 파일 경로
+        """
+        self.db_path = db_path or settings.LEDGER_DB_PATH
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        conn = self.connection()
+        conn.executescript(SCHEMA)
+        try:
+            conn.executescript(FTS_SCHEMA)
+            self.fts_available = True
+        except sqlite3.OperationalError:
+            logger.warning("SQLite FTS5를 사용할 수 없어 키워드 검색은 LIKE로 처리합니다.")
+            self.fts_available = False
+        self._backfill_aggregates()
+    
+    def _backfill_aggregates(self) -> None:
+        """
+        누적 고객/키워드 집계 채우기
+        
+        두 집계 테이블이 생기기 전에 기록된 원장을 열면 한 번만 기존 행으로 채웁니다.
+        이후에는 트리거가 갱신합니다.
+        """
+        conn = self.connection()
+        if conn.execute("SELECT EXISTS (SELECT 1 FROM client_stats)").fetchone()[0]:
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            empty = not conn.execute("SELECT EXISTS (SELECT 1 FROM client_stats)").fetchone()[0]
+            if empty and conn.execute("SELECT EXISTS (SELECT 1 FROM quotes)").fetchone()[0]:
+                conn.execute(
+                    """
+                    INSERT INTO client_stats (client_email, quote_count, priced_count, subtotal_sum, total_sum)
+                    SELECT client_email, count(*), count(total), coalesce(sum(subtotal), 0), coalesce(sum(total), 0)
+                    FROM quotes GROUP BY client_email
+                    """
+                )
+                conn.execute("DELETE FROM daily_keyword_stats")
+                conn.execute(
+                    """
+                    INSERT INTO daily_keyword_stats (keyword, day, quote_count, priced_count, subtotal_sum, total_sum)
+                    SELECT j.value, date(q.created_at, 'unixepoch', 'localtime'), count(*), count(q.total),
+                           coalesce(sum(q.subtotal), 0), coalesce(sum(q.total), 0)
+                    FROM quotes q, json_each(keyword_prefixes(q.project_summary, q.scope)) j
+                    GROUP BY 1, 2
+                    """
+                )
+                logger.info("기존 원장으로 고객/키워드 집계를 채웠습니다.")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+    
+    def connection(self) -> sqlite3.Connection:
+        """현재 스레드의 SQLite 연결"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.create_function("prefix_match", 2, _prefix_match, deterministic=True)
+            conn.create_function("keyword_prefixes", -1, keyword_prefixes, deterministic=True)
+            self._local.conn = conn
+        return conn
+    
+    def append(
+        self,
+        quote_id: str,
+        client_name: str,
+        client_email: str,
+        quote_json: Union[Quote, Dict[str, Any]],
+        created_at: Optional[float] = None
+    ) -> int:
+        """
+        견적서 기록
+        
+        Args:
+            quote_id: 견적서 ID
+            client_name: 고객명
+            client_email: 고객 이메일
+            quote_json: 견적서 (Quote 또는 JSON 딕셔너리)
+            created_at: 생성 시각 (unix time, 기본값: 현재)
+        
+        Returns:
+            원장 행 ID
+        """
+        quote = Quote.coerce(quote_json)
+        pricing = quote.pricing
+        
+        cursor = self.connection().execute(
+            """
+            INSERT INTO quotes (
+                quote_id, created_at, client_name, client_email, project_summary, scope,
+                subtotal, vat, total, currency, delivery_days, quote_json
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                quote_id,
+                created_at if created_at is not None else time.time(),
+                client_name,
+                client_email,
+                quote.project_summary,
+                "\n".join(quote.scope),
+                pricing.subtotal,
+                pricing.vat,
+                pricing.total,
+                pricing.currency,
+                quote.delivery_days,
+                quote.to_json(),
+            )
+        )
+        return cursor.lastrowid
+    
+    def fetch_after(self, last_id: int, limit: int) -> List[sqlite3.Row]:
+        """
+        지정한 행 ID 이후의 기록 조회 (복제용)
+        
+        Args:
+            last_id: 마지막으로 처리한 행 ID
+            limit: 최대 행 수
+        
+        Returns:
+            행 목록 (id 오름차순)
+        """
+        return self.connection().execute(
+            "SELECT * FROM quotes WHERE id > ? ORDER BY id LIMIT ?",
+            (last_id, limit)
+        ).fetchall()
+    
+    def get_checkpoint(self, name: str) -> int:
+        """복제 진행 위치 조회"""
+        row = self.connection().execute(
+            "SELECT last_id FROM replication_state WHERE name = ?", (name,)
+        ).fetchone()
+        return row["last_id"] if row else 0
+    
+    def set_checkpoint(self, name: str, last_id: int, owner: str) -> bool:
+        """
+        복제 진행 위치 저장 (리스를 가진 경우에만)
+        
+        Args:
+            name: 복제 작업 이름
+            last_id: 마지막으로 처리한 행 ID
+            owner: 리스 소유자 식별자
+        
+        Returns:
+            저장 여부 (리스를 잃었으면 False)
+        """
+        cursor = self.connection().execute(
+            "UPDATE replication_state SET last_id = ?, updated_at = ? WHERE name = ? AND owner = ?",
+            (last_id, time.time(), name, owner)
+        )
+        return cursor.rowcount == 1
+    
+    def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        """
+        복제 작업 리스 획득/갱신
+        
+        여러 프로세스가 같은 원장을 공유할 때 복제 작업은 리스를 가진
+        하나의 프로세스만 수행합니다.
+        
+        Args:
+            name: 복제 작업 이름
+            owner: 소유자 식별자
+            ttl: 리스 유지 시간(초)
+        
+        Returns:
+            리스 보유 여부
+        """
+        now = time.time()
+        conn = self.connection()
+        conn.execute(
+            "INSERT OR IGNORE INTO replication_state (name, last_id, updated_at) VALUES (?, 0, ?)",
+            (name, now)
+        )
+        cursor = conn.execute(
+            """
+            UPDATE replication_state SET owner = ?, lease_until = ?
+            WHERE name = ? AND (owner = ? OR owner IS NULL OR lease_until < ?)
+            """,
+            (owner, now + ttl, name, owner, now)
+        )
+        return cursor.rowcount == 1
+    
+    def release_lease(self, name: str, owner: str) -> None:
+        """복제 작업 리스 반납"""
+        self.connection().execute(
+            "UPDATE replication_state SET owner = NULL, lease_until = 0 WHERE name = ? AND owner = ?",
+            (name, owner)
+        )
+
+
+class SheetsReplicator:
+    """
+    원장 -> Google Sheets 비동기 복제
+    
+    원장에서 체크포인트 이후의 행을 배치로 읽어 SheetsWriter.write_rows로
+    기록하고, 성공한 위치까지 체크포인트를 저장합니다. Sheets 장애 시에는
+    백오프 후 같은 위치부터 다시 시도하므로 기록이 유실되지 않습니다.
+    
+    리스 유지 시간은 최대 백오프와 기록 시간(SHEETS_WRITE_TIMEOUT)의 합이며,
+    매 기록 직전에 리스를 갱신합니다. 체크포인트는 리스를 가진 경우에만
+    저장하므로 다른 워커가 리스를 넘겨받은 뒤 같은 배치를 덮어쓰지 않습니다.
+    """
+    
+    NAME = "sheets"
+    
+    def __init__(self, ledger: QuoteLedger, writer: SheetsWriter):
+        """
+        초기화
+        
+        Args:
+            ledger: 견적서 원장
+            writer: SheetsWriter 인스턴스
+        """
+        self.ledger = ledger
+        self.writer = writer
+        self.batch_size = settings.SHEETS_BATCH_SIZE
+        self.interval = settings.SHEETS_FLUSH_INTERVAL
+        self.lease_ttl = max(self.interval, settings.SHEETS_MAX_BACKOFF) + settings.SHEETS_WRITE_TIMEOUT
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def notify(self) -> None:
+        """새 기록 알림 (대기 중인 복제 루프 깨우기)"""
+        self._wakeup.set()
+    
+    def replicate_once(self) -> int:
+        """
+        체크포인트 이후 행을 한 배치 복제
+        
+        Returns:
+            복제한 행 수
+        """
+        last_id = self.ledger.get_checkpoint(self.NAME)
+        rows = self.ledger.fetch_after(last_id, self.batch_size)
+        if not rows:
+            return 0
+        # 기록 직전에 리스 갱신 (기록이 끝날 때까지 다른 워커가 넘겨받지 못함)
+        if not self.ledger.acquire_lease(self.NAME, self.owner, self.lease_ttl):
+            return 0
+        
+        sheet_rows = [
+            build_row(
+                row["client_name"],
+                row["client_email"],
+                Quote.from_json(row["quote_json"]),
+                created_at=datetime.fromtimestamp(row["created_at"])
+            )
+            for row in rows
+        ]
+        self.writer.write_rows(sheet_rows)
+        if not self.ledger.set_checkpoint(self.NAME, rows[-1]["id"], self.owner):
+            logger.warning("Google Sheets 복제 리스를 잃어 체크포인트를 저장하지 않았습니다.")
+            return 0
+        logger.info(f"Google Sheets 복제 완료: {len(rows)}건 (~{rows[-1]['id']})")
+        return len(rows)
+    
+    def _run(self) -> None:
+        """복제 루프"""
+        backoff = self.interval
+        while not self._stop.is_set():
+            try:
+                if not self.ledger.acquire_lease(self.NAME, self.owner, self.lease_ttl):
+                    self._stop.wait(self.interval)
+                    continue
+                copied = self.replicate_once()
+                backoff = self.interval
+                if copied == self.batch_size:
+                    continue
+            except Exception as e:
+                backoff = min(backoff * 2, settings.SHEETS_MAX_BACKOFF)
+                logger.warning(f"Google Sheets 복제 실패, {backoff:.0f}초 후 재시도: {e}")
+            self._wakeup.wait(backoff)
+            self._wakeup.clear()
+    
+    def start(self) -> None:
+        """복제 스레드 시작"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sheets-replicator", daemon=True)
+        self._thread.start()
+        logger.info("Google Sheets 복제 시작")
+    
+    def stop(self, timeout: float = 10.0) -> None:
+        """복제 스레드 종료"""
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        try:
+            self.ledger.release_lease(self.NAME, self.owner)
+        except sqlite3.Error:
+            pass
+
+
+_ledger: Optional[QuoteLedger] = None
+_replicator: Optional[SheetsReplicator] = None
+_lock = threading.Lock()
+
+
+def get_ledger() -> QuoteLedger:
+    """설정 기반 공용 원장"""
+    global _ledger
+    with _lock:
+        if _ledger is None:
+            _ledger = QuoteLedger()
+        return _ledger
+
+
+def record_quote(
+    quote_id: str,
+    client_name: str,
+    client_email: str,
+    quote_json: Union[Quote, Dict[str, Any]]
+) -> int:
+    """
+    견적서를 원장에 기록하고 복제 작업에 알림 (호환성 함수)
+    
+    Args:
+        quote_id: 견적서 ID
+        client_name: 고객명
+        client_email: 고객 이메일
+        quote_json: 견적서 (Quote 또는 JSON 딕셔너리)
+    
+    Returns:
+        원장 행 ID
+    """
+    row_id = get_ledger().append(quote_id, client_name, client_email, quote_json)
+    if _replicator is not None:
+        _replicator.notify()
+    return row_id
+
+
+def start_replication() -> Optional[SheetsReplicator]:
+    """Google Sheets 복제 시작 (Sheets 설정이 없으면 None)"""
+    global _replicator
+    writer = get_sheets_writer()
+    if not writer.available:
+        logger.info("Google Sheets 설정이 없어 원장 복제를 시작하지 않습니다.")
+        return None
+    
+    ledger = get_ledger()
+    with _lock:
+        if _replicator is None:
+            _replicator = SheetsReplicator(ledger, writer)
+            _replicator.start()
+        return _replicator
+
+
+def stop_replication() -> None:
+    """Google Sheets 복제 종료"""
+    global _replicator
+    with _lock:
+        replicator, _replicator = _replicator, None
+    if replicator is not None:
+        replicator.stop()
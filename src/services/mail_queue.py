@@ -0,0 +1,442 @@
+"""
+발송 메일 스풀 (비동기 발송, 재시도, dead-letter)
+"""
+import glob
+import json
+import os
+import smtplib
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.config import settings
+from src.services.email_service import send_email
+from src.services.smtp_pool import SMTPDeliveryUnknown
+from src.utils.logger import logger
+from src.utils.metrics import EMAIL_FAILURES, MAIL_QUEUE_DEPTH, STAGE_SECONDS
+
+# 메시지 상태 (스풀 하위 디렉토리명)
+STATUS_PENDING = "pending"
+STATUS_SENDING = "sending"
+STATUS_SENT = "sent"
+STATUS_DEAD = "dead"
+# DATA 전송 후 연결이 끊겨 수신 여부를 알 수 없음 (중복 발송 방지를 위해 재시도하지 않음)
+STATUS_UNKNOWN = "unknown"
+STATUSES = (STATUS_PENDING, STATUS_SENDING, STATUS_SENT, STATUS_DEAD, STATUS_UNKNOWN)
+
+# 재시도해도 해결되지 않는 로컬 파일 오류 (첨부 PDF 없음 등)
+_FILE_ERRORS = (FileNotFoundError, IsADirectoryError, NotADirectoryError, PermissionError)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    재시도할 가치가 있는 발송 오류인지 판별
+    
+    연결 오류(연결 끊김, 타임아웃, DNS 등)와 SMTP 4xx 응답만 일시적 오류로 보고,
+    설정 누락, 첨부파일 없음, 5xx 응답 등은 영구 오류로 봅니다.
+    
+    Args:
+        error: 발송 중 발생한 예외
+    
+    Returns:
+        일시적 오류 여부
+    """
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        codes = [code for code, _ in error.recipients.values()]
+        return bool(codes) and all(400 <= code < 500 for code in codes)
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    if isinstance(error, (smtplib.SMTPException, *_FILE_ERRORS)):
+        return False
+    return isinstance(error, OSError)
+
+
+class MailQueue:
+    """
+    파일 기반 발송 메일 큐
+    
+    메시지는 스풀 디렉토리에 JSON 파일로 저장되며, 상태 전이는 디렉토리 간
+    원자적 rename으로 처리합니다. 따라서 여러 프로세스가 같은 스풀을 공유해도
+    한 메시지는 하나의 워커만 가져갑니다.
+    
+    파일명은 `{next_attempt_at(ms)}__{quote_id}__{message_id}.json` 형식입니다.
+    발송 예정 시각이 파일명 앞에 있으므로 pending 디렉토리를 이름순으로 훑다가
+    아직 때가 되지 않은 파일을 만나면 파일을 열지 않고 멈출 수 있습니다.
+    sent/dead 메시지는 보관 기간이 지나면 삭제합니다.
+    """
+    
+    def __init__(
+        self,
+        spool_dir: Optional[str] = None,
+        workers: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None
+    ):
+        """
+        초기화
+        
+        Args:
+            spool_dir: 스풀 디렉토리
+            workers: 발송 워커 스레드 수
+            max_attempts: 최대 시도 횟수 (초과 시 dead-letter)
+            base_delay: 재시도 기본 대기 시간(초)
+            max_delay: 재시도 최대 대기 시간(초)
+        """
+        self.spool_dir = spool_dir or settings.MAIL_SPOOL_DIR
+        self.workers = workers or settings.MAIL_QUEUE_WORKERS
+        self.max_attempts = max_attempts or settings.MAIL_MAX_ATTEMPTS
+        self.base_delay = base_delay or settings.MAIL_RETRY_BASE_DELAY
+        self.max_delay = max_delay or settings.MAIL_RETRY_MAX_DELAY
+        self.poll_interval = settings.MAIL_QUEUE_POLL_INTERVAL
+        self.retention = {
+            STATUS_SENT: settings.MAIL_SENT_RETENTION_SECONDS,
+            STATUS_DEAD: settings.MAIL_DEAD_RETENTION_SECONDS,
+            STATUS_UNKNOWN: settings.MAIL_DEAD_RETENTION_SECONDS,
+        }
+        self._next_prune = 0.0
+        self._prune_lock = threading.Lock()
+        
+        for status in STATUSES:
+            os.makedirs(self._dir(status), exist_ok=True)
+        
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+    
+    def _dir(self, status: str) -> str:
+        """상태별 디렉토리"""
+        return os.path.join(self.spool_dir, status)
+    
+    def _path(self, status: str, filename: str) -> str:
+        """상태별 메시지 파일 경로"""
+        return os.path.join(self._dir(status), filename)
+    
+    @staticmethod
+    def _filename(next_attempt_at: float, quote_id: str, message_id: str) -> str:
+        """발송 예정 시각이 포함된 메시지 파일명"""
+        return f"{int(next_attempt_at * 1000):013d}__{quote_id}__{message_id}.json"
+    
+    @staticmethod
+    def _parse_filename(filename: str) -> Optional[Tuple[float, str, str]]:
+        """
+        메시지 파일명 해석
+        
+        Args:
+            filename: 메시지 파일명
+        
+        Returns:
+            (발송 예정 시각, 견적서 ID, 메시지 ID), 메시지 파일이 아니면 None
+        """
+        if not filename.endswith(".json"):
+            return None
+        parts = filename[:-len(".json")].split("__")
+        if len(parts) != 3 or not parts[0].isdigit():
+            return None
+        return int(parts[0]) / 1000, parts[1], parts[2]
+    
+    @staticmethod
+    def _write(path: str, message: Dict[str, Any]) -> None:
+        """메시지 파일 원자적 기록"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(message, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    
+    @staticmethod
+    def _read(path: str) -> Dict[str, Any]:
+        """메시지 파일 읽기"""
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    
+    def enqueue(
+        self,
+        quote_id: str,
+        to_email: str,
+        client_name: str,
+        pdf_path: str,
+        subject: str,
+        body: str,
+        cc: Optional[List[str]] = None
+    ) -> str:
+        """
+        발송할 메일을 스풀에 저장
+        
+        Args:
+            quote_id: 견적서 ID
+            to_email: 수신자 이메일 주소
+            client_name: 고객명
+            pdf_path: 첨부할 PDF 파일 경로
+            subject: 이메일 제목
+            body: 이메일 본문
+            cc: 참조 수신자 목록 (선택)
+        
+        Returns:
+            메시지 ID
+        """
+        message_id = uuid.uuid4().hex
+        now = time.time()
+        message = {
+            "message_id": message_id,
+            "quote_id": quote_id,
+            "to_email": to_email,
+            "cc": list(cc or []),
+            "client_name": client_name,
+            "pdf_path": pdf_path,
+            "subject": subject,
+            "body": body,
+            "attempts": 0,
+            "next_attempt_at": now,
+            "created_at": now,
+            "updated_at": now,
+            "last_error": None,
+        }
+        filename = self._filename(now, quote_id, message_id)
+        self._write(self._path(STATUS_PENDING, filename), message)
+        self._wakeup.set()
+        logger.info(f"메일 발송 대기열 등록: {quote_id} -> {to_email}")
+        return message_id
+    
+    def status(self, quote_id: str) -> List[Dict[str, Any]]:
+        """
+        견적서 ID별 메일 발송 상태 조회
+        
+        Args:
+            quote_id: 견적서 ID
+        
+        Returns:
+            메시지별 상태 목록 (본문 제외)
+        """
+        results = []
+        pattern = f"*__{glob.escape(quote_id)}__*.json"
+        for status in STATUSES:
+            for path in glob.glob(os.path.join(glob.escape(self._dir(status)), pattern)):
+                try:
+                    message = self._read(path)
+                except (OSError, ValueError):
+                    # 상태 전이 중인 파일
+                    continue
+                results.append({
+                    "message_id": message["message_id"],
+                    "status": status,
+                    "to_email": message["to_email"],
+                    "attempts": message["attempts"],
+                    "last_error": message["last_error"],
+                    "created_at": datetime.fromtimestamp(message["created_at"]).isoformat(timespec="seconds"),
+                    "updated_at": datetime.fromtimestamp(message["updated_at"]).isoformat(timespec="seconds"),
+                })
+        return sorted(results, key=lambda m: m["created_at"])
+    
+    def depth(self) -> int:
+        """대기 중인 메시지 수"""
+        return sum(1 for name in os.listdir(self._dir(STATUS_PENDING)) if name.endswith(".json"))
+    
+    def _backoff(self, attempts: int) -> float:
+        """지수 백오프 대기 시간"""
+        return min(self.base_delay * (2 ** (attempts - 1)), self.max_delay)
+    
+    def _claim(self) -> Optional[str]:
+        """
+        발송 시각이 된 메시지 하나를 sending 상태로 가져오기
+        
+        Returns:
+            sending 디렉토리의 파일명, 없으면 None
+        """
+        now = time.time()
+        for filename in sorted(os.listdir(self._dir(STATUS_PENDING))):
+            parsed = self._parse_filename(filename)
+            if parsed is None:
+                continue
+            if parsed[0] > now:
+                # 이후 파일은 모두 발송 예정 시각이 더 늦음
+                break
+            pending_path = self._path(STATUS_PENDING, filename)
+            sending_path = self._path(STATUS_SENDING, filename)
+            try:
+                os.rename(pending_path, sending_path)
+                # 가져간 시각 기록 (recover의 stale 판정 기준)
+                os.utime(sending_path)
+            except OSError:
+                # 다른 워커가 먼저 가져감
+                continue
+            return filename
+        return None
+    
+    def _deliver(self, filename: str) -> None:
+        """메시지 발송 및 결과에 따른 상태 전이"""
+        sending_path = self._path(STATUS_SENDING, filename)
+        message = self._read(sending_path)
+        message["attempts"] += 1
+        message["updated_at"] = time.time()
+        
+        try:
+            with STAGE_SECONDS.time(stage="smtp"):
+                send_email(
+                    to_email=message["to_email"],
+                    client_name=message["client_name"],
+                    pdf_path=message["pdf_path"],
+                    subject=message["subject"],
+                    body=message["body"],
+                    cc=message.get("cc")
+                )
+        except SMTPDeliveryUnknown as e:
+            # 서버가 이미 받았을 수 있으므로 다시 보내지 않고 확인 대상으로 남김
+            message["last_error"] = str(e)
+            EMAIL_FAILURES.inc(final="true")
+            self._write(sending_path, message)
+            os.replace(sending_path, self._path(STATUS_UNKNOWN, filename))
+            logger.error(f"메일 발송 여부 확인 불가 (재시도 안 함): {message['quote_id']}: {e}")
+            return
+        except Exception as e:
+            message["last_error"] = str(e)
+            transient = is_transient_error(e)
+            if not transient or message["attempts"] >= self.max_attempts:
+                EMAIL_FAILURES.inc(final="true")
+                self._write(sending_path, message)
+                os.replace(sending_path, self._path(STATUS_DEAD, filename))
+                reason = f"{message['attempts']}회 시도" if transient else "재시도 불가 오류"
+                logger.error(
+                    f"메일 발송 최종 실패 (dead-letter): {message['quote_id']} ({reason}): {e}"
+                )
+                return
+            EMAIL_FAILURES.inc(final="false")
+            delay = self._backoff(message["attempts"])
+            message["next_attempt_at"] = time.time() + delay
+            self._write(sending_path, message)
+            retry_filename = self._filename(
+                message["next_attempt_at"], message["quote_id"], message["message_id"]
+            )
+            os.replace(sending_path, self._path(STATUS_PENDING, retry_filename))
+            logger.warning(
+                f"메일 발송 실패, {delay:.0f}초 후 재시도: {message['quote_id']} "
+                f"({message['attempts']}/{self.max_attempts}): {e}"
+            )
+            return
+        
+        message["last_error"] = None
+        self._write(sending_path, message)
+        os.replace(sending_path, self._path(STATUS_SENT, filename))
+    
+    def recover(self) -> int:
+        """
+        중단된 sending 메시지를 pending으로 복구
+        
+        프로세스가 발송 도중 종료된 경우를 위해, 일정 시간 이상 갱신되지 않은
+        sending 메시지를 다시 대기열로 돌려놓습니다.
+        
+        Returns:
+            복구한 메시지 수
+        """
+        recovered = 0
+        stale_before = time.time() - settings.MAIL_SENDING_STALE_SECONDS
+        for filename in os.listdir(self._dir(STATUS_SENDING)):
+            sending_path = self._path(STATUS_SENDING, filename)
+            try:
+                if os.path.getmtime(sending_path) > stale_before:
+                    continue
+                os.rename(sending_path, self._path(STATUS_PENDING, filename))
+                recovered += 1
+            except OSError:
+                continue
+        if recovered:
+            logger.info(f"중단된 메일 {recovered}건을 대기열로 복구했습니다.")
+        return recovered
+    
+    def prune(self) -> int:
+        """
+        보관 기간이 지난 sent/dead 메시지 삭제
+        
+        MAIL_SENT_RETENTION_SECONDS / MAIL_DEAD_RETENTION_SECONDS가 0이면
+        해당 상태는 삭제하지 않습니다.
+        
+        Returns:
+            삭제한 메시지 수
+        """
+        removed = 0
+        now = time.time()
+        for status, retention in self.retention.items():
+            if retention <= 0:
+                continue
+            directory = self._dir(status)
+            for filename in os.listdir(directory):
+                path = os.path.join(directory, filename)
+                try:
+                    # 상태 전이 직전에 기록하므로 mtime이 sent/dead로 옮겨진 시각
+                    if os.path.getmtime(path) > now - retention:
+                        continue
+                    os.remove(path)
+                    removed += 1
+                except OSError:
+                    continue
+        if removed:
+            logger.info(f"보관 기간이 지난 메일 {removed}건을 삭제했습니다.")
+        return removed
+    
+    def _maybe_prune(self) -> None:
+        """워커 중 하나만 주기적으로 prune 실행"""
+        now = time.time()
+        if now < self._next_prune or not self._prune_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_prune = now + settings.MAIL_PRUNE_INTERVAL
+            self.prune()
+        finally:
+            self._prune_lock.release()
+    
+    def _worker(self) -> None:
+        """발송 워커 루프"""
+        while not self._stop.is_set():
+            try:
+                self._maybe_prune()
+                filename = self._claim()
+                if filename is None:
+                    self._wakeup.wait(self.poll_interval)
+                    self._wakeup.clear()
+                    continue
+                self._deliver(filename)
+            except Exception as e:
+                logger.error(f"메일 큐 워커 오류: {e}", exc_info=True)
+                self._stop.wait(self.poll_interval)
+    
+    def start(self) -> None:
+        """발송 워커 시작"""
+        if self._threads:
+            return
+        self._stop.clear()
+        self.recover()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"mail-queue-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"메일 발송 워커 {self.workers}개 시작: {self.spool_dir}")
+    
+    def stop(self, timeout: float = 5.0) -> None:
+        """발송 워커 종료 (대기 중인 메시지는 스풀에 남음)"""
+        self._stop.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+
+_queue: Optional[MailQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_mail_queue() -> MailQueue:
+    """설정 기반 공용 메일 큐"""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = MailQueue()
+        return _queue
+
+
+# 대기열 길이 게이지 (수집 시점에 읽음)
+MAIL_QUEUE_DEPTH.set_function(lambda: _queue.depth() if _queue else 0)
@@ -2,7 +2,8 @@
 PDF 생성 서비스
 """
 import os
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, BinaryIO, Union
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import mm
@@ -14,7 +15,23 @@ from reportlab.pdfbase.ttfonts import TTFont
 from datetime import datetime
 
 from src.config import settings
+from src.core.quote_model import Quote
+from src.utils.deadline import DeadlineExceeded, check_deadline
+from src.services.quote_sections import (
+    DOCUMENT_TITLE,
+    SECTION_TITLES,
+    LABEL_CLIENT_NAME,
+    LABEL_ISSUE_DATE,
+    LABEL_DELIVERY_DAYS,
+    LABEL_MILESTONES,
+    LABEL_ASSUMPTIONS,
+    LABEL_EXCLUSIONS,
+    PRICING_HEADER,
+    PRICING_LABELS,
+    ISSUE_DATE_FORMAT,
+)
 from src.utils.logger import logger
+from src.utils.scheduler import scheduled
 
 # 한글 폰트 등록
 FONT_NAME = "NotoSansKR"
@@ -28,22 +45,42 @@ _project_root = os.path.dirname(os.path.dirname(_current_dir))
 FONT_PATH = os.path.join(_project_root, "fonts", "NotoSansKR-Regular.ttf")
 FONT_BOLD_PATH = os.path.join(_project_root, "fonts", "NotoSansKR-Bold.ttf")
 
-try:
-    if os.path.exists(FONT_PATH):
-        pdfmetrics.registerFont(TTFont(FONT_NAME, FONT_PATH))
-        FONT_REGISTERED = True
-        logger.info(f"한글 폰트 등록 완료: {FONT_PATH}")
-    else:
-        logger.warning(f"한글 폰트 파일이 없습니다: {FONT_PATH}")
-        logger.warning("한글 폰트 파일이 없어 한글이 깨질 수 있습니다.")
+_fonts_loaded = False
+_font_lock = threading.Lock()
+
+
+def register_fonts() -> None:
+    """
+    한글 폰트 등록 (최초 PDF 생성 시 1회)
     
-    if os.path.exists(FONT_BOLD_PATH):
-        pdfmetrics.registerFont(TTFont(FONT_BOLD_NAME, FONT_BOLD_PATH))
-        FONT_BOLD_REGISTERED = True
-        logger.info(f"한글 Bold 폰트 등록 완료: {FONT_BOLD_PATH}")
-except Exception as e:
-    logger.warning(f"한글 폰트 등록 실패: {e}")
-    logger.warning("한글 폰트 파일이 없어 한글이 깨질 수 있습니다.")
+    TTF 파싱 비용이 크므로 모듈 import 시점이 아닌 첫 사용 시점(또는
+    시작 후 백그라운드 warm-up)에 등록합니다.
+    """
+    global FONT_REGISTERED, FONT_BOLD_REGISTERED, _fonts_loaded
+    if _fonts_loaded:
+        return
+    
+    with _font_lock:
+        if _fonts_loaded:
+            return
+        try:
+            if os.path.exists(FONT_PATH):
+                pdfmetrics.registerFont(TTFont(FONT_NAME, FONT_PATH))
+                FONT_REGISTERED = True
+                logger.info(f"한글 폰트 등록 완료: {FONT_PATH}")
+            else:
+                logger.warning(f"한글 폰트 파일이 없습니다: {FONT_PATH}")
+                logger.warning("한글 폰트 파일이 없어 한글이 깨질 수 있습니다.")
+            
+            if os.path.exists(FONT_BOLD_PATH):
+                pdfmetrics.registerFont(TTFont(FONT_BOLD_NAME, FONT_BOLD_PATH))
+                FONT_BOLD_REGISTERED = True
+                logger.info(f"한글 Bold 폰트 등록 완료: {FONT_BOLD_PATH}")
+        except Exception as e:
+            logger.warning(f"한글 폰트 등록 실패: {e}")
+            logger.warning("한글 폰트 파일이 없어 한글이 깨질 수 있습니다.")
+        finally:
+            _fonts_loaded = True
 
 
 class PDFService:
@@ -56,6 +93,7 @@ class PDFService:
     
     def _create_styles(self) -> Dict[str, ParagraphStyle]:
         """스타일 생성"""
+        register_fonts()
         styles = getSampleStyleSheet()
         font_name = FONT_NAME if FONT_REGISTERED else "Helvetica"
         
@@ -88,13 +126,13 @@ class PDFService:
             )
         }
     
-    def _build_content(self, quote_json: Dict[str, Any], client_name: str) -> list:
+    def _build_content(self, quote: Quote, client_name: str) -> list:
         """PDF 내용 구성"""
         styles = self._create_styles()
         story = []
         
         # 제목
-        story.append(Paragraph("견적서", styles['title']))
+        story.append(Paragraph(DOCUMENT_TITLE, styles['title']))
         story.append(Spacer(1, 10*mm))
         
         # 고객 정보
@@ -117,57 +155,54 @@ class PDFService:
             leading=14
         )
         
-        story.append(Paragraph(f"<font name=\"{FONT_BOLD_NAME if FONT_BOLD_REGISTERED else (FONT_NAME if FONT_REGISTERED else 'Helvetica-Bold')}\"><b>고객명:</b></font> <font name=\"{FONT_NAME if FONT_REGISTERED else 'Helvetica'}\">{client_name_escaped}</font>", styles['normal']))
+        story.append(Paragraph(f"<font name=\"{FONT_BOLD_NAME if FONT_BOLD_REGISTERED else (FONT_NAME if FONT_REGISTERED else 'Helvetica-Bold')}\"><b>{LABEL_CLIENT_NAME}</b></font> <font name=\"{FONT_NAME if FONT_REGISTERED else 'Helvetica'}\">{client_name_escaped}</font>", styles['normal']))
         story.append(Paragraph(
-            f"<b>발행일:</b> {datetime.now().strftime('%Y년 %m월 %d일')}",
+            f"<b>{LABEL_ISSUE_DATE}</b> {datetime.now().strftime(ISSUE_DATE_FORMAT)}",
             styles['normal']
         ))
         story.append(Spacer(1, 5*mm))
         
         # 프로젝트 개요
-        story.append(Paragraph("1. 프로젝트 개요", styles['heading']))
-        story.append(Paragraph(quote_json.get("project_summary", ""), styles['normal']))
+        story.append(Paragraph(SECTION_TITLES["overview"], styles['heading']))
+        story.append(Paragraph(quote.project_summary, styles['normal']))
         story.append(Spacer(1, 5*mm))
         
         # 작업 범위
-        story.append(Paragraph("2. 작업 범위", styles['heading']))
-        for item in quote_json.get("scope", []):
+        story.append(Paragraph(SECTION_TITLES["scope"], styles['heading']))
+        for item in quote.scope:
             story.append(Paragraph(f"• {item}", styles['normal']))
         story.append(Spacer(1, 5*mm))
         
         # 산출물
-        if quote_json.get("deliverables"):
-            story.append(Paragraph("3. 산출물", styles['heading']))
-            for item in quote_json.get("deliverables", []):
+        if quote.deliverables:
+            story.append(Paragraph(SECTION_TITLES["deliverables"], styles['heading']))
+            for item in quote.deliverables:
                 story.append(Paragraph(f"• {item}", styles['normal']))
             story.append(Spacer(1, 5*mm))
         
         # 일정
-        story.append(Paragraph("4. 일정", styles['heading']))
-        delivery_days = quote_json.get("delivery_days", 0)
+        story.append(Paragraph(SECTION_TITLES["schedule"], styles['heading']))
         story.append(Paragraph(
-            f"예상 소요 기간: <b>{delivery_days}일</b>",
+            f"{LABEL_DELIVERY_DAYS} <b>{quote.delivery_days}일</b>",
             styles['normal']
         ))
         
-        milestones = quote_json.get("milestones", [])
+        milestones = quote.milestones
         if milestones:
             story.append(Spacer(1, 3*mm))
-            story.append(Paragraph("<b>주요 마일스톤:</b>", styles['normal']))
+            story.append(Paragraph(f"<b>{LABEL_MILESTONES}</b>", styles['normal']))
             for milestone in milestones:
                 story.append(Paragraph(f"• {milestone}", styles['normal']))
         story.append(Spacer(1, 5*mm))
         
         # 견적
-        story.append(Paragraph("5. 견적", styles['heading']))
-        pricing = quote_json.get("pricing", {})
+        story.append(Paragraph(SECTION_TITLES["pricing"], styles['heading']))
+        pricing = quote.pricing
         
-        pricing_data = [
-            ['항목', '금액'],
-            ['공급가액', f"{pricing.get('subtotal', 0):,}원"],
-            ['부가세 (10%)', f"{pricing.get('vat', 0):,}원"],
-            ['합계', f"<b>{pricing.get('total', 0):,}원</b>"]
-        ]
+        pricing_data = [list(PRICING_HEADER)]
+        for key, label in PRICING_LABELS:
+            amount = f"{getattr(pricing, key):,}원"
+            pricing_data.append([label, f"<b>{amount}</b>" if key == "total" else amount])
         
         table_header_font = FONT_BOLD_NAME if FONT_BOLD_REGISTERED else (FONT_NAME if FONT_REGISTERED else "Helvetica-Bold")
         table_normal_font = FONT_NAME if FONT_REGISTERED else "Helvetica"
@@ -190,43 +225,69 @@ class PDFService:
         story.append(Spacer(1, 5*mm))
         
         # 가정사항 및 제외사항
-        assumptions = quote_json.get("assumptions", [])
-        exclusions = quote_json.get("exclusions", [])
+        assumptions = quote.assumptions
+        exclusions = quote.exclusions
         
         if assumptions or exclusions:
-            story.append(Paragraph("6. 기타 사항", styles['heading']))
+            story.append(Paragraph(SECTION_TITLES["other"], styles['heading']))
             
             if assumptions:
-                story.append(Paragraph("<b>가정사항:</b>", styles['normal']))
+                story.append(Paragraph(f"<b>{LABEL_ASSUMPTIONS}</b>", styles['normal']))
                 for item in assumptions:
                     story.append(Paragraph(f"• {item}", styles['normal']))
                 story.append(Spacer(1, 3*mm))
             
             if exclusions:
-                story.append(Paragraph("<b>제외사항:</b>", styles['normal']))
+                story.append(Paragraph(f"<b>{LABEL_EXCLUSIONS}</b>", styles['normal']))
                 for item in exclusions:
                     story.append(Paragraph(f"• {item}", styles['normal']))
                 story.append(Spacer(1, 5*mm))
         
         # 면책 문구
-        story.append(Paragraph("7. 면책 사항", styles['heading']))
-        disclaimer = quote_json.get("disclaimer", "")
-        story.append(Paragraph(disclaimer, styles['normal']))
+        story.append(Paragraph(SECTION_TITLES["disclaimer"], styles['heading']))
+        story.append(Paragraph(quote.disclaimer, styles['normal']))
         story.append(Spacer(1, 5*mm))
         
         # 리스크
-        risks = quote_json.get("risks", [])
+        risks = quote.risks
         if risks:
-            story.append(Paragraph("8. 주요 리스크", styles['heading']))
+            story.append(Paragraph(SECTION_TITLES["risks"], styles['heading']))
             for risk in risks:
                 story.append(Paragraph(f"• {risk}", styles['normal']))
             story.append(Spacer(1, 5*mm))
         
         return story
     
+    def render(
+        self,
+        quote_json: Union[Quote, Dict[str, Any]],
+        client_name: str,
+        target: Union[str, BinaryIO]
+    ) -> None:
+        """
+        견적서를 지정한 경로 또는 파일 객체에 렌더링
+        
+        Args:
+            quote_json: 견적서 (Quote 또는 JSON 딕셔너리)
+            client_name: 고객명
+            target: 출력 파일 경로 또는 바이너리 파일 객체
+        """
+        doc = SimpleDocTemplate(
+            target,
+            pagesize=A4,
+            rightMargin=20*mm,
+            leftMargin=20*mm,
+            topMargin=20*mm,
+            bottomMargin=20*mm
+        )
+        
+        story = self._build_content(Quote.coerce(quote_json), client_name)
+        check_deadline("pdf.build")
+        doc.build(story)
+    
     def generate(
         self,
-        quote_json: Dict[str, Any],
+        quote_json: Union[Quote, Dict[str, Any]],
         client_name: str,
         filename: str
     ) -> str:
@@ -234,44 +295,39 @@ class PDFService:
         PDF 생성
         
         Args:
-            quote_json: 견적서 JSON 딕셔너리
+            quote_json: 견적서 (Quote 또는 JSON 딕셔너리)
             client_name: 고객명
             filename: 파일명
         
         Returns:
             생성된 PDF 파일 경로
         """
+        check_deadline("pdf")
         output_path = os.path.join(self.output_dir, filename)
         
         logger.info(f"PDF 생성 시작: {output_path}")
         
         try:
-            doc = SimpleDocTemplate(
-                output_path,
-                pagesize=A4,
-                rightMargin=20*mm,
-                leftMargin=20*mm,
-                topMargin=20*mm,
-                bottomMargin=20*mm
-            )
-            
-            story = self._build_content(quote_json, client_name)
-            doc.build(story)
+            # 렌더링 동시 실행 수 제한 (요청 우선순위에 따라 자리 배정)
+            with scheduled("pdf"):
+                self.render(quote_json, client_name, output_path)
             
             logger.info(f"PDF 생성 완료: {output_path}")
             return output_path
-            
+        
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"PDF 생성 중 오류 발생: {e}", exc_info=True)
             raise
 
 
-def generate_pdf(quote_json: Dict[str, Any], output_path: str, client_name: str) -> str:
+def generate_pdf(quote_json: Union[Quote, Dict[str, Any]], output_path: str, client_name: str) -> str:
     """
     PDF 생성 (호환성 함수)
     
     Args:
-        quote_json: 견적서 JSON 딕셔너리
+        quote_json: 견적서 (Quote 또는 JSON 딕셔너리)
         output_path: PDF 저장 경로
         client_name: 고객명
     
@@ -0,0 +1,146 @@
+"""
+견적서 HTML 미리보기 서비스
+"""
+from datetime import datetime
+from html import escape
+from typing import Any, Dict, List, Sequence, Union
+
+from src.core.quote_model import Quote
+from src.services.quote_sections import (
+    DOCUMENT_TITLE,
+    SECTION_TITLES,
+    LABEL_CLIENT_NAME,
+    LABEL_ISSUE_DATE,
+    LABEL_DELIVERY_DAYS,
+    LABEL_MILESTONES,
+    LABEL_ASSUMPTIONS,
+    LABEL_EXCLUSIONS,
+    PRICING_HEADER,
+    PRICING_LABELS,
+    ISSUE_DATE_FORMAT,
+)
+
+# PDF 스타일(pdf_service._create_styles)과 맞춘 인라인 CSS
+_STYLE = (
+    "<style>"
+    "body{font-family:'Noto Sans KR',sans-serif;font-size:10pt;line-height:1.4;"
+    "max-width:170mm;margin:20mm auto;color:#000}"
+    "h1{font-size:18pt;color:#2c3e50;text-align:center;margin-bottom:10mm}"
+    "h2{font-size:14pt;color:#34495e;margin:12pt 0 8pt}"
+    "ul{margin:0;padding-left:1.2em}"
+    "table{border-collapse:collapse;width:170mm}"
+    "th,td{border:1px solid #000;padding:4pt 6pt;text-align:left}"
+    "th{background:#3498db;color:#f5f5f5;font-size:11pt}"
+    "tr:nth-child(odd) td{background:#f8f9fa}"
+    "</style>"
+)
+
+_HEAD = f'<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>{DOCUMENT_TITLE}</title>{_STYLE}</head><body>'
+_TAIL = "</body></html>"
+_H2 = {key: f"<h2>{escape(title)}</h2>" for key, title in SECTION_TITLES.items()}
+_PRICING_HEAD = f"<table><tr><th>{PRICING_HEADER[0]}</th><th>{PRICING_HEADER[1]}</th></tr>"
+
+
+def _list_html(items: Sequence[str]) -> str:
+    """항목 배열을 <ul> 목록으로 변환"""
+    return "<ul>" + "".join(f"<li>{escape(item)}</li>" for item in items) + "</ul>"
+
+
+def _amount(value: int) -> str:
+    """금액 포맷 (PDF와 동일하게 천 단위 구분)"""
+    return f"{value:,}원"
+
+
+class PreviewService:
+    """견적서 HTML 미리보기 서비스"""
+    
+    def render(self, quote_json: Union[Quote, Dict[str, Any]], client_name: str) -> str:
+        """
+        견적서 JSON을 HTML로 렌더링
+        
+        PDFService._build_content와 같은 섹션 구조/순서를 따르며,
+        실제 발송 전 미리보기 용도로 사용합니다.
+        
+        Args:
+            quote_json: 견적서 (Quote 또는 JSON 딕셔너리)
+            client_name: 고객명
+        
+        Returns:
+            HTML 문자열
+        """
+        quote = Quote.coerce(quote_json)
+        parts: List[str] = [_HEAD, f"<h1>{DOCUMENT_TITLE}</h1>"]
+        
+        # 고객 정보
+        parts.append(f"<p><b>{LABEL_CLIENT_NAME}</b> {escape(str(client_name or ''))}</p>")
+        parts.append(f"<p><b>{LABEL_ISSUE_DATE}</b> {datetime.now().strftime(ISSUE_DATE_FORMAT)}</p>")
+        
+        # 프로젝트 개요
+        parts.append(_H2["overview"])
+        parts.append(f"<p>{escape(quote.project_summary)}</p>")
+        
+        # 작업 범위
+        parts.append(_H2["scope"])
+        parts.append(_list_html(quote.scope))
+        
+        # 산출물
+        if quote.deliverables:
+            parts.append(_H2["deliverables"])
+            parts.append(_list_html(quote.deliverables))
+        
+        # 일정
+        parts.append(_H2["schedule"])
+        parts.append(f"<p>{LABEL_DELIVERY_DAYS} <b>{quote.delivery_days}일</b></p>")
+        milestones = quote.milestones
+        if milestones:
+            parts.append(f"<p><b>{LABEL_MILESTONES}</b></p>")
+            parts.append(_list_html(milestones))
+        
+        # 견적
+        parts.append(_H2["pricing"])
+        parts.append(_PRICING_HEAD)
+        for key, label in PRICING_LABELS:
+            amount = _amount(getattr(quote.pricing, key))
+            if key == "total":
+                amount = f"<b>{amount}</b>"
+            parts.append(f"<tr><td>{label}</td><td>{amount}</td></tr>")
+        parts.append("</table>")
+        
+        # 가정사항 및 제외사항
+        assumptions = quote.assumptions
+        exclusions = quote.exclusions
+        if assumptions or exclusions:
+            parts.append(_H2["other"])
+            if assumptions:
+                parts.append(f"<p><b>{LABEL_ASSUMPTIONS}</b></p>")
+                parts.append(_list_html(assumptions))
+            if exclusions:
+                parts.append(f"<p><b>{LABEL_EXCLUSIONS}</b></p>")
+                parts.append(_list_html(exclusions))
+        
+        # 면책 문구
+        parts.append(_H2["disclaimer"])
+        parts.append(f"<p>{escape(quote.disclaimer)}</p>")
+        
+        # 리스크
+        risks = quote.risks
+        if risks:
+            parts.append(_H2["risks"])
+            parts.append(_list_html(risks))
+        
+        parts.append(_TAIL)
+        return "".join(parts)
+
+
+def render_preview(quote_json: Union[Quote, Dict[str, Any]], client_name: str) -> str:
+    """
+    견적서 HTML 미리보기 렌더링 (호환성 함수)
+    
+    Args:
+        quote_json: 견적서 (Quote 또는 JSON 딕셔너리)
+        client_name: 고객명
+    
+    Returns:
+        HTML 문자열
+    """
+    return PreviewService().render(quote_json, client_name)
@@ -0,0 +1,35 @@
+"""
+견적서 섹션 구조 정의 (PDF / HTML 미리보기 공통)
+"""
+
+DOCUMENT_TITLE = "견적서"
+
+# 섹션 제목 (번호는 섹션 유무와 관계없이 고정)
+SECTION_TITLES = {
+    "overview": "1. 프로젝트 개요",
+    "scope": "2. 작업 범위",
+    "deliverables": "3. 산출물",
+    "schedule": "4. 일정",
+    "pricing": "5. 견적",
+    "other": "6. 기타 사항",
+    "disclaimer": "7. 면책 사항",
+    "risks": "8. 주요 리스크",
+}
+
+# 항목 라벨
+LABEL_CLIENT_NAME = "고객명:"
+LABEL_ISSUE_DATE = "발행일:"
+LABEL_DELIVERY_DAYS = "예상 소요 기간:"
+LABEL_MILESTONES = "주요 마일스톤:"
+LABEL_ASSUMPTIONS = "가정사항:"
+LABEL_EXCLUSIONS = "제외사항:"
+
+# 견적 표 라벨
+PRICING_HEADER = ("항목", "금액")
+PRICING_LABELS = (
+    ("subtotal", "공급가액"),
+    ("vat", "부가세 (10%)"),
+    ("total", "합계"),
+)
+
+ISSUE_DATE_FORMAT = "%Y년 %m월 %d일"
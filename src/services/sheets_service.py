@@ -1,21 +1,306 @@
 """
 Google Sheets 로그 서비스
 """
+import importlib.util
 import os
-from typing import Optional
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
 from datetime import datetime
 
 from src.config import settings
+from src.core.quote_model import Quote
+from src.utils.deadline import check_deadline
 from src.utils.logger import logger
+from src.utils.metrics import SHEETS_BUFFER_ROWS, SHEETS_FAILURES, STAGE_SECONDS
 
-try:
-    import gspread
-    from google.oauth2.service_account import Credentials
-    GSPREAD_AVAILABLE = True
-except ImportError:
-    GSPREAD_AVAILABLE = False
+# gspread/google-auth는 첫 인증 시점에 불러옴 (설치 여부만 확인)
+GSPREAD_AVAILABLE = importlib.util.find_spec("gspread") is not None
+if not GSPREAD_AVAILABLE:
     logger.warning("gspread가 설치되지 않았습니다. Google Sheets 로깅이 비활성화됩니다.")
 
+SCOPES = [
+    'https://spreadsheets.google.com/feeds',
+    'https://www.googleapis.com/auth/drive'
+]
+
+
+def build_row(
+    client_name: str,
+    client_email: str,
+    quote_json: Union[Quote, Dict[str, Any]],
+    created_at: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    시트 헤더명 기준의 로그 행 생성
+    
+    Args:
+        client_name: 고객명
+        client_email: 고객 이메일
+        quote_json: 견적서 (Quote 또는 JSON 딕셔너리)
+        created_at: 생성 시각 (기본값: 현재 시각)
+    
+    Returns:
+        헤더명 -> 값 딕셔너리
+    """
+    quote = Quote.coerce(quote_json)
+    now = (created_at or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
+    pricing = quote.pricing
+    
+    return {
+        "시간": now,
+        "고객명": client_name,
+        "이메일": client_email,
+        "요청요약": quote.project_summary,
+        "작업범위": "\n".join(quote.scope),
+        "공급가": pricing.subtotal,
+        "부가세": pricing.vat,
+        "합계": pricing.total,
+        "통화": pricing.currency,
+        "소요일수": quote.delivery_days
+    }
+
+
+def _is_quota_error(error: Exception) -> bool:
+    """Sheets API 할당량 초과(429) 여부"""
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) == 429
+
+
+class SheetsWriter:
+    """
+    Google Sheets 배치 기록기
+    
+    인증과 워크시트 핸들은 한 번만 만들어 재사용하고, 1행 헤더는
+    SHEETS_HEADER_TTL 동안 캐시합니다. 기록할 행은 버퍼에 모았다가
+    배치 크기 또는 주기에 도달하면 append_rows 한 번으로 기록합니다.
+    """
+    
+    def __init__(
+        self,
+        sheet_id: Optional[str] = None,
+        service_account_file: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        client_factory: Optional[Callable[[], Any]] = None
+    ):
+        """
+        초기화
+        
+        Args:
+            sheet_id: Google Sheets ID
+            service_account_file: 서비스 계정 키 파일 경로
+            batch_size: 한 번에 기록할 최대 행 수
+            flush_interval: 버퍼 기록 주기(초)
+            client_factory: gspread 클라이언트 생성 함수 (기본값: 서비스 계정 인증)
+        """
+        self.sheet_id = sheet_id or settings.GOOGLE_SHEET_ID
+        self.service_account_file = service_account_file or settings.GOOGLE_SERVICE_ACCOUNT_FILE
+        self.batch_size = batch_size or settings.SHEETS_BATCH_SIZE
+        self.flush_interval = flush_interval or settings.SHEETS_FLUSH_INTERVAL
+        self.header_ttl = settings.SHEETS_HEADER_TTL
+        self.max_buffer = settings.SHEETS_MAX_BUFFER
+        self.client_factory = client_factory or self._authorize
+        self._custom_client = client_factory is not None
+        
+        self._client = None
+        self._worksheet = None
+        self._headers: List[str] = []
+        self._headers_loaded_at = 0.0
+        self._api_lock = threading.Lock()
+        
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._buffer_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def available(self) -> bool:
+        """기록 가능 여부 (패키지, 시트 ID, 키 파일)"""
+        if self._custom_client:
+            return bool(self.sheet_id)
+        return GSPREAD_AVAILABLE and bool(self.sheet_id) and os.path.exists(self.service_account_file)
+    
+    @property
+    def pending(self) -> int:
+        """버퍼에 남은 행 수"""
+        return len(self._buffer)
+    
+    def _authorize(self):
+        """서비스 계정으로 gspread 클라이언트 생성"""
+        import gspread
+        from google.oauth2.service_account import Credentials
+        
+        creds = Credentials.from_service_account_file(
+            self.service_account_file,
+            scopes=SCOPES
+        )
+        return gspread.authorize(creds)
+    
+    def _get_worksheet(self):
+        """캐시된 워크시트 핸들"""
+        if self._worksheet is None:
+            if self._client is None:
+                self._client = self.client_factory()
+            self._worksheet = self._client.open_by_key(self.sheet_id).sheet1
+        return self._worksheet
+    
+    def _get_headers(self, force: bool = False) -> List[str]:
+        """캐시된 1행 헤더 (TTL 경과 또는 force 시 다시 읽기)"""
+        if force or not self._headers or time.monotonic() - self._headers_loaded_at > self.header_ttl:
+            headers = self._get_worksheet().row_values(1)
+            if not headers:
+                raise ValueError("Google Sheets 에러: 시트의 1행 헤더를 읽을 수 없습니다.")
+            if headers != self._headers:
+                logger.info(f"Google Sheets 헤더 확인: {headers}")
+            self._headers = headers
+            self._headers_loaded_at = time.monotonic()
+        return self._headers
+    
+    def invalidate(self) -> None:
+        """워크시트 핸들과 헤더 캐시 무효화"""
+        self._worksheet = None
+        self._headers = []
+    
+    def write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        행 목록을 append_rows 한 번으로 기록 (동기)
+        
+        할당량 초과가 아닌 API 오류가 나면 헤더/워크시트 캐시를 비워
+        다음 기록 시 시트 구조 변경을 반영합니다.
+        
+        Args:
+            rows: build_row로 만든 행 목록
+        
+        Raises:
+            Exception: 기록 실패
+        """
+        if not rows:
+            return
+        with self._api_lock, STAGE_SECONDS.time(stage="sheets"):
+            try:
+                headers = self._get_headers()
+                values = [[row.get(h, "") for h in headers] for row in rows]
+                self._get_worksheet().append_rows(values)
+            except Exception as e:
+                if _is_quota_error(e):
+                    SHEETS_FAILURES.inc(reason="quota")
+                else:
+                    SHEETS_FAILURES.inc(reason="error")
+                    self.invalidate()
+                raise
+    
+    def enqueue(self, row: Dict[str, Any]) -> None:
+        """
+        행을 버퍼에 추가 (백그라운드에서 배치 기록)
+        
+        Args:
+            row: build_row로 만든 행
+        """
+        with self._buffer_lock:
+            if len(self._buffer) >= self.max_buffer:
+                self._buffer.popleft()
+                logger.warning("Google Sheets 버퍼가 가득 차 가장 오래된 행을 버립니다.")
+            self._buffer.append(row)
+            size = len(self._buffer)
+        self.start()
+        if size >= self.batch_size:
+            self._wakeup.set()
+    
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        """버퍼에서 배치 하나 꺼내기"""
+        with self._buffer_lock:
+            count = min(len(self._buffer), self.batch_size)
+            return [self._buffer.popleft() for _ in range(count)]
+    
+    def _requeue(self, rows: List[Dict[str, Any]]) -> None:
+        """기록 실패한 행을 버퍼 앞쪽으로 되돌리기"""
+        with self._buffer_lock:
+            self._buffer.extendleft(reversed(rows))
+    
+    def flush(self) -> bool:
+        """
+        버퍼의 모든 행 기록
+        
+        Returns:
+            전부 기록했으면 True, 실패하여 행이 버퍼에 남았으면 False
+        """
+        while True:
+            rows = self._take_batch()
+            if not rows:
+                return True
+            try:
+                self.write_rows(rows)
+                logger.info(f"Google Sheets에 로그 {len(rows)}건 기록 완료")
+            except Exception as e:
+                self._requeue(rows)
+                if _is_quota_error(e):
+                    logger.warning(f"Google Sheets 할당량 초과, 나중에 다시 기록합니다: {e}")
+                else:
+                    logger.error(f"Google Sheets 로깅 중 오류 발생: {str(e)}", exc_info=True)
+                return False
+    
+    def _run(self) -> None:
+        """백그라운드 기록 루프 (실패 시 지수 백오프)"""
+        backoff = self.flush_interval
+        while not self._stop.is_set():
+            self._wakeup.wait(backoff)
+            self._wakeup.clear()
+            if self.flush():
+                backoff = self.flush_interval
+            else:
+                backoff = min(backoff * 2, settings.SHEETS_MAX_BACKOFF)
+    
+    def start(self) -> None:
+        """백그라운드 기록 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._thread is not None:
+            return
+        with self._buffer_lock:
+            if self._thread is None:
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="sheets-writer", daemon=True)
+                self._thread.start()
+    
+    def stop(self, timeout: float = 10.0) -> None:
+        """백그라운드 스레드 종료 후 남은 행 기록"""
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._buffer and not self.flush():
+            logger.warning(f"종료 시 Google Sheets에 기록하지 못한 행: {self.pending}건")
+
+
+_writers: Dict[str, SheetsWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_sheets_writer(sheet_id: Optional[str] = None) -> SheetsWriter:
+    """시트 ID별 공용 SheetsWriter"""
+    sheet_id = sheet_id or settings.GOOGLE_SHEET_ID or ""
+    with _writers_lock:
+        writer = _writers.get(sheet_id)
+        if writer is None:
+            writer = SheetsWriter(sheet_id=sheet_id or None)
+            _writers[sheet_id] = writer
+        return writer
+
+
+# 기록 대기 행 수 게이지 (수집 시점에 읽음)
+SHEETS_BUFFER_ROWS.set_function(lambda: sum(writer.pending for writer in list(_writers.values())))
+
+
+def close_sheets_writers() -> None:
+    """모든 SheetsWriter 종료 (남은 행 기록)"""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.stop()
+
 
 class SheetsService:
     """Google Sheets 로그 서비스"""
@@ -30,21 +315,25 @@ class SheetsService:
         self,
         client_name: str,
         client_email: str,
-        quote_json: dict,
+        quote_json: Union[Quote, Dict[str, Any]],
         sheet_id: Optional[str] = None
     ) -> bool:
         """
-        견적서 생성 내역을 Google Sheets에 기록
+        견적서 생성 내역을 Google Sheets에 즉시 기록
+        
+        캐시된 인증/워크시트/헤더를 재사용하므로 API 호출은 append 한 번입니다.
+        요청 처리 경로에서는 log_async를 사용하세요.
         
         Args:
             client_name: 고객명
             client_email: 고객 이메일
-            quote_json: 견적서 JSON 데이터
+            quote_json: 견적서 (Quote 또는 JSON 딕셔너리)
             sheet_id: Google Sheets ID (선택)
         
         Returns:
             기록 성공 여부
         """
+        check_deadline("sheets")
         if not self.available:
             logger.debug("Google Sheets 로깅이 비활성화되어 있습니다.")
             return False
@@ -52,79 +341,56 @@ class SheetsService:
         sheet_id = sheet_id or self.sheet_id
         
         if not sheet_id:
-            error_msg = "GOOGLE_SHEET_ID 환경변수가 설정되지 않았습니다."
-            print(error_msg)
-            logger.debug(error_msg)
+            logger.debug("GOOGLE_SHEET_ID 환경변수가 설정되지 않았습니다.")
             return False
         
         if not os.path.exists(self.service_account_file):
-            error_msg = f"{self.service_account_file} 파일이 없습니다."
-            print(error_msg)
-            logger.warning(error_msg)
+            logger.warning(f"{self.service_account_file} 파일이 없습니다.")
             return False
         
         try:
-            scope = [
-                'https://spreadsheets.google.com/feeds',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            creds = Credentials.from_service_account_file(
-                self.service_account_file,
-                scopes=scope
-            )
-            client = gspread.authorize(creds)
-            
-            sheet = client.open_by_key(sheet_id).sheet1
-            
-            headers = sheet.row_values(1)
-            if not headers:
-                error_msg = "Google Sheets 에러: 시트의 1행 헤더를 읽을 수 없습니다."
-                print(error_msg)
-                logger.error(error_msg)
-                return False
-            
-            print(f"Google Sheets 헤더 확인: {headers}")
-            
-            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            project_summary = quote_json.get("project_summary", "")
-            scope_list = quote_json.get("scope", [])
-            scope_str = "\n".join(scope_list) if isinstance(scope_list, list) else str(scope_list)
-            pricing = quote_json.get("pricing", {})
-            subtotal = pricing.get("subtotal", "")
-            vat = pricing.get("vat", "")
-            total = pricing.get("total", "")
-            currency = pricing.get("currency", "KRW")
-            delivery_days = quote_json.get("delivery_days", "")
-            
-            row = {
-                "시간": now,
-                "고객명": client_name,
-                "이메일": client_email,
-                "요청요약": project_summary,
-                "작업범위": scope_str,
-                "공급가": subtotal,
-                "부가세": vat,
-                "합계": total,
-                "통화": currency,
-                "소요일수": delivery_days
-            }
-            
-            values = [row.get(h, "") for h in headers]
-            sheet.append_row(values)
+            row = build_row(client_name, client_email, quote_json)
+            get_sheets_writer(sheet_id).write_rows([row])
             
             logger.info(f"Google Sheets에 로그 기록 완료: {client_name}")
             return True
-            
+        
         except Exception as e:
-            print(f"SHEETS_LOG_ERROR: {repr(e)}")
             logger.error(f"Google Sheets 로깅 중 오류 발생: {str(e)}", exc_info=True)
             return False
+    
+    def log_async(
+        self,
+        client_name: str,
+        client_email: str,
+        quote_json: Union[Quote, Dict[str, Any]],
+        sheet_id: Optional[str] = None
+    ) -> bool:
+        """
+        견적서 생성 내역을 배치 기록 버퍼에 추가
+        
+        Args:
+            client_name: 고객명
+            client_email: 고객 이메일
+            quote_json: 견적서 (Quote 또는 JSON 딕셔너리)
+            sheet_id: Google Sheets ID (선택)
+        
+        Returns:
+            버퍼 추가 여부 (기록 불가 설정이면 False)
+        """
+        writer = get_sheets_writer(sheet_id or self.sheet_id)
+        if not writer.available:
+            logger.debug("Google Sheets 로깅이 비활성화되어 있습니다.")
+            return False
+        
+        writer.enqueue(build_row(client_name, client_email, quote_json))
+        return True
 
 
 def log_to_sheets(
     client_name: str,
     client_email: str,
-    quote_json: dict,
+    quote_json: Union[Quote, Dict[str, Any]],
     sheet_id: Optional[str] = None
 ) -> bool:
     """
@@ -133,7 +399,7 @@ def log_to_sheets(
     Args:
         client_name: 고객명
         client_email: 고객 이메일
-        quote_json: 견적서 JSON 데이터
+        quote_json: 견적서 (Quote 또는 JSON 딕셔너리)
         sheet_id: Google Sheets ID (선택)
     
     Returns:
@@ -141,3 +407,25 @@ def log_to_sheets(
     """
     service = SheetsService()
     return service.log(client_name, client_email, quote_json, sheet_id)
+
+
+def log_to_sheets_async(
+    client_name: str,
+    client_email: str,
+    quote_json: Union[Quote, Dict[str, Any]],
+    sheet_id: Optional[str] = None
+) -> bool:
+    """
+    Google Sheets 로그 배치 기록 요청 (호환성 함수)
+    
+    Args:
+        client_name: 고객명
+        client_email: 고객 이메일
+        quote_json: 견적서 (Quote 또는 JSON 딕셔너리)
+        sheet_id: Google Sheets ID (선택)
+    
+    Returns:
+        버퍼 추가 여부
+    """
+    service = SheetsService()
+    return service.log_async(client_name, client_email, quote_json, sheet_id)
@@ -0,0 +1,325 @@
+"""
+SMTP 연결 풀
+"""
+import re
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from src.config import settings
+from src.utils.logger import logger
+from src.utils.metrics import SMTP_POOL_CONNECTIONS, SMTP_POOL_SIZE
+
+# 서버가 세션을 끊었을 때 재연결 후 재시도할 예외
+RECONNECT_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+# 행 첫 글자가 '.'이면 '..'으로 변환 (RFC 5321 dot-stuffing)
+_LEADING_DOT = re.compile(rb"^\.", re.MULTILINE)
+# CRLF로 맞출 줄바꿈 (CRLF, 단독 LF/CR)
+_BARE_EOL = re.compile(rb"\r\n|\n|\r")
+
+
+class SMTPDeliveryUnknown(smtplib.SMTPException):
+    """DATA 전송 시작 후 연결이 끊겨 서버의 수신 여부를 알 수 없음 (재시도 금지)"""
+
+
+def stream_data(
+    server: smtplib.SMTP,
+    from_addr: str,
+    to_addrs: Sequence[str],
+    chunks: Iterable[bytes]
+) -> Dict[str, Tuple[int, bytes]]:
+    """
+    메시지를 청크 단위로 전송 (SMTP.sendmail의 스트리밍 버전)
+    
+    sendmail은 전체 메시지를 하나의 bytes로 받아 dot-stuffing 사본을 만들지만,
+    여기서는 청크마다 변환하여 바로 소켓으로 보냅니다. 각 청크는 행 경계
+    (CRLF)에서 끝나야 하며, 마지막 청크는 CRLF로 끝나야 합니다.
+    
+    Args:
+        server: SMTP 세션
+        from_addr: 발신자 주소
+        to_addrs: 수신자 주소 목록
+        chunks: CRLF 행 단위로 나뉜 메시지 청크
+    
+    Returns:
+        거부된 수신자 딕셔너리 (sendmail과 동일)
+    
+    Raises:
+        SMTPDeliveryUnknown: DATA 수락 이후 연결이 끊긴 경우
+    """
+    server.ehlo_or_helo_if_needed()
+    code, resp = server.mail(from_addr)
+    if code != 250:
+        server.rset()
+        raise smtplib.SMTPSenderRefused(code, resp, from_addr)
+    
+    refused = {}
+    for addr in to_addrs:
+        code, resp = server.rcpt(addr)
+        if code not in (250, 251):
+            refused[addr] = (code, resp)
+    if len(refused) == len(to_addrs):
+        server.rset()
+        raise smtplib.SMTPRecipientsRefused(refused)
+    
+    code, resp = server.docmd("data")
+    if code != 354:
+        server.rset()
+        raise smtplib.SMTPDataError(code, resp)
+    try:
+        for chunk in chunks:
+            server.send(_LEADING_DOT.sub(b"..", chunk))
+        server.send(b".\r\n")
+        code, resp = server.getreply()
+    except RECONNECT_ERRORS as e:
+        # 종료 마커(.)까지 보낸 뒤 응답만 못 받았을 수도 있으므로 재연결 재시도 대상에서 제외
+        raise SMTPDeliveryUnknown(f"DATA 전송 중 연결이 끊어졌습니다: {e}") from e
+    if code != 250:
+        server.rset()
+        raise smtplib.SMTPDataError(code, resp)
+    return refused
+
+
+class SMTPConnectionPool:
+    """
+    인증된 SMTP 세션을 재사용하는 연결 풀
+    
+    유휴 연결은 idle_timeout이 지나면 닫히고, 재사용 전에는 NOOP으로
+    세션이 살아 있는지 확인합니다. 전송 중 서버가 세션을 끊으면 새 연결로
+    한 번 더 시도합니다.
+    """
+    
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        size: int = 4,
+        idle_timeout: float = 60.0,
+        use_starttls: bool = True,
+        timeout: float = 30.0
+    ):
+        """
+        초기화
+        
+        Args:
+            host: SMTP 서버 주소
+            port: SMTP 포트
+            username: 로그인 계정 (없으면 인증 생략)
+            password: 로그인 비밀번호
+            size: 최대 동시 연결 수
+            idle_timeout: 유휴 연결 유지 시간(초)
+            use_starttls: STARTTLS 사용 여부
+            timeout: 소켓 타임아웃(초)
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.use_starttls = use_starttls
+        self.timeout = timeout
+        
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._idle: List[Tuple[smtplib.SMTP, float]] = []
+        self._in_use = 0
+        self._closed = False
+    
+    @property
+    def in_use(self) -> int:
+        """사용 중인 연결 수"""
+        return self._in_use
+    
+    @property
+    def idle(self) -> int:
+        """유휴 연결 수"""
+        return len(self._idle)
+    
+    def _connect(self) -> smtplib.SMTP:
+        """새 SMTP 세션 생성 (TCP, TLS, 인증)"""
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_starttls:
+                server.starttls()
+            if self.username and self.password:
+                server.login(self.username, self.password)
+        except Exception:
+            self._discard(server)
+            raise
+        logger.debug(f"SMTP 연결 생성: {self.host}:{self.port}")
+        return server
+    
+    @staticmethod
+    def _discard(server: smtplib.SMTP) -> None:
+        """연결 종료 (오류 무시)"""
+        try:
+            server.quit()
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
+    
+    @staticmethod
+    def _is_alive(server: smtplib.SMTP) -> bool:
+        """NOOP으로 세션 상태 확인"""
+        try:
+            code, _ = server.noop()
+            return code == 250
+        except Exception:
+            return False
+    
+    def _checkout(self) -> smtplib.SMTP:
+        """유휴 연결을 꺼내거나 새로 연결"""
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                server, last_used = self._idle.pop()
+            if now - last_used > self.idle_timeout or not self._is_alive(server):
+                self._discard(server)
+                continue
+            return server
+        return self._connect()
+    
+    def _checkin(self, server: smtplib.SMTP) -> None:
+        """연결 반납"""
+        with self._lock:
+            if not self._closed:
+                self._idle.append((server, time.monotonic()))
+                return
+        self._discard(server)
+    
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        """
+        풀에서 연결을 빌려 사용
+        
+        블록 안에서 예외가 발생하면 해당 연결은 풀에 반납하지 않고 닫습니다.
+        """
+        self._slots.acquire()
+        with self._lock:
+            self._in_use += 1
+        server = None
+        try:
+            server = self._checkout()
+            yield server
+        except BaseException:
+            if server is not None:
+                self._discard(server)
+                server = None
+            raise
+        finally:
+            if server is not None:
+                self._checkin(server)
+            with self._lock:
+                self._in_use -= 1
+            self._slots.release()
+    
+    def sendmail(
+        self,
+        from_addr: str,
+        to_addrs: Union[str, Sequence[str]],
+        msg: Union[str, bytes]
+    ) -> None:
+        """
+        메시지 전송 (send_stream과 같은 재시도 규칙)
+        
+        SMTP.sendmail은 어느 단계에서 연결이 끊겼는지 알려주지 않으므로,
+        메시지를 한 청크로 만들어 send_stream으로 보냅니다.
+        
+        Args:
+            from_addr: 발신자 주소
+            to_addrs: 수신자 주소 (목록)
+            msg: 메시지 본문
+        """
+        if isinstance(to_addrs, str):
+            to_addrs = [to_addrs]
+        if isinstance(msg, str):
+            msg = msg.encode("ascii")
+        # stream_data는 CRLF 행 단위 청크를 받음
+        data = _BARE_EOL.sub(b"\r\n", msg)
+        if not data.endswith(b"\r\n"):
+            data += b"\r\n"
+        self.send_stream(from_addr, to_addrs, lambda: [data])
+    
+    def send_stream(
+        self,
+        from_addr: str,
+        to_addrs: Sequence[str],
+        make_chunks: Callable[[], Iterable[bytes]]
+    ) -> Dict[str, Tuple[int, bytes]]:
+        """
+        메시지를 스트리밍 전송 (세션이 끊긴 경우 새 연결로 1회 재시도)
+        
+        재시도는 DATA가 수락되기 전에 세션이 끊긴 경우(주로 만료된 유휴 연결)에만
+        수행합니다. 이후에 끊기면 SMTPDeliveryUnknown을 그대로 전달하여
+        중복 발송을 피합니다.
+        
+        Args:
+            from_addr: 발신자 주소
+            to_addrs: 수신자 주소 목록
+            make_chunks: 메시지 청크 이터레이터를 만드는 함수 (재시도 시 다시 호출)
+        
+        Returns:
+            거부된 수신자 딕셔너리
+        """
+        try:
+            with self.connection() as server:
+                return stream_data(server, from_addr, to_addrs, make_chunks())
+        except RECONNECT_ERRORS as e:
+            logger.info(f"SMTP 세션이 끊어져 재연결합니다: {e}")
+            with self.connection() as server:
+                return stream_data(server, from_addr, to_addrs, make_chunks())
+    
+    def close(self) -> None:
+        """유휴 연결을 모두 닫고 풀 종료"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for server, _ in idle:
+            self._discard(server)
+
+
+_pool: Optional[SMTPConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_smtp_pool() -> SMTPConnectionPool:
+    """설정 기반 공용 SMTP 연결 풀"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SMTPConnectionPool(
+                host=settings.SMTP_SERVER,
+                port=settings.SMTP_PORT,
+                username=settings.SENDER_EMAIL,
+                password=settings.SENDER_PASSWORD,
+                size=settings.SMTP_POOL_SIZE,
+                idle_timeout=settings.SMTP_POOL_IDLE_TIMEOUT,
+                use_starttls=settings.SMTP_USE_STARTTLS,
+                timeout=settings.SMTP_TIMEOUT
+            )
+        return _pool
+
+
+# 풀 사용량 게이지 (수집 시점에 읽음)
+SMTP_POOL_CONNECTIONS.set_function(lambda: _pool.in_use if _pool else 0, state="in_use")
+SMTP_POOL_CONNECTIONS.set_function(lambda: _pool.idle if _pool else 0, state="idle")
+SMTP_POOL_SIZE.set_function(lambda: _pool.size if _pool else settings.SMTP_POOL_SIZE)
+
+
+def close_smtp_pool() -> None:
+    """공용 SMTP 연결 풀 종료"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
@@ -0,0 +1,119 @@
+"""
+요청 처리 기한 (deadline)
+
+요청마다 처리 기한을 정하고 현재 컨텍스트에 설정하면, 파이프라인의 각 단계가
+check_deadline()으로 남은 시간과 클라이언트 연결 상태를 확인하여 이미 응답을
+받을 수 없는 요청의 LLM/PDF/발송 작업을 건너뜁니다.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from src.config import settings
+from src.utils.metrics import QUOTE_CANCELLED
+
+DEADLINE_HEADER = "x-request-timeout"
+
+REASON_DEADLINE = "deadline"
+REASON_DISCONNECTED = "disconnected"
+
+
+class DeadlineExceeded(Exception):
+    """처리 기한 초과 또는 클라이언트 연결 종료로 중단"""
+    
+    def __init__(self, stage: str, reason: str):
+        self.stage = stage
+        self.reason = reason
+        super().__init__(f"{reason} ({stage})")
+
+
+class Deadline:
+    """요청 처리 기한 (시간 초과 또는 취소 시 만료)"""
+    
+    def __init__(self, timeout: Optional[float]):
+        """
+        초기화
+        
+        Args:
+            timeout: 남은 처리 시간(초), None이면 시간 제한 없음 (취소만 가능)
+        """
+        self.expires_at = time.monotonic() + timeout if timeout is not None else None
+        self._cancel_reason: Optional[str] = None
+    
+    @classmethod
+    def from_header(cls, header_value: Optional[str]) -> "Deadline":
+        """
+        X-Request-Timeout 헤더(초)와 QUOTE_DEADLINE_SECONDS로 기한 생성
+        
+        헤더 값은 QUOTE_DEADLINE_SECONDS를 넘을 수 없으며, 잘못된 값은 무시합니다.
+        """
+        default = settings.QUOTE_DEADLINE_SECONDS if settings.QUOTE_DEADLINE_SECONDS > 0 else None
+        timeout = default
+        if header_value:
+            try:
+                requested = float(header_value)
+            except ValueError:
+                requested = None
+            if requested is not None and requested > 0:
+                timeout = min(requested, default) if default is not None else requested
+        return cls(timeout)
+    
+    def remaining(self) -> Optional[float]:
+        """남은 시간(초), 시간 제한이 없으면 None"""
+        if self.expires_at is None:
+            return None
+        return max(self.expires_at - time.monotonic(), 0.0)
+    
+    def cancel(self, reason: str = REASON_DISCONNECTED) -> None:
+        """기한 만료 처리 (예: 클라이언트 연결 종료)"""
+        if self._cancel_reason is None:
+            self._cancel_reason = reason
+    
+    @property
+    def reason(self) -> Optional[str]:
+        """만료 사유 (만료되지 않았으면 None)"""
+        if self._cancel_reason is not None:
+            return self._cancel_reason
+        if self.expires_at is not None and time.monotonic() >= self.expires_at:
+            return REASON_DEADLINE
+        return None
+    
+    def check(self, stage: str) -> None:
+        """
+        만료되었으면 DeadlineExceeded 발생
+        
+        Args:
+            stage: 시작하려는 단계 이름 (메트릭/로그용)
+        """
+        reason = self.reason
+        if reason is not None:
+            QUOTE_CANCELLED.inc(stage=stage, reason=reason)
+            raise DeadlineExceeded(stage, reason)
+
+
+# 현재 컨텍스트(요청)의 처리 기한
+current_deadline: ContextVar[Optional[Deadline]] = ContextVar("deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """블록 안에서 현재 처리 기한 설정"""
+    token = current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        current_deadline.reset(token)
+
+
+def check_deadline(stage: str) -> None:
+    """현재 요청의 처리 기한 확인 (기한이 없는 컨텍스트에서는 아무것도 하지 않음)"""
+    deadline = current_deadline.get()
+    if deadline is not None:
+        deadline.check(stage)
+
+
+def remaining_time() -> Optional[float]:
+    """현재 요청의 남은 처리 시간(초), 기한이 없으면 None"""
+    deadline = current_deadline.get()
+    return deadline.remaining() if deadline is not None else None
@@ -0,0 +1,300 @@
+"""
+LLM 호출 동시 실행 수 자동 조절 (AIMD) 및 분당 토큰 예산
+
+LLM 스케줄러(llm)의 최대 동시 실행 수를 고정하지 않고 관측한 응답 시간과
+rate limit(429) 응답으로 조절합니다. 자리가 모두 찬 상태에서 응답 시간이 평소
+수준이면 한 번에 한 자리씩 늘리고(additive increase), 응답 시간이 평소의
+LLM_LATENCY_TOLERANCE배를 넘거나 429가 오면 LLM_LIMIT_BACKOFF배로 줄입니다
+(multiplicative decrease). LLM_TOKENS_PER_MINUTE가 설정되어 있으면 최근 1분간
+사용한 토큰이 예산을 넘지 않도록 LLM 호출 시작을 미루고, 예산이 부족하면
+동시 실행 수도 늘리지 않습니다.
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from src.config import settings
+from src.utils.deadline import check_deadline, remaining_time
+from src.utils.metrics import LLM_CONCURRENCY_LIMIT, LLM_RATE_LIMITED, LLM_TOKENS_PER_MINUTE, LLM_TOKENS_TOTAL
+from src.utils.scheduler import PriorityScheduler, get_scheduler
+
+# 토큰 예산 집계 구간(초)
+TOKEN_WINDOW = 60.0
+
+# 토큰 예산 대기 중 처리 기한 확인 간격(초)
+BUDGET_POLL_INTERVAL = 0.5
+
+# 최근 응답 시간 지수 이동 평균 가중치
+SHORT_LATENCY_ALPHA = 0.3
+# 평소(부하 없는) 응답 시간: 더 빠른 응답이 오면 바로 낮추고, 느린 응답에는 천천히 따라감
+BASELINE_LATENCY_ALPHA = 0.005
+
+# 호출당 토큰 수 추정치 갱신 가중치
+TOKENS_ALPHA = 0.1
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """LLM 제공자의 rate limit(429) 오류 여부 (openai를 import하지 않고 판별)"""
+    if type(error).__name__ == "RateLimitError":
+        return True
+    return getattr(error, "http_status", None) == 429 or getattr(error, "status_code", None) == 429
+
+
+class _NoUsage:
+    """토큰 사용량을 측정할 수 없는 경우"""
+    
+    total_tokens = 0
+
+
+_NO_USAGE = _NoUsage()
+
+
+_usage_handler_class = None
+
+
+def _get_usage_handler_class():
+    """
+    토큰 사용량 집계 + 재시도 중 429 감지 콜백 클래스 (지연 생성)
+    
+    langchain OpenAI 클라이언트는 429를 받으면 내부에서 재시도하므로 호출이
+    실패하지 않아도 재시도 이벤트(on_retry)로 rate limit을 감지합니다.
+    """
+    global _usage_handler_class
+    if _usage_handler_class is None:
+        from langchain.callbacks.openai_info import OpenAICallbackHandler
+        
+        class UsageHandler(OpenAICallbackHandler):
+            on_rate_limited: Optional[Callable[[], None]] = None
+            
+            def on_retry(self, retry_state: Any, **kwargs: Any) -> None:
+                outcome = retry_state.outcome
+                if (
+                    self.on_rate_limited is not None
+                    and outcome is not None
+                    and outcome.failed
+                    and is_rate_limit_error(outcome.exception())
+                ):
+                    self.on_rate_limited()
+        
+        _usage_handler_class = UsageHandler
+    return _usage_handler_class
+
+
+@contextmanager
+def _track_usage(on_rate_limited: Callable[[], None]) -> Iterator[Any]:
+    """
+    블록 안 LLM 호출의 토큰 사용량 수집 (langchain OpenAI 콜백)
+    
+    Yields:
+        total_tokens 속성을 가진 집계 객체 (langchain이 없으면 항상 0)
+    """
+    try:
+        from langchain.callbacks.manager import openai_callback_var
+    except ImportError:
+        openai_callback_var = None
+    if openai_callback_var is None:
+        yield _NO_USAGE
+        return
+    handler = _get_usage_handler_class()()
+    handler.on_rate_limited = on_rate_limited
+    token = openai_callback_var.set(handler)
+    try:
+        yield handler
+    finally:
+        openai_callback_var.reset(token)
+
+
+class AdaptiveLimiter:
+    """LLM 스케줄러의 최대 동시 실행 수를 AIMD로 조절하고 분당 토큰 예산 관리"""
+    
+    def __init__(
+        self,
+        scheduler: PriorityScheduler,
+        min_limit: Optional[int] = None,
+        max_limit: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None
+    ):
+        """
+        초기화
+        
+        Args:
+            scheduler: 동시 실행 수를 조절할 스케줄러 (시작 값은 현재 최대 동시 실행 수)
+            min_limit: 최소 동시 실행 수 (기본값: LLM_MIN_CONCURRENCY)
+            max_limit: 최대 동시 실행 수 (기본값: LLM_MAX_CONCURRENCY)
+            tokens_per_minute: 분당 토큰 예산, 0이면 제한 없음 (기본값: LLM_TOKENS_PER_MINUTE)
+        """
+        self.scheduler = scheduler
+        self.min_limit = max(min_limit if min_limit is not None else settings.LLM_MIN_CONCURRENCY, 1)
+        self.max_limit = max(max_limit if max_limit is not None else settings.LLM_MAX_CONCURRENCY, self.min_limit)
+        self.tokens_per_minute = (
+            tokens_per_minute if tokens_per_minute is not None else settings.LLM_TOKENS_PER_MINUTE
+        )
+        self.adaptive = settings.LLM_ADAPTIVE_CONCURRENCY
+        self.latency_tolerance = settings.LLM_LATENCY_TOLERANCE
+        self.backoff = settings.LLM_LIMIT_BACKOFF
+        
+        self._lock = threading.Lock()
+        self._limit = float(scheduler.capacity)
+        if self.adaptive:
+            self._limit = float(min(max(scheduler.capacity, self.min_limit), self.max_limit))
+        # 호출 종류(Task)별 [최근 응답 시간, 평소 응답 시간] (Task마다 출력 길이가 달라 따로 집계)
+        self._latency: Dict[str, List[float]] = {}
+        self._last_decrease = 0.0
+        self._tokens_per_call = float(settings.LLM_TOKENS_PER_TASK)
+        # [시작 시각, 토큰 수] (진행 중인 호출은 추정치로 예약)
+        self._token_log: Deque[List[float]] = deque()
+        scheduler.set_capacity(int(self._limit))
+    
+    @property
+    def limit(self) -> int:
+        """현재 최대 동시 실행 수"""
+        return int(self._limit)
+    
+    def tokens_last_minute(self) -> int:
+        """최근 1분간 사용(예약 포함)한 토큰 수"""
+        with self._lock:
+            return int(self._used_tokens(time.monotonic()))
+    
+    def _used_tokens(self, now: float) -> float:
+        """집계 구간이 지난 기록을 버리고 사용량 합계 반환 (잠금 안에서 호출)"""
+        while self._token_log and self._token_log[0][0] <= now - TOKEN_WINDOW:
+            self._token_log.popleft()
+        return sum(entry[1] for entry in self._token_log)
+    
+    def reserve_tokens(self) -> List[float]:
+        """
+        토큰 예산이 남을 때까지 기다린 뒤 호출 한 번의 추정 토큰 예약
+        
+        예산이 없으면(0) 바로 예약하며, 대기 중 처리 기한이 지나면
+        DeadlineExceeded가 발생합니다.
+        
+        Returns:
+            예약 기록 (호출 후 record()로 실제 사용량 반영)
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                used = self._used_tokens(now)
+                if (
+                    self.tokens_per_minute <= 0
+                    or not self._token_log
+                    or used + self._tokens_per_call <= self.tokens_per_minute
+                ):
+                    entry = [now, self._tokens_per_call]
+                    self._token_log.append(entry)
+                    return entry
+                wait = self._token_log[0][0] + TOKEN_WINDOW - now
+            remaining = remaining_time()
+            if remaining is not None:
+                wait = min(wait, remaining)
+            time.sleep(min(max(wait, 0.01), BUDGET_POLL_INTERVAL))
+            check_deadline("crew.budget")
+    
+    def record(self, entry: List[float], kind: str, latency: float, tokens: int) -> None:
+        """
+        LLM 호출 완료 반영 (토큰 사용량, 응답 시간에 따른 동시 실행 수 조절)
+        
+        Args:
+            entry: reserve_tokens()의 예약 기록
+            kind: 호출 종류 (Task 이름)
+            latency: 응답 시간(초)
+            tokens: 실제 사용 토큰 수 (측정할 수 없으면 0, 추정치 유지)
+        """
+        with self._lock:
+            if tokens > 0:
+                entry[1] = tokens
+                self._tokens_per_call += TOKENS_ALPHA * (tokens - self._tokens_per_call)
+            LLM_TOKENS_TOTAL.inc(int(entry[1]))
+            
+            stats = self._latency.get(kind)
+            if stats is None:
+                self._latency[kind] = [latency, latency]
+                return
+            stats[0] += SHORT_LATENCY_ALPHA * (latency - stats[0])
+            if latency < stats[1]:
+                stats[1] = latency
+            else:
+                stats[1] += BASELINE_LATENCY_ALPHA * (latency - stats[1])
+            
+            if stats[0] > stats[1] * self.latency_tolerance:
+                self._decrease(stats[1])
+            elif self.scheduler.in_use >= self.limit and self._has_token_headroom():
+                # 자리가 모두 찼을 때만 늘림 (한가할 때 의미 없이 커지지 않도록)
+                self._set_limit(self._limit + 1.0 / self._limit)
+    
+    def on_rate_limited(self) -> None:
+        """LLM 제공자가 429를 보낸 경우 동시 실행 수 감소"""
+        LLM_RATE_LIMITED.inc()
+        with self._lock:
+            self._decrease(max((stats[1] for stats in self._latency.values()), default=0.0))
+    
+    def _has_token_headroom(self) -> bool:
+        """한 자리를 늘려도 분당 토큰 예산 안인지 (잠금 안에서 호출)"""
+        if self.tokens_per_minute <= 0:
+            return True
+        return self._used_tokens(time.monotonic()) + self._tokens_per_call <= self.tokens_per_minute
+    
+    def _decrease(self, cooldown: float) -> None:
+        """동시 실행 수를 backoff배로 감소 (cooldown(평소 응답 시간) 안에 한 번만, 잠금 안에서 호출)"""
+        now = time.monotonic()
+        if now - self._last_decrease < cooldown:
+            return
+        self._last_decrease = now
+        self._set_limit(self._limit * self.backoff)
+    
+    def _set_limit(self, limit: float) -> None:
+        """동시 실행 수 변경 및 스케줄러 반영 (잠금 안에서 호출)"""
+        if not self.adaptive:
+            return
+        previous = self.limit
+        self._limit = min(max(limit, float(self.min_limit)), float(self.max_limit))
+        if self.limit != previous:
+            self.scheduler.set_capacity(self.limit)
+    
+    @contextmanager
+    def call(self, kind: str) -> Iterator[None]:
+        """LLM 호출 한 번 (토큰 예산 대기, 사용량/응답 시간/429 반영)"""
+        entry = self.reserve_tokens()
+        started = time.monotonic()
+        try:
+            with _track_usage(self.on_rate_limited) as usage:
+                yield
+        except BaseException as e:
+            if is_rate_limit_error(e):
+                self.on_rate_limited()
+            raise
+        self.record(entry, kind, time.monotonic() - started, usage.total_tokens)
+
+
+_limiter: Optional[AdaptiveLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_llm_limiter() -> AdaptiveLimiter:
+    """LLM 스케줄러용 공용 limiter"""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = AdaptiveLimiter(get_scheduler("llm"))
+            limiter = _limiter
+            LLM_CONCURRENCY_LIMIT.set_function(lambda: limiter.limit)
+            LLM_TOKENS_PER_MINUTE.set_function(limiter.tokens_last_minute)
+        return _limiter
+
+
+@contextmanager
+def llm_call(kind: str) -> Iterator[None]:
+    """
+    LLM 호출 실행 (우선순위에 따라 LLM 자리를 배정받고 토큰 예산/동시 실행 수 관리)
+    
+    Args:
+        kind: 호출 종류 (Task 이름, 종류별로 평소 응답 시간을 따로 집계)
+    
+    LLM_ADAPTIVE_CONCURRENCY가 꺼져 있으면 동시 실행 수는 LLM_CONCURRENCY로 고정되고
+    토큰 예산과 메트릭만 적용됩니다.
+    """
+    limiter = get_llm_limiter()
+    with limiter.scheduler.slot(), limiter.call(kind):
+        yield
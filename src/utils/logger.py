@@ -1,15 +1,100 @@
 """
 로깅 유틸리티
+
+로그 레코드는 호출 스레드에서 큐에 넣기만 하고, 포맷/출력(콘솔, 파일)은
+별도 리스너 스레드가 처리하므로 요청 처리 경로가 로그 I/O로 막히지 않습니다.
 """
+import atexit
+import io
+import json
 import logging
+import os
+import queue
+import random
+import re
 import sys
-from typing import Optional
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.config import settings
+
+# 요청별 상관관계 ID (RequestIdMiddleware에서 설정)
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# LogRecord 기본 속성 (extra 필드 구분용)
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id"}
+
+_listeners: Dict[str, QueueListener] = {}
+_queue_handlers: Dict[str, QueueHandler] = {}
+
+
+class RequestIdFilter(logging.Filter):
+    """레코드에 현재 요청 ID 추가"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "request_id"):
+            record.request_id = request_id_var.get() or "-"
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 포맷터 (extra 필드 포함)"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                data[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exc_info"] = record.exc_text
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """
+    큐 핸들러
+    
+    호출 스레드에서는 메시지 문자열과 예외 traceback만 확정하고 포맷은
+    리스너 스레드의 핸들러(텍스트/JSON)에 맡깁니다.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _build_formatter(json_format: bool) -> logging.Formatter:
+    """출력 포맷터 생성"""
+    if json_format:
+        return JsonFormatter()
+    return logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
 
 
 def setup_logger(
     name: str = "quote_agent",
     level: int = logging.INFO,
-    log_file: Optional[str] = None
+    log_file: Optional[str] = None,
+    json_format: bool = False
 ) -> logging.Logger:
     """
     로거 설정
@@ -18,6 +103,7 @@ def setup_logger(
         name: 로거 이름
         level: 로그 레벨
         log_file: 로그 파일 경로 (선택)
+        json_format: JSON 한 줄 포맷 사용 여부
     
     Returns:
         설정된 로거 인스턴스
@@ -25,30 +111,159 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(level)
     
-    # 기존 핸들러 제거
+    # 기존 핸들러/리스너 제거
     logger.handlers.clear()
+    _queue_handlers.pop(name, None)
+    previous = _listeners.pop(name, None)
+    if previous is not None:
+        previous.stop()
     
     # 포맷터 설정
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    formatter = _build_formatter(json_format)
     
     # 콘솔 핸들러
+    handlers: List[logging.Handler] = []
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # 파일 핸들러 (선택)
     if log_file:
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # 큐 핸들러 -> 리스너 스레드에서 실제 출력
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = _NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(RequestIdFilter())
+    logger.addHandler(queue_handler)
+    
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
+    _queue_handlers[name] = queue_handler
     
     return logger
 
 
+def shutdown_logging() -> None:
+    """리스너 종료 (큐에 남은 레코드 출력 후)"""
+    _queue_handlers.clear()
+    while _listeners:
+        _, listener = _listeners.popitem()
+        listener.stop()
+
+
+def _restart_listeners_after_fork() -> None:
+    """
+    fork된 자식 프로세스에서 새 큐/리스너로 교체
+    
+    preload 후 워커를 fork하는 서버(gunicorn --preload)에서는 부모의 리스너
+    스레드가 자식에 복제되지 않으므로, 그대로 두면 큐에 쌓인 로그가 출력되지 않습니다.
+    복제된 리스너는 다시 시작할 수 없으므로 같은 출력 핸들러로 새 리스너를 만들고
+    큐 핸들러가 새 큐를 가리키게 합니다. 복제된 큐에 남은 레코드는 부모가 출력합니다.
+    """
+    for name, listener in list(_listeners.items()):
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        child_listener = QueueListener(log_queue, *listener.handlers, respect_handler_level=True)
+        queue_handler = _queue_handlers.get(name)
+        if queue_handler is not None:
+            queue_handler.queue = log_queue
+        child_listener.start()
+        _listeners[name] = child_listener
+
+
+atexit.register(shutdown_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listeners_after_fork)
+
+
+# ANSI 색상 코드 (CrewAI/langchain verbose 출력)
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*m")
+
+# 현재 컨텍스트의 stdout 대상 (None이면 원래 stdout)
+_stdout_sink: ContextVar[Optional["_TraceWriter"]] = ContextVar("stdout_sink", default=None)
+_stdout_lock = threading.Lock()
+
+
+class _StdoutRouter(io.TextIOBase):
+    """
+    컨텍스트별 stdout 라우터
+    
+    trace 수집 중인 컨텍스트(요청)의 출력만 로거로 보내고, 나머지는 원래
+    stdout으로 그대로 씁니다. redirect_stdout과 달리 동시 요청 간에
+    sys.stdout 교체 순서가 꼬이지 않습니다.
+    """
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text: str) -> int:
+        sink = _stdout_sink.get()
+        if sink is None:
+            return self._stream.write(text)
+        return sink.write(text)
+    
+    def flush(self) -> None:
+        self._stream.flush()
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+class _TraceWriter:
+    """줄 단위로 모아 로거에 기록하는 writer"""
+    
+    def __init__(self, trace_logger: logging.Logger):
+        self._logger = trace_logger
+        self._buffer = ""
+    
+    def write(self, text: str) -> int:
+        self._buffer += text
+        *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            line = _ANSI_ESCAPE.sub("", line).rstrip()
+            if line:
+                self._logger.info(line)
+        return len(text)
+    
+    def close(self) -> None:
+        self.write("\n")
+
+
+def sample_agent_trace() -> bool:
+    """이번 요청의 CrewAI verbose trace 수집 여부 (AGENT_TRACE_SAMPLE_RATE)"""
+    rate = settings.AGENT_TRACE_SAMPLE_RATE
+    return rate > 0 and random.random() < rate
+
+
+@contextmanager
+def capture_agent_trace(name: str = "quote_agent.agent_trace") -> Iterator[None]:
+    """
+    블록 안에서 현재 컨텍스트가 stdout에 쓰는 내용을 로거로 전달
+    
+    verbose trace는 로그 큐를 거쳐 리스너 스레드에서 출력되며, 요청 ID가
+    함께 기록됩니다.
+    """
+    with _stdout_lock:
+        if not isinstance(sys.stdout, _StdoutRouter):
+            sys.stdout = _StdoutRouter(sys.stdout)
+    
+    writer = _TraceWriter(logging.getLogger(name))
+    token = _stdout_sink.set(writer)
+    try:
+        yield
+    finally:
+        _stdout_sink.reset(token)
+        writer.close()
+
+
 # 기본 로거 인스턴스
-logger = setup_logger()
+logger = setup_logger(
+    level=getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO),
+    log_file=settings.LOG_FILE,
+    json_format=settings.LOG_FORMAT.lower() == "json"
+)
@@ -0,0 +1,354 @@
+"""
+Prometheus 텍스트 형식 메트릭
+
+외부 의존성 없이 카운터/게이지/히스토그램을 메모리에 집계하고 GET /metrics에서
+text exposition format(0.0.4)으로 내보냅니다. 기록은 잠금 하나와 정수 연산뿐이라
+요청 처리 경로에 주는 부담이 거의 없으며, 풀 사용량/큐 길이 같은 값은 수집
+시점에 콜백으로 읽습니다.
+"""
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# charset은 Response가 text/* 타입에 자동으로 붙임
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+# 단계별 처리 시간 버킷(초) - LLM 호출(수십 초)부터 PDF/SMTP(수십 ms)까지
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    """메트릭 값 표기"""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """라벨 값 이스케이프"""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class _Metric:
+    """메트릭 공통"""
+    
+    type_name = ""
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+    
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        """라벨 딕셔너리 -> 라벨 값 튜플"""
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name}: 라벨 {self.labelnames}이(가) 필요합니다.")
+        return tuple(str(labels[name]) for name in self.labelnames)
+    
+    def _label_str(self, key: LabelValues, extra: Optional[Tuple[str, str]] = None) -> str:
+        """{a="1",b="2"} 형식 라벨 문자열"""
+        pairs = list(zip(self.labelnames, key))
+        if extra:
+            pairs.append(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+    
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+    
+    def render(self) -> List[str]:
+        """HELP/TYPE 헤더와 샘플 행"""
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self.samples(),
+        ]
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    
+    type_name = "counter"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+    
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """증가"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def value(self, **labels: str) -> float:
+        """현재 값"""
+        return self._values.get(self._key(labels), 0)
+    
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{self._label_str(key)} {_format_value(value)}" for key, value in items]
+
+
+class Gauge(_Metric):
+    """현재 값 게이지 (직접 설정 또는 수집 시점 콜백)"""
+    
+    type_name = "gauge"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._functions: Dict[LabelValues, Callable[[], float]] = {}
+    
+    def set(self, value: float, **labels: str) -> None:
+        """값 설정"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+    
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """증가"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        """감소"""
+        self.inc(-amount, **labels)
+    
+    def set_function(self, function: Callable[[], float], **labels: str) -> None:
+        """수집 시점에 값을 읽을 콜백 등록"""
+        key = self._key(labels)
+        with self._lock:
+            self._functions[key] = function
+    
+    def value(self, **labels: str) -> float:
+        """현재 값"""
+        key = self._key(labels)
+        function = self._functions.get(key)
+        return function() if function is not None else self._values.get(key, 0)
+    
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = dict(self._values)
+            functions = list(self._functions.items())
+        for key, function in functions:
+            try:
+                values[key] = function()
+            except Exception:
+                continue
+        return [f"{self.name}{self._label_str(key)} {_format_value(value)}" for key, value in values.items()]
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램"""
+    
+    type_name = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 값 -> [버킷별 개수(+Inf 포함), 합계]
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+    
+    def observe(self, value: float, **labels: str) -> None:
+        """관측값 기록"""
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            entry[0][index] += 1
+            entry[1][0] += value
+    
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """블록 실행 시간(초) 기록 (예외 발생 시에도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+    
+    def count(self, **labels: str) -> int:
+        """관측 횟수"""
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+    
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = [(key, list(counts), total[0]) for key, (counts, total) in self._values.items()]
+        lines = []
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                lines.append(
+                    f"{self.name}_bucket{self._label_str(key, ('le', _format_value(bound)))} {cumulative}"
+                )
+            lines.append(f"{self.name}_sum{self._label_str(key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{self._label_str(key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """메트릭 모음"""
+    
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+    
+    def register(self, metric: _Metric) -> _Metric:
+        """메트릭 등록 (이름 중복 불가)"""
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"이미 등록된 메트릭입니다: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+    
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 출력"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+    """기본 레지스트리에 카운터 등록"""
+    return REGISTRY.register(Counter(name, documentation, labelnames))
+
+
+def gauge(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+    """기본 레지스트리에 게이지 등록"""
+    return REGISTRY.register(Gauge(name, documentation, labelnames))
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: Sequence[str] = (),
+    buckets: Sequence[float] = DEFAULT_BUCKETS
+) -> Histogram:
+    """기본 레지스트리에 히스토그램 등록"""
+    return REGISTRY.register(Histogram(name, documentation, labelnames, buckets))
+
+
+# 애플리케이션 메트릭
+STAGE_SECONDS = histogram(
+    "quote_stage_duration_seconds",
+    "견적 처리 단계별 소요 시간 (crew, pdf, enqueue, ledger, smtp, sheets)",
+    ["stage"]
+)
+SCHEDULER_WAIT_SECONDS = histogram(
+    "quote_scheduler_wait_seconds",
+    "단계 실행 자리를 받기까지 대기한 시간 (stage: llm, pdf)",
+    ["stage", "priority"]
+)
+CREW_TASK_SECONDS = histogram(
+    "quote_crew_task_duration_seconds",
+    "CrewAI Task(에이전트)별 소요 시간",
+    ["task"]
+)
+QUOTES_TOTAL = counter(
+    "quote_requests_total",
+    "견적 생성 요청 결과",
+    ["status"]
+)
+QUOTE_FALLBACKS = counter(
+    "quote_default_fallback_total",
+    "기본 견적서(_get_default_quote)로 대체된 횟수",
+    ["reason"]
+)
+QUOTE_TEMPLATES = counter(
+    "quote_template_total",
+    "요청 유형 분류 결과 (mode: direct=템플릿만 사용, assisted=템플릿+CrewAI, crew=해당 유형 없음)",
+    ["category", "mode"]
+)
+QUOTE_CANCELLED = counter(
+    "quote_cancelled_total",
+    "처리 기한 초과/클라이언트 연결 종료로 중단된 단계 (reason: deadline, disconnected)",
+    ["stage", "reason"]
+)
+LLM_RATE_LIMITED = counter(
+    "quote_llm_rate_limited_total",
+    "LLM 제공자의 rate limit(429) 응답 수"
+)
+LLM_TOKENS_TOTAL = counter(
+    "quote_llm_tokens_total",
+    "LLM 호출에 사용한 토큰 수 (측정할 수 없으면 추정치)"
+)
+EMAIL_FAILURES = counter(
+    "email_failures_total",
+    "이메일 발송 실패 횟수 (final=true: dead-letter)",
+    ["final"]
+)
+SHEETS_FAILURES = counter(
+    "sheets_failures_total",
+    "Google Sheets 기록 실패 횟수",
+    ["reason"]
+)
+HTTP_REQUESTS = counter(
+    "http_requests_total",
+    "HTTP 요청 수",
+    ["method", "status"]
+)
+HTTP_IN_FLIGHT = gauge(
+    "http_requests_in_flight",
+    "처리 중인 HTTP 요청 수"
+)
+SMTP_POOL_CONNECTIONS = gauge(
+    "smtp_pool_connections",
+    "SMTP 연결 풀 연결 수",
+    ["state"]
+)
+SMTP_POOL_SIZE = gauge(
+    "smtp_pool_size",
+    "SMTP 연결 풀 최대 크기"
+)
+MAIL_QUEUE_DEPTH = gauge(
+    "mail_queue_depth",
+    "발송 대기 중인 메일 수"
+)
+SHEETS_BUFFER_ROWS = gauge(
+    "sheets_buffer_rows",
+    "Google Sheets 기록 대기 행 수"
+)
+SCHEDULER_QUEUED = gauge(
+    "quote_scheduler_queued",
+    "단계 실행 자리를 기다리는 요청 수",
+    ["stage", "priority"]
+)
+SCHEDULER_IN_USE = gauge(
+    "quote_scheduler_in_use",
+    "단계별 실행 중인 요청 수",
+    ["stage"]
+)
+LLM_CONCURRENCY_LIMIT = gauge(
+    "quote_llm_concurrency_limit",
+    "현재 LLM 최대 동시 실행 수 (자동 조절)"
+)
+LLM_TOKENS_PER_MINUTE = gauge(
+    "quote_llm_tokens_last_minute",
+    "최근 1분간 사용(예약 포함)한 LLM 토큰 수"
+)
@@ -0,0 +1,271 @@
+"""
+요청 단위 프로파일링
+
+X-Profile 헤더(관리자가 활성화한 경우) 또는 샘플링 비율로 선택된 견적 요청만
+cProfile과 스택 샘플러로 기록합니다. 결과는 PROFILE_DIR에 pstats, flamegraph용
+collapsed stack, 단계별 소요 시간(JSON)으로 저장되며 /profiles API로 받을 수
+있습니다. 프로파일링이 꺼져 있으면 요청마다 설정값 비교만 수행합니다.
+"""
+import cProfile
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.config import settings
+from src.utils.logger import logger
+from src.utils.metrics import STAGE_SECONDS
+
+PROFILE_HEADER = "x-profile"
+# 프로파일 ID 형식 (경로 조작 방지)
+PROFILE_ID_PATTERN = re.compile(r"^[0-9A-Za-z_-]{1,64}$")
+
+# 다운로드 가능한 결과 파일 (종류 -> 확장자)
+PROFILE_FILES = {
+    "pstats": ".pstats",
+    "collapsed": ".collapsed",
+}
+
+# 런타임 설정 (관리자 API로 변경)
+_config: Dict[str, Any] = {
+    "enabled": settings.PROFILE_ENABLED,
+    "sample_rate": settings.PROFILE_SAMPLE_RATE,
+}
+
+# cProfile은 프로세스당 하나만 활성화할 수 있어 동시에 한 요청만 프로파일링
+_profile_lock = threading.Lock()
+
+# 현재 컨텍스트(요청)의 프로파일 세션
+_active_session: ContextVar[Optional["ProfileSession"]] = ContextVar("profile_session", default=None)
+
+
+def get_profiling_config() -> Dict[str, Any]:
+    """현재 프로파일링 설정"""
+    return dict(_config)
+
+
+def set_profiling_config(enabled: Optional[bool] = None, sample_rate: Optional[float] = None) -> Dict[str, Any]:
+    """
+    프로파일링 설정 변경 (재시작 시 환경변수 값으로 돌아감)
+    
+    Args:
+        enabled: X-Profile 헤더 허용 여부
+        sample_rate: 헤더 없이 프로파일링할 요청 비율 (0~1)
+    
+    Returns:
+        변경된 설정
+    """
+    if enabled is not None:
+        _config["enabled"] = enabled
+    if sample_rate is not None:
+        _config["sample_rate"] = min(max(sample_rate, 0.0), 1.0)
+    logger.info(f"프로파일링 설정 변경: {_config}")
+    return get_profiling_config()
+
+
+def profile_trigger(header_value: Optional[str]) -> Optional[str]:
+    """
+    이번 요청의 프로파일링 여부
+    
+    Args:
+        header_value: X-Profile 헤더 값
+    
+    Returns:
+        "header" / "sample", 프로파일링하지 않으면 None
+    """
+    if header_value and _config["enabled"] and header_value.strip().lower() not in ("0", "false", "off"):
+        return "header"
+    rate = _config["sample_rate"]
+    if rate > 0 and random.random() < rate:
+        return "sample"
+    return None
+
+
+class _StackSampler(threading.Thread):
+    """대상 스레드의 호출 스택을 주기적으로 수집 (collapsed stack 형식)"""
+    
+    def __init__(self, thread_id: int, interval: float):
+        super().__init__(name="profile-sampler", daemon=True)
+        self._thread_id = thread_id
+        self._interval = interval
+        self._stop_event = threading.Event()
+        self.stacks: Counter = Counter()
+    
+    def run(self) -> None:
+        this_file = __file__
+        while not self._stop_event.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack: List[str] = []
+            while frame is not None:
+                code = frame.f_code
+                if code.co_filename != this_file:
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+    
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+class ProfileSession:
+    """한 요청의 프로파일 (cProfile + 스택 샘플 + 단계별 소요 시간)"""
+    
+    def __init__(self, trigger: str, tags: Dict[str, Any]):
+        self.profile_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        self.trigger = trigger
+        self.tags = dict(tags)
+        self.stages: List[Tuple[str, float]] = []
+        self.duration = 0.0
+        self._profiler = cProfile.Profile()
+        self._sampler = _StackSampler(threading.get_ident(), settings.PROFILE_SAMPLE_INTERVAL_MS / 1000)
+        self._started = 0.0
+    
+    def start(self) -> None:
+        self._started = time.perf_counter()
+        self._sampler.start()
+        self._profiler.enable()
+    
+    def stop(self) -> None:
+        self._profiler.disable()
+        self._sampler.stop()
+        self.duration = time.perf_counter() - self._started
+    
+    def metadata(self) -> Dict[str, Any]:
+        """프로파일 요약 정보"""
+        return {
+            "profile_id": self.profile_id,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "trigger": self.trigger,
+            "duration_ms": round(self.duration * 1000, 1),
+            "stages": [{"stage": name, "duration_ms": round(seconds * 1000, 1)} for name, seconds in self.stages],
+            "samples": sum(self._sampler.stacks.values()),
+            **self.tags,
+        }
+    
+    def save(self, directory: str) -> None:
+        """pstats, collapsed stack, 요약 JSON 저장"""
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, self.profile_id)
+        self._profiler.dump_stats(base + PROFILE_FILES["pstats"])
+        with open(base + PROFILE_FILES["collapsed"], "w", encoding="utf-8") as f:
+            for stack, count in self._sampler.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        with open(base + ".json", "w", encoding="utf-8") as f:
+            json.dump(self.metadata(), f, ensure_ascii=False)
+
+
+@contextmanager
+def profile_request(trigger: Optional[str], **tags: Any) -> Iterator[Optional[ProfileSession]]:
+    """
+    블록 실행을 프로파일링
+    
+    trigger가 None이거나 다른 요청을 프로파일링 중이면 아무것도 하지 않고
+    None을 돌려줍니다. 블록 안에서 session.tags를 채우면 요약에 함께 저장됩니다.
+    
+    Args:
+        trigger: profile_trigger() 결과
+        **tags: 요약에 기록할 값 (경로, 요청 ID 등)
+    """
+    if trigger is None or not _profile_lock.acquire(blocking=False):
+        yield None
+        return
+    
+    session = ProfileSession(trigger, tags)
+    token = _active_session.set(session)
+    session.start()
+    try:
+        yield session
+    finally:
+        session.stop()
+        _active_session.reset(token)
+        _profile_lock.release()
+        try:
+            session.save(settings.PROFILE_DIR)
+            _prune_profiles(settings.PROFILE_DIR, settings.PROFILE_MAX_FILES)
+            logger.info(f"프로파일 저장: {session.profile_id} ({session.duration * 1000:.1f}ms)")
+        except Exception as e:
+            logger.warning(f"프로파일 저장 실패: {e}")
+
+
+@contextmanager
+def profile_stage(name: str) -> Iterator[None]:
+    """프로파일링 중인 요청이면 블록 소요 시간을 단계로 기록"""
+    session = _active_session.get()
+    if session is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        session.stages.append((name, time.perf_counter() - started))
+
+
+@contextmanager
+def timed_stage(stage: str) -> Iterator[None]:
+    """단계 소요 시간을 메트릭(quote_stage_duration_seconds)과 프로파일에 기록"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        STAGE_SECONDS.observe(elapsed, stage=stage)
+        session = _active_session.get()
+        if session is not None:
+            session.stages.append((stage, elapsed))
+
+
+def _prune_profiles(directory: str, max_profiles: int) -> None:
+    """오래된 프로파일부터 삭제하여 최대 개수 유지"""
+    metas = sorted(
+        (entry for entry in os.scandir(directory) if entry.name.endswith(".json")),
+        key=lambda entry: entry.name
+    )
+    for entry in metas[:max(len(metas) - max_profiles, 0)]:
+        profile_id = entry.name[:-len(".json")]
+        for suffix in (".json", *PROFILE_FILES.values()):
+            try:
+                os.remove(os.path.join(directory, profile_id + suffix))
+            except FileNotFoundError:
+                pass
+
+
+def list_profiles(limit: int = 50) -> List[Dict[str, Any]]:
+    """저장된 프로파일 요약 목록 (최신순)"""
+    if not os.path.isdir(settings.PROFILE_DIR):
+        return []
+    names = sorted(
+        (name for name in os.listdir(settings.PROFILE_DIR) if name.endswith(".json")),
+        reverse=True
+    )
+    profiles = []
+    for name in names[:limit]:
+        meta = get_profile(name[:-len(".json")])
+        if meta is not None:
+            profiles.append(meta)
+    return profiles
+
+
+def get_profile(profile_id: str) -> Optional[Dict[str, Any]]:
+    """프로파일 요약 조회"""
+    try:
+        with open(os.path.join(settings.PROFILE_DIR, f"{profile_id}.json"), encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def profile_file_path(profile_id: str, kind: str) -> str:
+    """프로파일 결과 파일 경로 (kind: pstats/collapsed)"""
+    return os.path.join(settings.PROFILE_DIR, profile_id + PROFILE_FILES[kind])
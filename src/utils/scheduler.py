@@ -0,0 +1,267 @@
+"""
+우선순위 기반 단계 스케줄러 (LLM, PDF)
+
+견적 요청은 우선순위 클래스(interactive, revision, batch)를 가지며, 동시 실행 수가
+제한된 단계(LLM Task 실행, PDF 렌더링)에 들어갈 때 클래스별 가중치에 따라
+자리를 배정받습니다(start-time fair queueing). 일괄 재견적(batch)이 몰려도
+대화형 요청(interactive)은 가중치만큼 먼저 자리를 받으므로 지연이 크게 늘지
+않으며, SCHEDULER_MAX_WAIT 이상 기다린 요청은 클래스와 관계없이 먼저 처리하여
+낮은 우선순위 요청이 무한정 밀리지 않게 합니다.
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Deque, Dict, Iterator, Optional
+
+from src.config import settings
+from src.utils.deadline import check_deadline, remaining_time
+from src.utils.metrics import SCHEDULER_IN_USE, SCHEDULER_QUEUED, SCHEDULER_WAIT_SECONDS
+
+PRIORITY_HEADER = "x-quote-priority"
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_REVISION = "revision"
+PRIORITY_BATCH = "batch"
+PRIORITIES = (PRIORITY_INTERACTIVE, PRIORITY_REVISION, PRIORITY_BATCH)
+
+# 대기 중 처리 기한/연결 종료 확인 간격(초)
+WAIT_POLL_INTERVAL = 0.5
+
+# 현재 컨텍스트(요청)의 우선순위 클래스
+current_priority: ContextVar[str] = ContextVar("quote_priority", default=PRIORITY_INTERACTIVE)
+
+
+def parse_priority(value: Optional[str]) -> str:
+    """
+    우선순위 헤더 값 검증
+    
+    Args:
+        value: X-Quote-Priority 헤더 값 (없으면 interactive)
+    
+    Returns:
+        우선순위 클래스
+    
+    Raises:
+        ValueError: 알 수 없는 클래스
+    """
+    if not value:
+        return PRIORITY_INTERACTIVE
+    priority = value.strip().lower()
+    if priority not in PRIORITIES:
+        raise ValueError(f"우선순위는 {', '.join(PRIORITIES)} 중 하나여야 합니다.")
+    return priority
+
+
+@contextmanager
+def priority_scope(priority: str) -> Iterator[str]:
+    """블록 안에서 현재 우선순위 설정"""
+    token = current_priority.set(priority)
+    try:
+        yield priority
+    finally:
+        current_priority.reset(token)
+
+
+def parse_weights(spec: str) -> Dict[str, float]:
+    """
+    "interactive=8,revision=4,batch=1" 형식의 가중치 설정 해석
+    
+    지정하지 않은 클래스는 가중치 1입니다.
+    """
+    weights = {priority: 1.0 for priority in PRIORITIES}
+    for part in spec.split(","):
+        if "=" not in part:
+            continue
+        name, value = part.split("=", 1)
+        name = name.strip().lower()
+        if name in weights:
+            weights[name] = max(float(value), 0.01)
+    return weights
+
+
+class _Waiter:
+    """대기 중인 요청"""
+    
+    __slots__ = ("priority", "start_tag", "enqueued_at", "event", "granted")
+    
+    def __init__(self, priority: str, start_tag: float):
+        self.priority = priority
+        self.start_tag = start_tag
+        self.enqueued_at = time.monotonic()
+        self.event = threading.Event()
+        self.granted = False
+
+
+class PriorityScheduler:
+    """
+    동시 실행 수 제한 + 우선순위 클래스 간 가중 공정 대기열
+    
+    자리가 비어 있으면 바로 실행하고, 차 있으면 클래스별 FIFO 대기열에 넣은 뒤
+    자리가 반납될 때 start tag가 가장 작은 대기자(가중치가 클수록 tag가 천천히
+    증가)에게 넘깁니다. max_wait 이상 기다린 대기자가 있으면 가장 오래 기다린
+    대기자를 먼저 처리합니다.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        capacity: int,
+        weights: Optional[Dict[str, float]] = None,
+        max_wait: Optional[float] = None
+    ):
+        """
+        초기화
+        
+        Args:
+            name: 단계 이름 (메트릭 라벨)
+            capacity: 최대 동시 실행 수
+            weights: 클래스별 가중치 (기본값: SCHEDULER_WEIGHTS)
+            max_wait: 이 시간(초) 이상 기다린 요청은 클래스와 관계없이 먼저 처리
+        """
+        self.name = name
+        self.capacity = max(capacity, 1)
+        self.weights = weights or parse_weights(settings.SCHEDULER_WEIGHTS)
+        self.max_wait = max_wait if max_wait is not None else settings.SCHEDULER_MAX_WAIT
+        
+        self._lock = threading.Lock()
+        self._queues: Dict[str, Deque[_Waiter]] = {priority: deque() for priority in PRIORITIES}
+        self._last_finish: Dict[str, float] = {priority: 0.0 for priority in PRIORITIES}
+        self._virtual_time = 0.0
+        self._in_use = 0
+    
+    @property
+    def in_use(self) -> int:
+        """실행 중인 수"""
+        return self._in_use
+    
+    def queued(self, priority: str) -> int:
+        """클래스별 대기 수"""
+        return len(self._queues[priority])
+    
+    def acquire(self, priority: Optional[str] = None) -> None:
+        """
+        실행 자리 획득 (대기 중 처리 기한이 지나면 DeadlineExceeded)
+        
+        Args:
+            priority: 우선순위 클래스 (기본값: 현재 요청의 우선순위)
+        """
+        priority = priority or current_priority.get()
+        started = time.monotonic()
+        with self._lock:
+            if self._in_use < self.capacity and not any(self._queues.values()):
+                self._in_use += 1
+                SCHEDULER_WAIT_SECONDS.observe(0.0, stage=self.name, priority=priority)
+                return
+            start_tag = max(self._virtual_time, self._last_finish[priority])
+            self._last_finish[priority] = start_tag + 1.0 / self.weights[priority]
+            waiter = _Waiter(priority, start_tag)
+            self._queues[priority].append(waiter)
+        
+        try:
+            while True:
+                remaining = remaining_time()
+                timeout = WAIT_POLL_INTERVAL if remaining is None else min(WAIT_POLL_INTERVAL, remaining)
+                if waiter.event.wait(timeout):
+                    break
+                check_deadline(f"{self.name}.queue")
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        SCHEDULER_WAIT_SECONDS.observe(time.monotonic() - started, stage=self.name, priority=priority)
+    
+    def _abandon(self, waiter: _Waiter) -> None:
+        """대기 중단 (이미 자리를 넘겨받았으면 다음 대기자에게 반납)"""
+        with self._lock:
+            if not waiter.granted:
+                self._queues[waiter.priority].remove(waiter)
+                return
+        self.release()
+    
+    def release(self) -> None:
+        """실행 자리 반납 (대기자가 있으면 바로 넘겨줌)"""
+        with self._lock:
+            # 최대 동시 실행 수가 줄어 초과 실행 중이면 넘기지 않고 반납
+            waiter = self._next_waiter() if self._in_use <= self.capacity else None
+            if waiter is None:
+                self._in_use -= 1
+                return
+            waiter.granted = True
+        waiter.event.set()
+    
+    def set_capacity(self, capacity: int) -> None:
+        """
+        최대 동시 실행 수 변경
+        
+        늘리면 늘어난 만큼 대기자에게 바로 자리를 넘기고, 줄이면 실행 중인 요청이
+        끝날 때 초과분을 회수합니다.
+        """
+        granted = []
+        with self._lock:
+            self.capacity = max(capacity, 1)
+            while self._in_use < self.capacity:
+                waiter = self._next_waiter()
+                if waiter is None:
+                    break
+                waiter.granted = True
+                self._in_use += 1
+                granted.append(waiter)
+        for waiter in granted:
+            waiter.event.set()
+    
+    def _next_waiter(self) -> Optional[_Waiter]:
+        """다음 실행할 대기자 선택 및 대기열에서 제거 (잠금 안에서 호출)"""
+        heads = [queue[0] for queue in self._queues.values() if queue]
+        if not heads:
+            return None
+        starved_before = time.monotonic() - self.max_wait
+        starved = [waiter for waiter in heads if waiter.enqueued_at <= starved_before]
+        if starved:
+            waiter = min(starved, key=lambda item: item.enqueued_at)
+        else:
+            waiter = min(heads, key=lambda item: item.start_tag)
+            self._virtual_time = waiter.start_tag
+        self._queues[waiter.priority].popleft()
+        return waiter
+    
+    @contextmanager
+    def slot(self, priority: Optional[str] = None) -> Iterator[None]:
+        """실행 자리를 잡고 블록 실행"""
+        self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+_schedulers: Dict[str, PriorityScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+# 단계별 최대 동시 실행 수 설정
+STAGE_CAPACITY = {
+    "llm": lambda: settings.LLM_CONCURRENCY,
+    "pdf": lambda: settings.PDF_CONCURRENCY,
+}
+
+
+def get_scheduler(stage: str) -> PriorityScheduler:
+    """단계별 공용 스케줄러 (llm, pdf)"""
+    with _schedulers_lock:
+        scheduler = _schedulers.get(stage)
+        if scheduler is None:
+            scheduler = PriorityScheduler(stage, STAGE_CAPACITY[stage]())
+            _schedulers[stage] = scheduler
+            SCHEDULER_IN_USE.set_function(lambda: scheduler.in_use, stage=stage)
+            for priority in PRIORITIES:
+                SCHEDULER_QUEUED.set_function(
+                    lambda priority=priority: scheduler.queued(priority), stage=stage, priority=priority
+                )
+        return scheduler
+
+
+@contextmanager
+def scheduled(stage: str) -> Iterator[None]:
+    """현재 요청의 우선순위로 단계 실행 자리를 잡고 블록 실행"""
+    with get_scheduler(stage).slot():
+        yield
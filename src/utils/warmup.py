@@ -0,0 +1,59 @@
+"""
+무거운 의존성 백그라운드 warm-up
+"""
+import importlib
+import threading
+import time
+from typing import Callable, List, Tuple
+
+from src.utils.logger import logger
+
+
+def _register_fonts() -> None:
+    """reportlab 및 한글 폰트 로드"""
+    from src.services.pdf_service import register_fonts
+    register_fonts()
+
+
+def _import(module_name: str) -> Callable[[], None]:
+    """모듈 import 작업 생성"""
+    return lambda: importlib.import_module(module_name)
+
+
+# (이름, 작업) - 첫 요청에서 가장 오래 걸리는 단계 순
+WARMUP_STEPS: List[Tuple[str, Callable[[], None]]] = [
+    ("crewai", _import("crewai")),
+    ("reportlab", _register_fonts),
+    ("gspread", _import("gspread")),
+    ("pypdf", _import("pypdf")),
+]
+
+
+def warm_up() -> None:
+    """
+    지연 로드 대상 의존성을 미리 불러오기
+    
+    앱은 의존성 없이 바로 요청을 받을 수 있도록 시작되고, 이 작업은
+    그 이후 백그라운드에서 첫 견적 요청의 지연을 줄이기 위해 실행됩니다.
+    설치되지 않은 선택 의존성은 건너뜁니다.
+    """
+    started = time.perf_counter()
+    for name, step in WARMUP_STEPS:
+        step_started = time.perf_counter()
+        try:
+            step()
+        except ImportError:
+            logger.info(f"warm-up 건너뜀 (미설치): {name}")
+            continue
+        except Exception as e:
+            logger.warning(f"warm-up 실패: {name}: {e}")
+            continue
+        logger.info(f"warm-up 완료: {name} ({(time.perf_counter() - step_started) * 1000:.0f}ms)")
+    logger.info(f"warm-up 전체 완료 ({(time.perf_counter() - started) * 1000:.0f}ms)")
+
+
+def start_warmup() -> threading.Thread:
+    """warm-up 스레드 시작"""
+    thread = threading.Thread(target=warm_up, name="warmup", daemon=True)
+    thread.start()
+    return thread
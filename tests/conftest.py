@@ -0,0 +1,19 @@
+"""
+테스트 공통 설정
+
+src.config는 import 시 환경변수를 읽으므로, 테스트 모듈보다 먼저 로드되는 이 파일에서
+출력 경로를 임시 디렉터리로 돌리고 외부 서비스(SMTP, Sheets, 시작 시 예열)를 끕니다.
+"""
+import os
+import tempfile
+
+_OUTPUT_DIR = tempfile.mkdtemp(prefix="quote-agent-test-")
+
+os.environ.update({
+    "OUTPUT_DIR": _OUTPUT_DIR,
+    "WARMUP_ON_STARTUP": "false",
+    "LOG_LEVEL": "WARNING",
+    "QUOTE_DEDUP_TTL": "0",
+})
+for _name in ("SENDER_EMAIL", "SENDER_PASSWORD", "GOOGLE_SHEET_ID", "LOG_FILE"):
+    os.environ.pop(_name, None)
@@ -0,0 +1,73 @@
+"""
+견적 요청 중복 제거 (프로세스 간 처리권 획득/완료/반납)
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.services.dedup_service import CLAIMED, DUPLICATE_DONE, DUPLICATE_PENDING, QuoteDedup, request_key
+
+KEY = request_key("홍길동", "client@example.com", "홈페이지 견적 요청", None)
+
+
+def _claim_in_process(db_path: str, key: str, barrier) -> str:
+    """별도 프로세스의 새 저장소로 처리권 획득 시도"""
+    dedup = QuoteDedup(db_path, ttl=600, stale_after=600)
+    barrier.wait()
+    return dedup.claim(key)[0]
+
+
+def _release_in_process(db_path: str, key: str) -> None:
+    QuoteDedup(db_path, ttl=600, stale_after=600).release(key)
+
+
+@pytest.fixture
+def db_path(tmp_path) -> str:
+    path = str(tmp_path / "dedup.db")
+    QuoteDedup(path)
+    return path
+
+
+def test_only_one_process_claims(db_path: str) -> None:
+    workers = 4
+    context = multiprocessing.get_context("spawn")
+    with context.Manager() as manager, ProcessPoolExecutor(workers, mp_context=context) as pool:
+        barrier = manager.Barrier(workers)
+        states = list(pool.map(_claim_in_process, [db_path] * workers, [KEY] * workers, [barrier] * workers))
+    
+    assert sorted(states) == sorted([CLAIMED] + [DUPLICATE_PENDING] * (workers - 1))
+
+
+def test_completed_response_is_shared_across_processes(db_path: str) -> None:
+    dedup = QuoteDedup(db_path, ttl=600, stale_after=600)
+    assert dedup.claim(KEY) == (CLAIMED, None)
+    dedup.complete(KEY, {"status": "success", "quote_id": "q1"})
+    
+    other = QuoteDedup(db_path, ttl=600, stale_after=600)
+    other._owner = (other._owner or (0, ""))[0], "other-process"
+    
+    assert other.claim(KEY) == (DUPLICATE_DONE, {"status": "success", "quote_id": "q1"})
+
+
+def test_release_only_by_owner(db_path: str) -> None:
+    dedup = QuoteDedup(db_path, ttl=600, stale_after=600)
+    assert dedup.claim(KEY)[0] == CLAIMED
+    
+    # 다른 프로세스의 반납은 처리 중 기록을 지우지 않음
+    context = multiprocessing.get_context("spawn")
+    process = context.Process(target=_release_in_process, args=(db_path, KEY))
+    process.start()
+    process.join(timeout=30)
+    assert process.exitcode == 0
+    assert dedup.claim(KEY)[0] == DUPLICATE_PENDING
+    
+    dedup.release(KEY)
+    assert dedup.claim(KEY)[0] == CLAIMED
+
+
+def test_stale_pending_claim_is_taken_over(db_path: str) -> None:
+    dedup = QuoteDedup(db_path, ttl=600, stale_after=0)
+    assert dedup.claim(KEY)[0] == CLAIMED
+    
+    assert QuoteDedup(db_path, ttl=600, stale_after=0).claim(KEY)[0] == CLAIMED
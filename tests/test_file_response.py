@@ -0,0 +1,92 @@
+"""
+파일 응답의 ETag 조건부 요청과 Range
+"""
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.api.file_response import file_response
+
+CONTENT = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def client(tmp_path) -> TestClient:
+    path = tmp_path / "quote.pdf"
+    path.write_bytes(CONTENT)
+    app = FastAPI()
+    
+    @app.api_route("/file", methods=["GET", "HEAD"])
+    def get_file(request: Request):
+        return file_response(request, str(path), "application/pdf", "quote.pdf")
+    
+    return TestClient(app)
+
+
+def test_full_response_has_etag(client: TestClient) -> None:
+    response = client.get("/file")
+    
+    assert response.status_code == 200
+    assert response.content == CONTENT
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["content-length"] == str(len(CONTENT))
+    assert response.headers["etag"].startswith('"')
+
+
+def test_if_none_match_returns_304(client: TestClient) -> None:
+    etag = client.get("/file").headers["etag"]
+    
+    assert client.get("/file", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/file", headers={"If-None-Match": f'"other", W/{etag}'}).status_code == 304
+    assert client.get("/file", headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+@pytest.mark.parametrize("header, start, end", [
+    ("bytes=10-19", 10, 19),
+    ("bytes=1000-", 1000, len(CONTENT) - 1),
+    ("bytes=-24", len(CONTENT) - 24, len(CONTENT) - 1),
+    ("bytes=1000-5000", 1000, len(CONTENT) - 1),
+])
+def test_range_returns_partial_content(client: TestClient, header: str, start: int, end: int) -> None:
+    response = client.get("/file", headers={"Range": header})
+    
+    assert response.status_code == 206
+    assert response.content == CONTENT[start:end + 1]
+    assert response.headers["content-range"] == f"bytes {start}-{end}/{len(CONTENT)}"
+    assert response.headers["content-length"] == str(end - start + 1)
+
+
+@pytest.mark.parametrize("header", ["bytes=5000-", "bytes=20-10", "bytes=-0"])
+def test_unsatisfiable_range_returns_416(client: TestClient, header: str) -> None:
+    response = client.get("/file", headers={"Range": header})
+    
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(CONTENT)}"
+
+
+def test_multiple_ranges_fall_back_to_full_response(client: TestClient) -> None:
+    response = client.get("/file", headers={"Range": "bytes=0-1,5-6"})
+    
+    assert response.status_code == 200
+    assert response.content == CONTENT
+
+
+def test_if_range_applies_range_only_for_current_etag(client: TestClient) -> None:
+    etag = client.get("/file").headers["etag"]
+    
+    current = client.get("/file", headers={"Range": "bytes=0-9", "If-Range": etag})
+    stale = client.get("/file", headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+    weak = client.get("/file", headers={"Range": "bytes=0-9", "If-Range": f"W/{etag}"})
+    
+    assert current.status_code == 206
+    assert current.content == CONTENT[:10]
+    assert stale.status_code == 200
+    assert weak.status_code == 200
+
+
+def test_head_has_headers_without_body(client: TestClient) -> None:
+    response = client.head("/file", headers={"Range": "bytes=0-9"})
+    
+    assert response.status_code == 206
+    assert response.content == b""
+    assert response.headers["content-length"] == "10"
@@ -0,0 +1,83 @@
+"""
+LLM 동시 실행 수 자동 조절 (AIMD)
+"""
+import pytest
+
+from src.utils.llm_limiter import AdaptiveLimiter
+from src.utils.scheduler import PriorityScheduler
+
+
+@pytest.fixture
+def scheduler() -> PriorityScheduler:
+    return PriorityScheduler("llm-test", 4, max_wait=60)
+
+
+def _limiter(scheduler: PriorityScheduler) -> AdaptiveLimiter:
+    limiter = AdaptiveLimiter(scheduler, min_limit=1, max_limit=8, tokens_per_minute=0)
+    limiter.adaptive = True
+    return limiter
+
+
+def _record(limiter: AdaptiveLimiter, latency: float, kind: str = "task") -> None:
+    limiter.record(limiter.reserve_tokens(), kind, latency, 0)
+
+
+def test_increases_by_one_over_limit_when_saturated(scheduler: PriorityScheduler) -> None:
+    limiter = _limiter(scheduler)
+    for _ in range(4):
+        scheduler.acquire("interactive")
+    _record(limiter, 1.0)
+    
+    for _ in range(4):
+        _record(limiter, 1.0)
+    assert limiter.limit == 4
+    
+    _record(limiter, 1.0)
+    assert limiter.limit == 5
+    assert scheduler.capacity == 5
+
+
+def test_does_not_increase_when_idle(scheduler: PriorityScheduler) -> None:
+    limiter = _limiter(scheduler)
+    
+    for _ in range(20):
+        _record(limiter, 1.0)
+    
+    assert limiter.limit == 4
+
+
+def test_decreases_once_per_cooldown_on_latency_rise(scheduler: PriorityScheduler) -> None:
+    limiter = _limiter(scheduler)
+    _record(limiter, 1.0)
+    
+    _record(limiter, 10.0)
+    assert limiter.limit == 2
+    assert scheduler.capacity == 2
+    
+    # 평소 응답 시간(약 1초) 안의 두 번째 감소는 무시
+    _record(limiter, 10.0)
+    assert limiter.limit == 2
+
+
+def test_rate_limit_decreases_down_to_minimum(scheduler: PriorityScheduler) -> None:
+    limiter = _limiter(scheduler)
+    
+    for _ in range(10):
+        limiter.on_rate_limited()
+    
+    assert limiter.limit == 1
+    assert scheduler.capacity == 1
+
+
+def test_increase_respects_token_budget(scheduler: PriorityScheduler) -> None:
+    limiter = _limiter(scheduler)
+    limiter.tokens_per_minute = 1000
+    for _ in range(4):
+        scheduler.acquire("interactive")
+    # 호출 한 번의 예약(추정 LLM_TOKENS_PER_TASK)만으로 분당 예산을 넘음
+    entry = limiter.reserve_tokens()
+    
+    for _ in range(10):
+        limiter.record(entry, "task", 1.0, 0)
+    
+    assert limiter.limit == 4
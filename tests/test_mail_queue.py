@@ -0,0 +1,130 @@
+"""
+메일 큐 상태 전이 (발송, 재시도, dead-letter, 수신 여부 불명)
+"""
+import os
+import smtplib
+
+import pytest
+
+from src.services import mail_queue as mail_queue_module
+from src.services.mail_queue import (
+    STATUS_DEAD,
+    STATUS_PENDING,
+    STATUS_SENT,
+    STATUS_UNKNOWN,
+    MailQueue,
+    is_transient_error,
+)
+from src.services.smtp_pool import SMTPDeliveryUnknown
+
+
+@pytest.fixture
+def queue(tmp_path) -> MailQueue:
+    return MailQueue(spool_dir=str(tmp_path), workers=1, max_attempts=3, base_delay=60, max_delay=600)
+
+
+def _enqueue(queue: MailQueue, quote_id: str = "20260101_000000_abcd1234") -> str:
+    return queue.enqueue(quote_id, "client@example.com", "홍길동", "/tmp/quote.pdf", "견적서", "본문")
+
+
+def _deliver_with(queue: MailQueue, monkeypatch: pytest.MonkeyPatch, error=None) -> None:
+    """발송 시각이 된 메시지 하나를 가져와 send_email 결과(error)로 처리"""
+    def send_email(**kwargs):
+        if error is not None:
+            raise error
+    
+    monkeypatch.setattr(mail_queue_module, "send_email", send_email)
+    filename = queue._claim()
+    assert filename is not None
+    queue._deliver(filename)
+
+
+def _statuses(queue: MailQueue, quote_id: str = "20260101_000000_abcd1234"):
+    return [(m["status"], m["attempts"]) for m in queue.status(quote_id)]
+
+
+def test_success_moves_to_sent(queue: MailQueue, monkeypatch: pytest.MonkeyPatch) -> None:
+    _enqueue(queue)
+    assert _statuses(queue) == [(STATUS_PENDING, 0)]
+    
+    _deliver_with(queue, monkeypatch)
+    
+    assert _statuses(queue) == [(STATUS_SENT, 1)]
+    assert queue.depth() == 0
+
+
+def test_transient_error_is_retried_later(queue: MailQueue, monkeypatch: pytest.MonkeyPatch) -> None:
+    _enqueue(queue)
+    
+    _deliver_with(queue, monkeypatch, smtplib.SMTPResponseException(421, b"try again later"))
+    
+    assert _statuses(queue) == [(STATUS_PENDING, 1)]
+    # 백오프 동안은 가져가지 않음
+    assert queue._claim() is None
+    message = queue.status("20260101_000000_abcd1234")[0]
+    assert "421" in message["last_error"]
+
+
+def test_transient_error_dead_letters_after_max_attempts(queue: MailQueue, monkeypatch: pytest.MonkeyPatch) -> None:
+    _enqueue(queue)
+    
+    for attempt in range(queue.max_attempts):
+        _deliver_with(queue, monkeypatch, ConnectionResetError("reset"))
+        if attempt < queue.max_attempts - 1:
+            # 다음 시도 시각을 지금으로 당김
+            pending = queue._dir(STATUS_PENDING)
+            (name,) = os.listdir(pending)
+            _, quote_id, message_id = queue._parse_filename(name)
+            os.replace(os.path.join(pending, name), queue._path(STATUS_PENDING, queue._filename(0, quote_id, message_id)))
+    
+    assert _statuses(queue) == [(STATUS_DEAD, queue.max_attempts)]
+
+
+@pytest.mark.parametrize("error", [
+    smtplib.SMTPRecipientsRefused({"client@example.com": (550, b"no such user")}),
+    smtplib.SMTPAuthenticationError(535, b"bad credentials"),
+    FileNotFoundError("/tmp/quote.pdf"),
+    ValueError("SENDER_EMAIL not configured"),
+])
+def test_permanent_error_dead_letters_on_first_attempt(
+    queue: MailQueue,
+    monkeypatch: pytest.MonkeyPatch,
+    error: Exception
+) -> None:
+    _enqueue(queue)
+    
+    _deliver_with(queue, monkeypatch, error)
+    
+    assert _statuses(queue) == [(STATUS_DEAD, 1)]
+
+
+def test_delivery_unknown_is_not_retried(queue: MailQueue, monkeypatch: pytest.MonkeyPatch) -> None:
+    _enqueue(queue)
+    
+    _deliver_with(queue, monkeypatch, SMTPDeliveryUnknown("connection lost after DATA"))
+    
+    assert _statuses(queue) == [(STATUS_UNKNOWN, 1)]
+    assert queue.depth() == 0
+    assert queue._claim() is None
+
+
+def test_status_only_returns_requested_quote(queue: MailQueue) -> None:
+    _enqueue(queue, "quote_a")
+    _enqueue(queue, "quote_b")
+    
+    assert [m["status"] for m in queue.status("quote_a")] == [STATUS_PENDING]
+    assert queue.status("quote_c") == []
+
+
+@pytest.mark.parametrize("error, transient", [
+    (smtplib.SMTPServerDisconnected("closed"), True),
+    (smtplib.SMTPResponseException(451, b"local error"), True),
+    (smtplib.SMTPResponseException(554, b"rejected"), False),
+    (smtplib.SMTPRecipientsRefused({"a@example.com": (450, b"busy"), "b@example.com": (550, b"unknown")}), False),
+    (smtplib.SMTPRecipientsRefused({"a@example.com": (450, b"busy")}), True),
+    (TimeoutError("timed out"), True),
+    (PermissionError("denied"), False),
+    (RuntimeError("bug"), False),
+])
+def test_is_transient_error(error: Exception, transient: bool) -> None:
+    assert is_transient_error(error) is transient
@@ -0,0 +1,85 @@
+"""
+POST /quote 처리 중 클라이언트 연결 종료 시 남은 단계 중단
+"""
+import asyncio
+import json
+import time
+
+import pytest
+
+from benchmarks.fakes import SAMPLE_QUOTE
+from src.api import routes
+from src.core.quote_model import Quote
+from src.utils.deadline import current_deadline
+from src.utils.metrics import QUOTE_CANCELLED
+
+REQUEST_BODY = json.dumps({
+    "client_name": "홍길동",
+    "client_email": "client@example.com",
+    "customer_request": "반응형 기업 홈페이지와 관리자 페이지를 만들고 싶습니다.",
+}).encode("utf-8")
+
+
+def _slow_generate_quote(client_name: str, customer_request: str) -> Quote:
+    """연결 종료로 처리 기한이 취소될 때까지 응답하지 않는 LLM 단계 대역"""
+    deadline = current_deadline.get()
+    waited_until = time.monotonic() + 5
+    while deadline.reason is None and time.monotonic() < waited_until:
+        time.sleep(0.01)
+    return Quote.coerce(SAMPLE_QUOTE)
+
+
+async def _post_quote_then_disconnect(app) -> dict:
+    """미들웨어를 포함한 앱을 ASGI로 직접 호출하고 요청 본문 이후 연결 종료 전달"""
+    body_sent = False
+    disconnected = asyncio.Event()
+    messages = []
+    
+    async def receive():
+        # 서버(uvicorn)처럼 연결이 끊기기 전에는 대기하고, 끊긴 뒤에는 바로 http.disconnect 반환
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            asyncio.get_running_loop().call_later(0.05, disconnected.set)
+            return {"type": "http.request", "body": REQUEST_BODY, "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+    
+    async def send(message):
+        messages.append(message)
+    
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/quote",
+        "raw_path": b"/quote",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"testserver"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(REQUEST_BODY)).encode("ascii")),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    await asyncio.wait_for(app(scope, receive, send), timeout=10)
+    body = b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+    return json.loads(body)
+
+
+def test_disconnect_cancels_remaining_stages(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app import app
+    
+    monkeypatch.setattr(routes, "generate_quote", _slow_generate_quote)
+    monkeypatch.setattr(routes, "DISCONNECT_POLL_INTERVAL", 0.02)
+    before = QUOTE_CANCELLED.value(stage="pdf", reason="disconnected")
+    
+    response = asyncio.run(_post_quote_then_disconnect(app))
+    
+    assert response["status"] == "error"
+    assert response["message"] == "클라이언트 연결 종료"
+    assert QUOTE_CANCELLED.value(stage="pdf", reason="disconnected") == before + 1
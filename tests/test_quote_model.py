@@ -0,0 +1,32 @@
+"""
+견적서 모델 숫자 필드 변환
+"""
+import pytest
+
+from src.core.quote_model import Pricing, _to_int
+
+
+@pytest.mark.parametrize("value, expected", [
+    (1500000, 1500000),
+    (1500000.7, 1500000),
+    ("1,500,000원", 1500000),
+    ("약 2.5", 2),
+    (None, 0),
+    ("", 0),
+    ("미정", 0),
+])
+def test_to_int(value, expected: int) -> None:
+    assert _to_int(value) == expected
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf"), "nan", "inf", "9" * 400])
+def test_to_int_returns_default_for_nan_and_infinity(value) -> None:
+    assert _to_int(value, default=-1) == -1
+
+
+def test_pricing_with_non_finite_amounts() -> None:
+    pricing = Pricing.from_dict({"subtotal": float("nan"), "vat": float("inf"), "total": "1,100,000"})
+    
+    assert pricing.subtotal == 0
+    assert pricing.vat == 0
+    assert pricing.total == 1100000
@@ -0,0 +1,112 @@
+"""
+우선순위 스케줄러 가중치 배분과 오래 기다린 요청 우선 처리
+"""
+import threading
+import time
+from typing import List
+
+from src.utils.scheduler import PRIORITY_BATCH, PRIORITY_INTERACTIVE, PriorityScheduler
+
+WEIGHTS = {PRIORITY_INTERACTIVE: 8.0, "revision": 4.0, PRIORITY_BATCH: 1.0}
+
+
+def _wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "조건이 충족되지 않았습니다."
+        time.sleep(0.001)
+
+
+class _Waiters:
+    """대기 요청을 순서대로 넣고, 자리를 넘겨받은 순서를 기록"""
+    
+    def __init__(self, scheduler: PriorityScheduler):
+        self.scheduler = scheduler
+        self.order: List[str] = []
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+    
+    def add(self, priority: str) -> None:
+        queued = self.scheduler.queued(priority)
+        
+        def run() -> None:
+            self.scheduler.acquire(priority)
+            with self._lock:
+                self.order.append(priority)
+        
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+        _wait_for(lambda: self.scheduler.queued(priority) == queued + 1)
+    
+    def drain(self) -> List[str]:
+        """실행 중인 자리를 하나씩 반납하며 모든 대기자에게 넘김"""
+        for granted in range(1, len(self._threads) + 1):
+            self.scheduler.release()
+            _wait_for(lambda: len(self.order) == granted)
+        for thread in self._threads:
+            thread.join(timeout=5)
+        return self.order
+
+
+def test_weighted_classes_share_slots() -> None:
+    scheduler = PriorityScheduler("test", 1, weights=WEIGHTS, max_wait=60)
+    scheduler.acquire(PRIORITY_BATCH)
+    waiters = _Waiters(scheduler)
+    for _ in range(8):
+        waiters.add(PRIORITY_BATCH)
+    for _ in range(8):
+        waiters.add(PRIORITY_INTERACTIVE)
+    
+    order = waiters.drain()
+    
+    # 먼저 대기한 batch 8건보다 interactive가 가중치(8:1)만큼 먼저 자리를 받음
+    assert order[:9].count(PRIORITY_INTERACTIVE) == 8
+    assert order[9:] == [PRIORITY_BATCH] * 7
+
+
+def test_long_waiting_request_is_not_starved() -> None:
+    scheduler = PriorityScheduler("test", 1, weights=WEIGHTS, max_wait=0.2)
+    scheduler.acquire(PRIORITY_INTERACTIVE)
+    waiters = _Waiters(scheduler)
+    waiters.add(PRIORITY_BATCH)
+    waiters.add(PRIORITY_BATCH)
+    time.sleep(0.3)
+    for _ in range(4):
+        waiters.add(PRIORITY_INTERACTIVE)
+    
+    order = waiters.drain()
+    
+    # max_wait를 넘긴 batch는 가중치와 관계없이 먼저 처리
+    assert order[:2] == [PRIORITY_BATCH, PRIORITY_BATCH]
+
+
+def test_without_starvation_batch_waits_behind_interactive() -> None:
+    scheduler = PriorityScheduler("test", 1, weights=WEIGHTS, max_wait=60)
+    scheduler.acquire(PRIORITY_INTERACTIVE)
+    waiters = _Waiters(scheduler)
+    waiters.add(PRIORITY_BATCH)
+    waiters.add(PRIORITY_BATCH)
+    for _ in range(4):
+        waiters.add(PRIORITY_INTERACTIVE)
+    
+    order = waiters.drain()
+    
+    assert order == [
+        PRIORITY_INTERACTIVE, PRIORITY_BATCH,
+        PRIORITY_INTERACTIVE, PRIORITY_INTERACTIVE, PRIORITY_INTERACTIVE,
+        PRIORITY_BATCH,
+    ]
+
+
+def test_set_capacity_grants_waiting_requests() -> None:
+    scheduler = PriorityScheduler("test", 1, weights=WEIGHTS, max_wait=60)
+    scheduler.acquire(PRIORITY_INTERACTIVE)
+    waiters = _Waiters(scheduler)
+    waiters.add(PRIORITY_BATCH)
+    waiters.add(PRIORITY_INTERACTIVE)
+    
+    scheduler.set_capacity(3)
+    
+    _wait_for(lambda: len(waiters.order) == 2)
+    assert scheduler.in_use == 3
@@ -0,0 +1,113 @@
+"""
+SMTP 스트리밍 전송(dot-stuffing)과 DATA 이후 연결 끊김 처리
+"""
+import smtplib
+from typing import List, Optional
+
+import pytest
+
+from src.services.smtp_pool import SMTPConnectionPool, SMTPDeliveryUnknown, stream_data
+
+
+class FakeSMTP:
+    """smtplib.SMTP 대역 (보낸 DATA 바이트 기록, 지정한 시점에 연결 끊김)"""
+    
+    def __init__(self, disconnect_on_send: Optional[int] = None, disconnect_on_mail: bool = False):
+        self.disconnect_on_send = disconnect_on_send
+        self.disconnect_on_mail = disconnect_on_mail
+        self.sent: List[bytes] = []
+        self.rset_calls = 0
+    
+    def ehlo_or_helo_if_needed(self) -> None:
+        pass
+    
+    def mail(self, from_addr: str):
+        if self.disconnect_on_mail:
+            raise smtplib.SMTPServerDisconnected("idle connection closed")
+        return 250, b"OK"
+    
+    def rcpt(self, addr: str):
+        return 250, b"OK"
+    
+    def docmd(self, cmd: str):
+        return 354, b"go ahead"
+    
+    def send(self, data: bytes) -> None:
+        if self.disconnect_on_send is not None and len(self.sent) >= self.disconnect_on_send:
+            raise smtplib.SMTPServerDisconnected("connection lost")
+        self.sent.append(data)
+    
+    def getreply(self):
+        return 250, b"queued"
+    
+    def rset(self) -> None:
+        self.rset_calls += 1
+    
+    def noop(self):
+        return 250, b"OK"
+    
+    def quit(self) -> None:
+        pass
+    
+    def close(self) -> None:
+        pass
+
+
+def test_stream_data_dot_stuffs_each_chunk() -> None:
+    server = FakeSMTP()
+    chunks = [b"Subject: hi\r\n\r\n.leading dot\r\n", b"..two dots\r\nplain\r\n.\r\n"]
+    
+    refused = stream_data(server, "from@example.com", ["to@example.com"], chunks)
+    
+    assert refused == {}
+    assert b"".join(server.sent) == (
+        b"Subject: hi\r\n\r\n..leading dot\r\n...two dots\r\nplain\r\n..\r\n.\r\n"
+    )
+
+
+def test_stream_data_disconnect_after_data_is_unknown() -> None:
+    server = FakeSMTP(disconnect_on_send=1)
+    
+    with pytest.raises(SMTPDeliveryUnknown):
+        stream_data(server, "from@example.com", ["to@example.com"], [b"line one\r\n", b"line two\r\n"])
+
+
+def _pool_with(servers: List[FakeSMTP]) -> SMTPConnectionPool:
+    """연결할 때마다 servers에서 하나씩 꺼내 주는 풀"""
+    pool = SMTPConnectionPool("localhost", 25, size=1)
+    pool._connect = lambda: servers.pop(0)
+    return pool
+
+
+def test_send_stream_does_not_resend_after_data() -> None:
+    first, second = FakeSMTP(disconnect_on_send=0), FakeSMTP()
+    pool = _pool_with([first, second])
+    
+    with pytest.raises(SMTPDeliveryUnknown):
+        pool.send_stream("from@example.com", ["to@example.com"], lambda: [b"body\r\n"])
+    
+    assert second.sent == []
+
+
+def test_send_stream_retries_disconnect_before_data() -> None:
+    first, second = FakeSMTP(disconnect_on_mail=True), FakeSMTP()
+    pool = _pool_with([first, second])
+    
+    pool.send_stream("from@example.com", ["to@example.com"], lambda: [b"body\r\n"])
+    
+    assert b"".join(second.sent) == b"body\r\n.\r\n"
+
+
+def test_sendmail_normalises_line_endings_and_does_not_resend() -> None:
+    server = FakeSMTP()
+    pool = _pool_with([server])
+    
+    pool.sendmail("from@example.com", "to@example.com", "Subject: hi\n\n.dot\rend")
+    
+    assert b"".join(server.sent) == b"Subject: hi\r\n\r\n..dot\r\nend\r\n.\r\n"
+    
+    lost, spare = FakeSMTP(disconnect_on_send=0), FakeSMTP()
+    pool = _pool_with([lost, spare])
+    with pytest.raises(SMTPDeliveryUnknown):
+        pool.sendmail("from@example.com", ["to@example.com"], b"body\r\n")
+    assert spare.sent == []